@@ -1,16 +1,47 @@
 """ADR Kit - A toolkit for managing Architectural Decision Records (ADRs) in MADR format."""
 
-import importlib.metadata
+from typing import TYPE_CHECKING, Any
 
 try:
-    __version__ = importlib.metadata.version("adr-kit")
-except importlib.metadata.PackageNotFoundError:
-    # Fallback for development/editable installs
-    __version__ = "0.0.0.dev"
-
-from .core.model import ADR, ADRFrontMatter
-from .core.parse import parse_adr_file, parse_front_matter
-from .core.validate import ValidationResult, validate_adr
+    # Static version file avoids reading distribution metadata on every start
+    from ._version import __version__
+except ImportError:
+    import importlib.metadata
+
+    try:
+        __version__ = importlib.metadata.version("adr-kit")
+    except importlib.metadata.PackageNotFoundError:
+        # Fallback for development/editable installs
+        __version__ = "0.0.0.dev"
+
+if TYPE_CHECKING:
+    from .core.model import ADR, ADRFrontMatter
+    from .core.parse import parse_adr_file, parse_front_matter
+    from .core.validate import ValidationResult, validate_adr
+
+# Public API is imported on first access so that `import adr_kit` (and the CLI
+# entry point) doesn't pay for pydantic and jsonschema up front
+_LAZY_EXPORTS = {
+    "ADR": ".core.model",
+    "ADRFrontMatter": ".core.model",
+    "parse_adr_file": ".core.parse",
+    "parse_front_matter": ".core.parse",
+    "validate_adr": ".core.validate",
+    "ValidationResult": ".core.validate",
+}
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    import importlib
+
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
 
 __all__ = [
     "ADR",
@@ -0,0 +1,55 @@
+"""Console entry point for adr-kit.
+
+Design decisions:
+- `adr-kit mcp-server` over stdio is the hot path agents spawn, so it starts the
+  server directly without building the Typer/Click app or loading Rich
+- Any other invocation (including --http and --help) goes to the Typer app in cli.py
+- Stdout belongs to the MCP protocol on the fast path; errors go to stderr
+"""
+
+import sys
+
+_STDIO_SERVER_COMMANDS = frozenset({"mcp-server", "mcp_server"})
+
+
+def _is_stdio_server(argv: list[str]) -> bool:
+    """Check whether argv asks for the stdio MCP server and nothing else."""
+    return (
+        len(argv) >= 2
+        and argv[1] in _STDIO_SERVER_COMMANDS
+        and all(arg == "--stdio" for arg in argv[2:])
+    )
+
+
+def _run_stdio_server() -> None:
+    """Start the stdio MCP server, mirroring `adr-kit mcp-server` error handling."""
+    from ._update_check import check_for_updates_async
+
+    check_for_updates_async()
+
+    try:
+        from .mcp.server import run_stdio_server
+    except ImportError as e:
+        print(f"❌ MCP server dependencies not available: {e}", file=sys.stderr)
+        print("💡 Install with: pip install fastmcp", file=sys.stderr)
+        sys.exit(1)
+
+    try:
+        run_stdio_server()
+    except KeyboardInterrupt:
+        sys.exit(0)
+
+
+def main() -> None:
+    """Run adr-kit, dispatching straight to the stdio server when requested."""
+    if _is_stdio_server(sys.argv):
+        _run_stdio_server()
+        return
+
+    from .cli import app
+
+    app()
+
+
+if __name__ == "__main__":
+    main()
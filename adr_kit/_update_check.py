@@ -0,0 +1,73 @@
+"""Background check for newer adr-kit releases on PyPI.
+
+Design decisions:
+- Kept out of cli.py so the stdio MCP fast path can start the check without
+  importing Typer
+- Rich is only imported when there is an update to announce
+"""
+
+import threading
+
+
+def _notify_update(current_version: str, latest_version: str) -> None:
+    """Print the update notice to stderr."""
+    from rich.console import Console
+
+    stderr_console = Console(stderr=True)
+    stderr_console.print(
+        f"🔄 [yellow]Update available:[/yellow] v{current_version} → v{latest_version}"
+    )
+    stderr_console.print("💡 [dim]Run 'uv tool upgrade adr-kit' to upgrade[/dim]")
+
+
+def check_for_updates_async() -> threading.Thread:
+    """Check for updates in the background and show notification if available.
+
+    Returns the background thread so callers can join it if needed.
+    """
+
+    def _check() -> None:
+        try:
+            import importlib.metadata
+
+            import requests
+
+            # Get current version directly from package metadata for accuracy
+            try:
+                current_version = importlib.metadata.version("adr-kit")
+            except importlib.metadata.PackageNotFoundError:
+                # Fallback to __version__ if not installed properly
+                from . import __version__
+
+                current_version = __version__
+
+            # Get latest version from PyPI
+            response = requests.get("https://pypi.org/pypi/adr-kit/json", timeout=5)
+            response.raise_for_status()
+
+            latest_version = response.json()["info"]["version"]
+
+            # Use semantic version comparison instead of string equality
+            if current_version != latest_version:
+                try:
+                    from packaging.version import parse
+
+                    current_ver = parse(current_version)
+                    latest_ver = parse(latest_version)
+
+                    # Only show update if latest is actually newer
+                    if current_ver < latest_ver:
+                        _notify_update(current_version, latest_version)
+                except Exception:
+                    # Fallback to string comparison if packaging not available
+                    if current_version != latest_version:
+                        _notify_update(current_version, latest_version)
+
+        except Exception:
+            # Silently ignore update check failures
+            pass
+
+    # Run in background thread to avoid blocking
+    thread = threading.Thread(target=_check, daemon=True)
+    thread.start()
+    return thread
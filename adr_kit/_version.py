@@ -0,0 +1,3 @@
+"""Package version, read by setuptools at build time and by adr_kit at import."""
+
+__version__ = "0.2.7"
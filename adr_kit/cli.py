@@ -2,114 +2,89 @@
 
 Design decisions:
 - Use Typer for modern CLI with automatic help generation
-- Use Rich for colored output and better formatting
+- Use Rich for colored output and better formatting, imported on first print
 - Provide all CLI commands specified in 04_CLI_SPEC.md
 - Exit codes match specification (0=success, 1=validation, 2=schema, 3=IO)
 """
 
+import os
+import re
 import sys
-import threading
+from functools import partial
 from pathlib import Path
-from typing import Annotated
+from typing import TYPE_CHECKING, Annotated, Any
 
 import typer
-from rich.console import Console
 
-from .core.parse import ParseError, find_adr_files, parse_adr_file
-from .core.validate import validate_adr_directory, validate_adr_file
-from .index.json_index import generate_adr_index
-from .index.sqlite_index import generate_sqlite_index
+from ._update_check import check_for_updates_async
+
+if TYPE_CHECKING:
+    from rich.console import Console
 
 app = typer.Typer(
     name="adr-kit",
     help="A toolkit for managing Architectural Decision Records (ADRs) in MADR format. Most functionality is available via MCP server for AI agents.",
     add_completion=False,
 )
-console = Console()
-stderr_console = Console(stderr=True)
 
 
-def check_for_updates_async() -> threading.Thread:
-    """Check for updates in the background and show notification if available.
+class _LazyConsole:
+    """Rich console that is only imported and built on first print.
 
-    Returns the background thread so callers can join it if needed.
+    Keeps rich (and pygments/markdown-it behind it) off the import path for
+    commands that never print, such as the stdio MCP server.
     """
 
-    def _check() -> None:
-        try:
-            import importlib.metadata
-
-            import requests
+    def __init__(self, stderr: bool = False):
+        self._stderr = stderr
+        self._console: Console | None = None
 
-            # Get current version directly from package metadata for accuracy
-            try:
-                current_version = importlib.metadata.version("adr-kit")
-            except importlib.metadata.PackageNotFoundError:
-                # Fallback to __version__ if not installed properly
-                from . import __version__
+    def print(self, *objects: Any, **kwargs: Any) -> None:
+        if self._console is None:
+            from rich.console import Console
 
-                current_version = __version__
+            self._console = Console(stderr=self._stderr)
+        self._console.print(*objects, **kwargs)
 
-            # Get latest version from PyPI
-            response = requests.get("https://pypi.org/pypi/adr-kit/json", timeout=5)
-            response.raise_for_status()
 
-            latest_version = response.json()["info"]["version"]
+console = _LazyConsole()
+stderr_console = _LazyConsole(stderr=True)
 
-            # Use semantic version comparison instead of string equality
-            if current_version != latest_version:
-                try:
-                    from packaging.version import parse
-
-                    current_ver = parse(current_version)
-                    latest_ver = parse(latest_version)
-
-                    # Only show update if latest is actually newer
-                    if current_ver < latest_ver:
-                        stderr_console.print(
-                            f"🔄 [yellow]Update available:[/yellow] v{current_version} → v{latest_version}"
-                        )
-                        stderr_console.print(
-                            "💡 [dim]Run 'uv tool upgrade adr-kit' to upgrade[/dim]"
-                        )
-                except Exception:
-                    # Fallback to string comparison if packaging not available
-                    if current_version != latest_version:
-                        stderr_console.print(
-                            f"🔄 [yellow]Update available:[/yellow] v{current_version} → v{latest_version}"
-                        )
-                        stderr_console.print(
-                            "💡 [dim]Run 'uv tool upgrade adr-kit' to upgrade[/dim]"
-                        )
-
-        except Exception:
-            # Silently ignore update check failures
-            pass
 
-    # Run in background thread to avoid blocking
-    thread = threading.Thread(target=_check, daemon=True)
-    thread.start()
-    return thread
+def get_next_adr_id(adr_dir: Path = Path("docs/adr")) -> str:
+    """Get the next available ADR ID.
 
+    IDs are read from filenames (ADR-NNNN-*.md) so no file has to be opened.
+    Files are only parsed for legacy layouts where no filename carries an ID.
+    """
+    from .core.parse import (
+        ADR_FILENAME_PATTERN,
+        ADR_ID_PATTERN,
+        ParseError,
+        find_adr_files,
+        parse_adr_file,
+    )
 
-def get_next_adr_id(adr_dir: Path = Path("docs/adr")) -> str:
-    """Get the next available ADR ID."""
     if not adr_dir.exists():
         return "ADR-0001"
 
-    adr_files = find_adr_files(adr_dir)
-    if not adr_files:
-        return "ADR-0001"
-
-    # Extract numbers from existing ADR files
     max_num = 0
-    for file_path in adr_files:
+    with os.scandir(adr_dir) as entries:
+        for entry in entries:
+            match = ADR_FILENAME_PATTERN.match(entry.name)
+            if match and entry.is_file():
+                max_num = max(max_num, int(match.group(1)))
+
+    if max_num:
+        return f"ADR-{max_num + 1:04d}"
+
+    # Legacy layout: fall back to reading IDs from front-matter
+    for file_path in find_adr_files(adr_dir):
         try:
             adr = parse_adr_file(file_path, strict=False)
-            if adr and adr.front_matter.id.startswith("ADR-"):
-                num_str = adr.front_matter.id[4:]  # Remove "ADR-" prefix
-                if num_str.isdigit():
-                    max_num = max(max_num, int(num_str))
+            id_match = ADR_ID_PATTERN.match(adr.front_matter.id)
+            if id_match:
+                max_num = max(max_num, int(id_match.group(1)))
         except ParseError:
             continue
 
@@ -143,6 +118,8 @@ def init(
 
         # Generate initial index files
         try:
+            from .index.json_index import generate_adr_index
+
             generate_adr_index(adr_dir, adr_dir / "adr-index.json")
             console.print(f"   📄 {adr_dir / 'adr-index.json'} (JSON index)")
         except Exception as e:
@@ -193,6 +170,25 @@ def init(
         raise typer.Exit(code=3) from e
 
 
+def _check_modules(modules: list[str], deep: bool) -> None:
+    """Check that modules are available without paying for their imports.
+
+    Only locates each module unless deep is set, in which case it is imported
+    so errors raised at import time surface too.
+
+    Raises:
+        ImportError: If a module can't be found (or imported when deep)
+    """
+    import importlib
+    import importlib.util
+
+    for name in modules:
+        if deep:
+            importlib.import_module(name)
+        elif importlib.util.find_spec(name) is None:
+            raise ImportError(f"No module named '{name}'")
+
+
 @app.command()
 def mcp_server(
     stdio: bool = typer.Option(
@@ -219,8 +215,9 @@ def mcp_server(
 
             run_stdio_server()
         except ImportError as e:
-            stderr_console.print(f"❌ MCP server dependencies not available: {e}")
-            stderr_console.print("💡 Install with: pip install fastmcp")
+            # Plain stderr writes: stdout belongs to the MCP protocol
+            print(f"❌ MCP server dependencies not available: {e}", file=sys.stderr)
+            print("💡 Install with: pip install fastmcp", file=sys.stderr)
             raise typer.Exit(code=1) from e
         except KeyboardInterrupt:
             raise typer.Exit(code=0) from None
@@ -246,7 +243,13 @@ def mcp_server(
 
 
 @app.command()
-def mcp_health() -> None:
+def mcp_health(
+    deep: bool = typer.Option(
+        False,
+        "--deep",
+        help="Import the server and workflow modules instead of only locating them",
+    ),
+) -> None:
     """Check MCP server health and connectivity.
 
     Verifies that MCP server dependencies are available and tools are accessible.
@@ -268,22 +271,30 @@ def mcp_health() -> None:
 
     try:
         # Test FastMCP dependency
-        import fastmcp
+        _check_modules(["fastmcp"], deep)
+        try:
+            fastmcp_version = importlib.metadata.version("fastmcp")
+        except importlib.metadata.PackageNotFoundError:
+            fastmcp_version = "unknown"
 
-        console.print(f"✅ FastMCP dependency: OK (v{fastmcp.__version__})")
+        console.print(f"✅ FastMCP dependency: OK (v{fastmcp_version})")
 
         # Test main MCP server imports
-        from .mcp.models import MCPErrorResponse, MCPResponse  # noqa: F401
-        from .mcp.server import mcp  # noqa: F401
+        _check_modules(["adr_kit.mcp.models", "adr_kit.mcp.server"], deep)
 
         console.print("✅ MCP server: OK")
 
         # Test workflow system (the real business logic)
         try:
-            from .decision.workflows.analyze import AnalyzeProjectWorkflow  # noqa: F401
-            from .decision.workflows.approval import ApprovalWorkflow  # noqa: F401
-            from .decision.workflows.creation import CreationWorkflow  # noqa: F401
-            from .decision.workflows.preflight import PreflightWorkflow  # noqa: F401
+            _check_modules(
+                [
+                    "adr_kit.decision.workflows.analyze",
+                    "adr_kit.decision.workflows.approval",
+                    "adr_kit.decision.workflows.creation",
+                    "adr_kit.decision.workflows.preflight",
+                ],
+                deep,
+            )
 
             console.print("✅ Workflow backend system: OK")
             workflow_available = True
@@ -292,9 +303,14 @@ def mcp_health() -> None:
             workflow_available = False
 
         # Test core functionality
-        from .core.model import ADR, ADRFrontMatter, ADRStatus  # noqa: F401
-        from .core.parse import find_adr_files, parse_adr_file  # noqa: F401
-        from .core.policy_extractor import PolicyExtractor  # noqa: F401
+        _check_modules(
+            [
+                "adr_kit.core.model",
+                "adr_kit.core.parse",
+                "adr_kit.core.policy_extractor",
+            ],
+            deep,
+        )
 
         console.print("✅ Core ADR functionality: OK")
 
@@ -421,11 +437,12 @@ def update(
         # Check if uv is available and adr-kit is a uv tool
         uv_path = shutil.which("uv")
         if uv_path:
-            # Try uv tool upgrade (works for uv-managed installations)
+            # Try uv tool upgrade (works for uv-managed installations). Only
+            # the exit code is used, so discard the output instead of buffering
             result = subprocess.run(
-                ["uv", "tool", "upgrade", "adr-kit"],
-                capture_output=True,
-                text=True,
+                [uv_path, "tool", "upgrade", "adr-kit"],
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
             )
 
             if result.returncode == 0:
@@ -438,19 +455,17 @@ def update(
 
         # Fallback to pip (works for pip installations)
         # Use sys.executable to find python in the current environment
-        import sys
-
-        result = subprocess.run(
+        # Stream pip's output straight to the terminal instead of buffering it
+        pip_result = subprocess.run(
             [sys.executable, "-m", "pip", "install", "--upgrade", "adr-kit"],
-            capture_output=True,
-            text=True,
+            check=False,
         )
 
-        if result.returncode == 0:
+        if pip_result.returncode == 0:
             console.print(f"✅ Successfully updated to v{latest_version}")
             console.print("💡 Restart your MCP server to use the new version")
         else:
-            console.print(f"❌ Update failed: {result.stderr}")
+            console.print(f"❌ Update failed (pip exited with {pip_result.returncode})")
             console.print("💡 Try manually:")
             console.print("   - uv tool upgrade adr-kit")
             console.print("   - OR: pip install --upgrade adr-kit")
@@ -475,30 +490,44 @@ def validate(
     ),
 ) -> None:
     """Validate ADRs."""
+    from .core.parse import find_adr_by_id, index_adr_ids
+    from .core.validate import parse_and_validate_all, validate_adr_file
+    from .index.json_index import load_index_paths
+
+    # Scripted runs (stdout not a terminal) write plain text and skip Rich.
+    # Errors go to stderr; only per-file successes and the summary use stdout.
+    if sys.stdout.isatty():
+        echo, echo_error = console.print, stderr_console.print
+    else:
+        echo, echo_error = print, partial(print, file=sys.stderr)
+
     try:
         if adr_id:
-            # Validate specific ADR
-            adr_files = find_adr_files(adr_dir)
-            target_file = None
+            # Validate specific ADR. Filenames usually carry the ID and a fresh
+            # JSON index covers renamed files; parse the directory only if both miss.
+            target_file = index_adr_ids(adr_dir).get(adr_id) or load_index_paths(
+                adr_dir / "adr-index.json", adr_dir
+            ).get(adr_id)
+            result = None
+            if target_file and target_file.is_file():
+                result = validate_adr_file(target_file)
+                if result.adr and result.adr.id != adr_id:
+                    result = None
+
+            if result is None:
+                target_adr = find_adr_by_id(adr_dir, adr_id)
+                if not target_adr or not target_adr.file_path:
+                    echo_error(f"❌ ADR with ID {adr_id} not found")
+                    raise typer.Exit(code=3)
+                result = validate_adr_file(target_adr.file_path)
 
-            for file_path in adr_files:
-                try:
-                    adr = parse_adr_file(file_path, strict=False)
-                    if adr and adr.front_matter.id == adr_id:
-                        target_file = file_path
-                        break
-                except ParseError:
-                    continue
-
-            if not target_file:
-                console.print(f"❌ ADR with ID {adr_id} not found")
-                raise typer.Exit(code=3)
-
-            result = validate_adr_file(target_file)
             results = [result]
         else:
-            # Validate all ADRs
-            results = validate_adr_directory(adr_dir)
+            # Validate all ADRs, in worker processes when there are many
+            results = [
+                result
+                for _, result in parse_and_validate_all(adr_dir, workers=os.cpu_count())
+            ]
 
         # Display results
         total_adrs = len(results)
@@ -510,27 +539,32 @@ def validate(
             for result in results:
                 if result.adr and result.adr.file_path:
                     file_name = result.adr.file_path.name
+                elif result.issues and result.issues[0].file_path:
+                    # Files that failed parsing or the schema have no ADR
+                    file_name = result.issues[0].file_path.name
                 else:
                     file_name = "Unknown file"
 
                 if result.is_valid:
-                    console.print(f"✅ {file_name}: Valid")
+                    report = echo
+                    report(f"✅ {file_name}: Valid")
                 else:
-                    console.print(f"❌ {file_name}: Invalid")
+                    report = echo_error
+                    report(f"❌ {file_name}: Invalid")
 
                 for issue in result.issues:
                     if issue.level == "error":
-                        console.print(f"   ❌ {issue.message}")
+                        report(f"   ❌ {issue.message}")
                     else:
-                        console.print(f"   ⚠️  {issue.message}")
+                        report(f"   ⚠️  {issue.message}")
 
         # Summary
-        console.print("\n" + "=" * 50)
-        console.print("📊 Validation Summary:")
-        console.print(f"   Total ADRs: {total_adrs}")
-        console.print(f"   Valid ADRs: {valid_adrs}")
-        console.print(f"   Errors: {total_errors}")
-        console.print(f"   Warnings: {total_warnings}")
+        echo("\n" + "=" * 50)
+        echo("📊 Validation Summary:")
+        echo(f"   Total ADRs: {total_adrs}")
+        echo(f"   Valid ADRs: {valid_adrs}")
+        echo(f"   Errors: {total_errors}")
+        echo(f"   Warnings: {total_warnings}")
 
         if total_errors > 0:
             raise typer.Exit(code=1)  # Validation errors
@@ -540,7 +574,7 @@ def validate(
     except typer.Exit:
         raise
     except Exception as e:
-        console.print(f"❌ Validation failed: {e}")
+        echo_error(f"❌ Validation failed: {e}")
         raise typer.Exit(code=3) from e
 
 
@@ -558,12 +592,24 @@ def index(
     ),
 ) -> None:
     """Generate ADR index files."""
+    from .core.validate import parse_and_validate_all
+    from .index.json_index import generate_adr_index
+    from .index.sqlite_index import generate_sqlite_index
+
     try:
         validate_adrs = not no_validate
+        # Validate once and share the results between the JSON and SQLite indexes
+        validated = (
+            parse_and_validate_all(adr_dir, workers=os.cpu_count())
+            if validate_adrs
+            else None
+        )
 
         # Generate JSON index
         console.print("📝 Generating JSON index...")
-        json_index = generate_adr_index(adr_dir, out, validate=validate_adrs)
+        json_index = generate_adr_index(
+            adr_dir, out, validate=validate_adrs, validated=validated
+        )
 
         console.print(f"✅ JSON index generated: {out}")
         console.print(f"   📊 Total ADRs: {json_index.metadata['total_adrs']}")
@@ -576,7 +622,7 @@ def index(
         if sqlite:
             console.print("🗄️  Generating SQLite index...")
             sqlite_stats = generate_sqlite_index(
-                adr_dir, sqlite, validate=validate_adrs
+                adr_dir, sqlite, validate=validate_adrs, validated=validated
             )
 
             console.print(f"✅ SQLite index generated: {sqlite}")
@@ -595,56 +641,59 @@ def index(
         raise typer.Exit(code=3) from e
 
 
+# Static text for `info`, printed in one call instead of one per line
+_INFO_TEXT = """
+🤖 [bold]ADR Kit - AI-First Architecture Decision Records[/bold]
+
+ADR Kit is designed for AI agents like Claude Code to autonomously manage
+Architectural Decision Records with rich contextual understanding.
+
+📡 [bold]MCP Server Tools Available:[/bold]
+  • [cyan]adr_init()[/cyan] - Initialize ADR system in repository
+  • [cyan]adr_query_related()[/cyan] - Find related ADRs before making decisions
+  • [cyan]adr_create()[/cyan] - Create new ADRs with structured policies
+  • [cyan]adr_approve()[/cyan] - Approve proposed ADRs and handle relationships
+  • [cyan]adr_validate()[/cyan] - Validate ADRs with policy requirements
+  • [cyan]adr_index()[/cyan] - Generate comprehensive ADR index
+  • [cyan]adr_supersede()[/cyan] - Replace existing decisions
+  • [cyan]adr_export_lint_config()[/cyan] - Generate enforcement rules from policies
+  • [cyan]adr_render_site()[/cyan] - Create static ADR documentation site
+
+🚀 [bold]Quick Start:[/bold]
+   1. [cyan]adr-kit mcp-health[/cyan]     # Check server health
+   2. [cyan]adr-kit mcp-server[/cyan]     # Start stdio server
+   3. Configure Cursor/Claude Code to connect
+
+🔌 [bold]Cursor Integration:[/bold]
+   Add to your MCP settings.json:
+   "adr-kit": {
+     "command": "adr-kit",
+     "args": ["mcp-server"],
+     "env": {}
+   }
+
+💡 [bold]Features:[/bold]
+   ✅ Structured policy extraction (hybrid approach)
+   ✅ Automatic lint rule generation (ESLint, Ruff)
+   ✅ Enhanced validation with policy requirements
+   ✅ Log4brains integration for site generation
+   ✅ AI-first contextual tool descriptions
+
+📚 [bold]Learn more:[/bold] https://github.com/kschlt/adr-kit
+"""
+_MARKUP_TAG_PATTERN = re.compile(r"\[/?[a-z]+\]")
+
+
 @app.command()
 def info() -> None:
     """Show ADR Kit information and MCP usage.
 
     Displays information about ADR Kit's AI-first approach and MCP integration.
     """
-    console.print("\n🤖 [bold]ADR Kit - AI-First Architecture Decision Records[/bold]")
-    console.print(
-        "\nADR Kit is designed for AI agents like Claude Code to autonomously manage"
-    )
-    console.print("Architectural Decision Records with rich contextual understanding.")
-
-    console.print("\n📡 [bold]MCP Server Tools Available:[/bold]")
-    tools = [
-        ("adr_init()", "Initialize ADR system in repository"),
-        ("adr_query_related()", "Find related ADRs before making decisions"),
-        ("adr_create()", "Create new ADRs with structured policies"),
-        ("adr_approve()", "Approve proposed ADRs and handle relationships"),
-        ("adr_validate()", "Validate ADRs with policy requirements"),
-        ("adr_index()", "Generate comprehensive ADR index"),
-        ("adr_supersede()", "Replace existing decisions"),
-        ("adr_export_lint_config()", "Generate enforcement rules from policies"),
-        ("adr_render_site()", "Create static ADR documentation site"),
-    ]
-
-    for tool, desc in tools:
-        console.print(f"  • [cyan]{tool}[/cyan] - {desc}")
-
-    console.print("\n🚀 [bold]Quick Start:[/bold]")
-    console.print("   1. [cyan]adr-kit mcp-health[/cyan]     # Check server health")
-    console.print("   2. [cyan]adr-kit mcp-server[/cyan]     # Start stdio server")
-    console.print("   3. Configure Cursor/Claude Code to connect")
-
-    console.print("\n🔌 [bold]Cursor Integration:[/bold]")
-    console.print("   Add to your MCP settings.json:")
-    console.print('   "adr-kit": {')
-    console.print('     "command": "adr-kit",')
-    console.print('     "args": ["mcp-server"],')
-    console.print('     "env": {}')
-    console.print("   }")
-
-    console.print("\n💡 [bold]Features:[/bold]")
-    console.print("   ✅ Structured policy extraction (hybrid approach)")
-    console.print("   ✅ Automatic lint rule generation (ESLint, Ruff)")
-    console.print("   ✅ Enhanced validation with policy requirements")
-    console.print("   ✅ Log4brains integration for site generation")
-    console.print("   ✅ AI-first contextual tool descriptions")
-
-    console.print("\n📚 [bold]Learn more:[/bold] https://github.com/kschlt/adr-kit")
-    console.print()
+    if sys.stdout.isatty():
+        console.print(_INFO_TEXT)
+    else:
+        print(_MARKUP_TAG_PATTERN.sub("", _INFO_TEXT))
 
 
 # Keep only essential manual commands
@@ -675,15 +724,24 @@ def _setup_enforcement_hooks() -> None:
     )
 
 
+def _write_json_config(path: Path, config: dict[str, Any]) -> None:
+    """Write a pretty-printed JSON config file, using orjson when installed."""
+    try:
+        import orjson
+    except ImportError:
+        import json
+
+        path.write_text(json.dumps(config, indent=2), encoding="utf-8")
+        return
+
+    path.write_bytes(orjson.dumps(config, option=orjson.OPT_INDENT_2))
+
+
 def _setup_cursor_impl() -> None:
     """Implementation for Cursor setup that can be called from commands or init."""
-    import json
-    from pathlib import Path
-
     console.print("🎯 Setting up ADR Kit for Cursor IDE")
 
     # Detect the correct adr-kit command path
-    import os
     import shutil
 
     adr_kit_command = shutil.which("adr-kit")
@@ -712,8 +770,7 @@ def _setup_cursor_impl() -> None:
     }
 
     cursor_config_file = cursor_dir / "mcp.json"
-    with open(cursor_config_file, "w") as f:
-        json.dump(cursor_config, f, indent=2)
+    _write_json_config(cursor_config_file, cursor_config)
 
     console.print(f"✅ Created {cursor_config_file}")
 
@@ -810,12 +867,10 @@ def setup_cursor() -> None:
 def _setup_claude_impl() -> None:
     """Implementation for Claude Code setup that can be called from commands or init."""
     import json
-    from pathlib import Path
 
     console.print("🤖 Setting up ADR Kit for Claude Code")
 
     # Detect the correct adr-kit command path
-    import os
     import shutil
 
     adr_kit_command = shutil.which("adr-kit")
@@ -857,8 +912,7 @@ def _setup_claude_impl() -> None:
     else:
         existing_config.update(claude_config)
 
-    with open(claude_config_file, "w") as f:
-        json.dump(existing_config, f, indent=2)
+    _write_json_config(claude_config_file, existing_config)
 
     console.print(f"✅ Created {claude_config_file}")
 
@@ -1429,6 +1483,4 @@ def generate_ci(
 
 
 if __name__ == "__main__":
-    import sys
-
     app()
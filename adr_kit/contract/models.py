@@ -270,10 +270,14 @@ class ConstraintsContract(BaseModel):
         conflicts = []
 
         if policy.imports and self.constraints.imports:
+            # Hash the existing lists once so each check is a set lookup
+            existing_prefer = frozenset(self.constraints.imports.prefer or ())
+            existing_disallow = frozenset(self.constraints.imports.disallow or ())
+
             # Check for disallow conflicts (new disallow vs existing prefer)
-            if policy.imports.disallow and self.constraints.imports.prefer:
+            if policy.imports.disallow and existing_prefer:
                 for disallow_item in policy.imports.disallow:
-                    if disallow_item in self.constraints.imports.prefer:
+                    if disallow_item in existing_prefer:
                         source_adr = self._find_provenance_for_rule(
                             f"imports.prefer.{disallow_item}"
                         )
@@ -282,9 +286,9 @@ class ConstraintsContract(BaseModel):
                         )
 
             # Check for prefer conflicts (new prefer vs existing disallow)
-            if policy.imports.prefer and self.constraints.imports.disallow:
+            if policy.imports.prefer and existing_disallow:
                 for prefer_item in policy.imports.prefer:
-                    if prefer_item in self.constraints.imports.disallow:
+                    if prefer_item in existing_disallow:
                         source_adr = self._find_provenance_for_rule(
                             f"imports.disallow.{prefer_item}"
                         )
@@ -296,7 +300,5 @@ class ConstraintsContract(BaseModel):
 
     def _find_provenance_for_rule(self, rule_path: str) -> str:
         """Find which ADR contributed a specific rule."""
-        for path, prov in self.provenance.items():
-            if path == rule_path:
-                return prov.adr_id
-        return "unknown ADR"
+        prov = self.provenance.get(rule_path)
+        return prov.adr_id if prov else "unknown ADR"
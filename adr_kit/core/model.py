@@ -14,8 +14,12 @@ from functools import cached_property
 from pathlib import Path
 from typing import Any
 
+import yaml
 from pydantic import BaseModel, ConfigDict, Field, field_validator
 
+# libyaml-backed emitter when PyYAML is built with it; same output, much faster
+_YAML_DUMPER = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
+
 
 class ADRStatus(str, Enum):
     """Valid ADR status values according to MADR specification."""
@@ -493,13 +497,13 @@ class ADR(BaseModel):
 
     def to_markdown(self) -> str:
         """Convert ADR back to markdown format with YAML front-matter."""
-        import yaml
-
         # Convert front-matter to dict for YAML serialization
         fm_dict = self.front_matter.model_dump(exclude_none=True)
 
         # Format YAML front-matter
-        yaml_str = yaml.dump(fm_dict, default_flow_style=False, sort_keys=False)
+        yaml_str = yaml.dump(
+            fm_dict, Dumper=_YAML_DUMPER, default_flow_style=False, sort_keys=False
+        )
 
         return f"---\n{yaml_str}---\n\n{self.content}"
 
@@ -1,13 +1,18 @@
 """Parser for ADR Markdown files with YAML front-matter.
 
 Design decisions:
-- Use PyYAML for robust YAML parsing of front-matter
+- Use PyYAML for robust YAML parsing of front-matter (libyaml loader when built in)
+- Fast path for the flat key/value subset most ADRs use, falling back to PyYAML
 - Support both strict and lenient parsing modes
 - Provide clear error messages for malformed files
 - Extract both front-matter and content cleanly
 """
 
+import fnmatch
+import hashlib
+import os
 import re
+from datetime import date
 from pathlib import Path
 from typing import Any
 
@@ -15,6 +20,28 @@ import yaml
 from pydantic import ValidationError
 
 from .model import ADR, ADRFrontMatter
+from .parse_cache import get_parse_cache
+
+# Pattern to match YAML front-matter between --- delimiters
+FRONT_MATTER_PATTERN = re.compile(
+    r"^---\s*\n(.*?)\n---\s*\n(.*)", re.DOTALL | re.MULTILINE
+)
+
+# Fast-path front-matter grammar: top-level "key: value" and "- item" lines
+_FAST_KEY_PATTERN = re.compile(r"^([A-Za-z_][A-Za-z0-9_]*):(?:[ \t]+(.*))?$")
+_FAST_LIST_ITEM_PATTERN = re.compile(r"^[ \t]*-[ \t]+(.*)$")
+# Any indented line that is not a list item or comment, e.g. a policy block
+_FAST_NESTED_LINE_PATTERN = re.compile(r"^[ \t]+[^\s#-]", re.MULTILINE)
+_DATE_PATTERN = re.compile(r"^\d{4}-\d{2}-\d{2}$")
+_YAML_STR_TAG = "tag:yaml.org,2002:str"
+_YAML_TIMESTAMP_TAG = "tag:yaml.org,2002:timestamp"
+_yaml_resolver = yaml.resolver.Resolver()
+# libyaml-backed loader releases the GIL and is several times faster when present
+_YAML_SAFE_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+# Numeric ID embedded in canonical ADR filenames (ADR-0001.md, ADR-0001-slug.md)
+ADR_FILENAME_PATTERN = re.compile(r"^ADR-(\d{4})(?:-.*)?\.md$")
+ADR_ID_PATTERN = re.compile(r"^ADR-(\d{4})$")
 
 
 class ParseError(Exception):
@@ -30,14 +57,107 @@ class ParseError(Exception):
         return super().__str__()
 
 
+class _NotFastPath(Exception):
+    """Raised when front-matter needs the full YAML parser."""
+
+
+def _fast_parse_scalar(value: str) -> Any:
+    """Parse a plain or simply-quoted scalar the way PyYAML would.
+
+    Only strings and dates are handled; anything else needs full YAML.
+    """
+    if len(value) >= 2 and value[0] == value[-1] and value[0] in "\"'":
+        inner = value[1:-1]
+        if value[0] in inner or "\\" in inner:
+            raise _NotFastPath
+        return inner
+
+    if not value or value[0] in "[]{}&*!|>%@`#'\",?:-" or " #" in value:
+        raise _NotFastPath
+    # PyYAML rejects some tab uses (e.g. "x\t# comment"); let it decide
+    if "\t" in value:
+        raise _NotFastPath
+    if ": " in value or value.endswith(":"):
+        raise _NotFastPath
+
+    tag = _yaml_resolver.resolve(yaml.ScalarNode, value, (True, False))
+    if tag == _YAML_STR_TAG:
+        return value
+    if tag == _YAML_TIMESTAMP_TAG and _DATE_PATTERN.match(value):
+        return date.fromisoformat(value)
+    raise _NotFastPath
+
+
+def _fast_parse_flow_list(value: str) -> list[Any]:
+    """Parse a single-line flow sequence such as [a, "b", 'c']."""
+    inner = value[1:-1].strip()
+    if not inner:
+        return []
+    if any(char in inner for char in "[]{}"):
+        raise _NotFastPath
+    return [_fast_parse_scalar(item.strip()) for item in inner.split(",")]
+
+
+def _fast_parse_front_matter(text: str) -> dict[str, Any] | None:
+    """Parse the flat front-matter subset ADRs use without the YAML tokenizer.
+
+    Handles "key: value", "key: [a, b]" and "key:" followed by "- item"
+    lines. Returns None for anything else (nested maps, block scalars,
+    anchors, non-string scalars) so the caller falls back to PyYAML.
+    """
+    # Nested mappings always need PyYAML, so skip the line-by-line attempt
+    if _FAST_NESTED_LINE_PATTERN.search(text):
+        return None
+
+    result: dict[str, Any] = {}
+    list_key: str | None = None
+
+    try:
+        for line in text.split("\n"):
+            stripped = line.strip()
+            if not stripped or stripped.startswith("#"):
+                continue
+
+            item_match = _FAST_LIST_ITEM_PATTERN.match(line)
+            if item_match:
+                if list_key is None:
+                    return None
+                if result[list_key] is None:
+                    result[list_key] = []
+                result[list_key].append(_fast_parse_scalar(item_match.group(1).strip()))
+                continue
+
+            key_match = _FAST_KEY_PATTERN.match(line.rstrip())
+            if not key_match:
+                return None
+
+            key, value = key_match.group(1), (key_match.group(2) or "").strip()
+            if not value:
+                # Either an empty value or the start of a block list
+                result[key] = None
+                list_key = key
+            elif value.startswith("[") and value.endswith("]"):
+                result[key] = _fast_parse_flow_list(value)
+                list_key = None
+            else:
+                result[key] = _fast_parse_scalar(value)
+                list_key = None
+    except _NotFastPath:
+        return None
+
+    return result or None
+
+
 def parse_front_matter(
-    content: str, file_path: Path | str | None = None
+    content: str, file_path: Path | str | None = None, strict: bool = True
 ) -> tuple[dict[str, Any], str]:
     """Parse YAML front-matter from markdown content.
 
     Args:
         content: The full markdown content including front-matter
         file_path: Optional file path for error reporting
+        strict: If True, always use the full YAML parser. If False, try the
+            fast path for simple front-matter first
 
     Returns:
         Tuple of (front_matter_dict, remaining_content)
@@ -45,12 +165,7 @@ def parse_front_matter(
     Raises:
         ParseError: If front-matter is malformed or missing
     """
-    # Pattern to match YAML front-matter between --- delimiters
-    front_matter_pattern = re.compile(
-        r"^---\s*\n(.*?)\n---\s*\n(.*)", re.DOTALL | re.MULTILINE
-    )
-
-    match = front_matter_pattern.match(content)
+    match = FRONT_MATTER_PATTERN.match(content)
     if not match:
         raise ParseError(
             "No YAML front-matter found. ADR files must start with ---", file_path
@@ -58,8 +173,13 @@ def parse_front_matter(
 
     yaml_content, markdown_content = match.groups()
 
+    if not strict:
+        fast_front_matter = _fast_parse_front_matter(yaml_content)
+        if fast_front_matter is not None:
+            return fast_front_matter, markdown_content.strip()
+
     try:
-        front_matter = yaml.safe_load(yaml_content)
+        front_matter = yaml.load(yaml_content, Loader=_YAML_SAFE_LOADER)
         if front_matter is None:
             raise ParseError("Empty front-matter section", file_path)
         if not isinstance(front_matter, dict):
@@ -70,19 +190,23 @@ def parse_front_matter(
     return front_matter, markdown_content.strip()
 
 
-def parse_adr_file(file_path: Path | str, strict: bool = True) -> ADR:
-    """Parse an ADR markdown file into an ADR object.
+def parse_adr_source(
+    file_path: Path | str, strict: bool = True
+) -> tuple[dict[str, Any], str]:
+    """Read an ADR file into its raw front-matter mapping and markdown body.
+
+    Nothing is validated yet, so callers can check the front-matter as written
+    before building an ADR from it with build_adr().
 
     Args:
         file_path: Path to the ADR markdown file
-        strict: If True, perform full validation. If False, allow some validation errors
+        strict: If True, always use the full YAML parser
 
     Returns:
-        ADR object with parsed data
+        Tuple of (front_matter_dict, markdown_content)
 
     Raises:
-        ParseError: If file cannot be read or parsed
-        ValidationError: If ADR data doesn't match schema (when strict=True)
+        ParseError: If file cannot be read or its front-matter parsed
     """
     path_obj = Path(file_path)
 
@@ -99,10 +223,31 @@ def parse_adr_file(file_path: Path | str, strict: bool = True) -> ADR:
     except OSError as e:
         raise ParseError(f"Cannot read file: {e}", file_path) from e
 
-    try:
-        front_matter_dict, markdown_content = parse_front_matter(content, file_path)
+    return parse_front_matter(content, file_path, strict=strict)
+
 
-        # Create front-matter object
+def build_adr(
+    front_matter_dict: dict[str, Any],
+    markdown_content: str,
+    file_path: Path | str | None = None,
+    strict: bool = True,
+) -> ADR:
+    """Build an ADR from parsed front-matter and markdown content.
+
+    Args:
+        front_matter_dict: Raw front-matter mapping
+        markdown_content: Markdown body after the front-matter
+        file_path: Optional file path for the ADR and error reporting
+        strict: If True, perform full validation
+
+    Returns:
+        ADR object with parsed data
+
+    Raises:
+        ParseError: If ADR data doesn't match the model (when strict=True)
+        ValidationError: If ADR data doesn't match the model (when strict=False)
+    """
+    try:
         if strict:
             front_matter = ADRFrontMatter(**front_matter_dict)
         else:
@@ -111,11 +256,14 @@ def parse_adr_file(file_path: Path | str, strict: bool = True) -> ADR:
             except ValidationError as e:
                 # In non-strict mode, log the validation error but continue
                 # This allows for partial ADR processing during development
-                print(f"Warning: Validation error in {file_path}: {e}")
+                location = f" in {file_path}" if file_path else ""
+                print(f"Warning: Validation error{location}: {e}")
                 front_matter = ADRFrontMatter(**front_matter_dict)
 
         return ADR(
-            front_matter=front_matter, content=markdown_content, file_path=path_obj
+            front_matter=front_matter,
+            content=markdown_content,
+            file_path=Path(file_path) if file_path else None,
         )
 
     except ValidationError as e:
@@ -126,6 +274,39 @@ def parse_adr_file(file_path: Path | str, strict: bool = True) -> ADR:
             raise
 
 
+def parse_adr_file(file_path: Path | str, strict: bool = True) -> ADR:
+    """Parse an ADR markdown file into an ADR object.
+
+    Args:
+        file_path: Path to the ADR markdown file
+        strict: If True, perform full validation. If False, allow some validation errors
+
+    Returns:
+        ADR object with parsed data
+
+    Raises:
+        ParseError: If file cannot be read or parsed
+        ValidationError: If ADR data doesn't match schema (when strict=True)
+    """
+    path_obj = Path(file_path)
+
+    # Unchanged files are served from the opt-in parse cache; strict callers
+    # only accept entries that came from a strict parse
+    parse_cache = get_parse_cache()
+    if parse_cache is not None:
+        cached_adr = parse_cache.get(path_obj, strict=strict)
+        if cached_adr is not None:
+            return cached_adr
+
+    front_matter_dict, markdown_content = parse_adr_source(file_path, strict=strict)
+    adr = build_adr(front_matter_dict, markdown_content, path_obj, strict=strict)
+
+    if parse_cache is not None:
+        parse_cache.put(path_obj, adr, front_matter_dict, strict=strict)
+
+    return adr
+
+
 def parse_adr_content(
     content: str, file_path: Path | str | None = None, strict: bool = True
 ) -> ADR:
@@ -143,29 +324,10 @@ def parse_adr_content(
         ParseError: If content cannot be parsed
         ValidationError: If ADR data doesn't match schema (when strict=True)
     """
-    try:
-        front_matter_dict, markdown_content = parse_front_matter(content, file_path)
-
-        if strict:
-            front_matter = ADRFrontMatter(**front_matter_dict)
-        else:
-            try:
-                front_matter = ADRFrontMatter(**front_matter_dict)
-            except ValidationError as e:
-                print(f"Warning: Validation error: {e}")
-                front_matter = ADRFrontMatter(**front_matter_dict)
-
-        return ADR(
-            front_matter=front_matter,
-            content=markdown_content,
-            file_path=Path(file_path) if file_path else None,
-        )
-
-    except ValidationError as e:
-        if strict:
-            raise ParseError(f"ADR validation failed: {e}", file_path) from e
-        else:
-            raise
+    front_matter_dict, markdown_content = parse_front_matter(
+        content, file_path, strict=strict
+    )
+    return build_adr(front_matter_dict, markdown_content, file_path, strict=strict)
 
 
 def find_adr_files(
@@ -184,4 +346,135 @@ def find_adr_files(
     if not dir_path.exists():
         return []
 
-    return sorted(dir_path.glob(pattern))
+    # Recursive or nested patterns need the full glob machinery
+    if "/" in pattern or "**" in pattern:
+        return sorted(dir_path.glob(pattern))
+
+    # A single scandir pass reuses the directory entry's cached type and
+    # only builds Path objects for the files that actually match
+    try:
+        with os.scandir(dir_path) as entries:
+            names = [
+                entry.name
+                for entry in entries
+                if fnmatch.fnmatchcase(entry.name, pattern)
+                and not (entry.name.startswith(".") and not pattern.startswith("."))
+                and entry.is_file()
+            ]
+    except NotADirectoryError:
+        return []
+
+    return [dir_path / name for name in sorted(names)]
+
+
+def adr_id_from_filename(file_path: Path | str) -> str | None:
+    """Derive the ADR ID from a filename without reading the file.
+
+    Args:
+        file_path: Path (or bare name) of an ADR file
+
+    Returns:
+        ADR ID such as "ADR-0001", or None if the name doesn't follow the
+        ADR-NNNN-*.md convention
+    """
+    match = ADR_FILENAME_PATTERN.match(Path(file_path).name)
+    if not match:
+        return None
+    return f"ADR-{match.group(1)}"
+
+
+def index_adr_ids(directory: Path | str) -> dict[str, Path]:
+    """Map ADR IDs to files using filenames only, in a single directory pass.
+
+    Args:
+        directory: Directory containing ADR files
+
+    Returns:
+        Dictionary of ADR ID (e.g. "ADR-0001") to file path. Files that don't
+        follow the ADR-NNNN-*.md naming convention are not included, and the
+        front-matter ID is not checked.
+    """
+    dir_path = Path(directory)
+    id_map: dict[str, Path] = {}
+
+    try:
+        with os.scandir(dir_path) as entries:
+            for entry in entries:
+                match = ADR_FILENAME_PATTERN.match(entry.name)
+                if not (match and entry.is_file()):
+                    continue
+                adr_id = f"ADR-{match.group(1)}"
+                file_path = dir_path / entry.name
+                # Keep the first file in sorted order if an ID appears twice
+                if adr_id not in id_map or file_path < id_map[adr_id]:
+                    id_map[adr_id] = file_path
+    except (FileNotFoundError, NotADirectoryError):
+        return {}
+
+    return id_map
+
+
+def adr_directory_fingerprint(directory: Path | str) -> str:
+    """Fingerprint the ADR files in a directory from their stat metadata.
+
+    The fingerprint changes whenever an ADR file is added, removed, renamed or
+    rewritten, without reading any file contents.
+
+    Args:
+        directory: Directory containing ADR files
+
+    Returns:
+        Hex digest of the directory path and each file's name, mtime and size
+    """
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(os.fsencode(Path(directory).resolve()))
+
+    for file_path in find_adr_files(directory):
+        try:
+            stat = file_path.stat()
+        except OSError:
+            continue
+        digest.update(b"\0" + os.fsencode(file_path.name))
+        digest.update(stat.st_mtime_ns.to_bytes(8, "little", signed=True))
+        digest.update(stat.st_size.to_bytes(8, "little"))
+
+    return digest.hexdigest()
+
+
+def find_adr_by_id(
+    directory: Path | str, adr_id: str, strict: bool = False
+) -> ADR | None:
+    """Find and parse the ADR with the given ID.
+
+    Files whose name carries the requested ID are parsed first, so the usual
+    lookup reads a single file. The remaining files are only parsed if the
+    filename doesn't match the front-matter ID (e.g. renamed files).
+
+    Args:
+        directory: Directory containing ADR files
+        adr_id: The ADR ID to look for
+        strict: Passed through to parse_adr_file
+
+    Returns:
+        Parsed ADR if found, None otherwise
+    """
+    candidate = index_adr_ids(directory).get(adr_id)
+    if candidate is not None:
+        try:
+            adr = parse_adr_file(candidate, strict=strict)
+            if adr.id == adr_id:
+                return adr
+        except (ParseError, ValidationError):
+            pass
+
+    for file_path in find_adr_files(directory):
+        if file_path == candidate:
+            continue
+        try:
+            adr = parse_adr_file(file_path, strict=strict)
+        except (ParseError, ValidationError):
+            continue
+        if adr.id == adr_id:
+            return adr
+
+    return None
@@ -0,0 +1,220 @@
+"""Persistent cache of parsed ADR files.
+
+Design decisions:
+- Key entries by resolved file path, validated against (mtime_ns, size)
+- Store parsed ADR objects with pickle so warm runs skip YAML + model building
+- Keep the raw front-matter next to each ADR so validators can schema-check it
+- Record whether each entry came from a strict (full YAML) parse: the lenient
+  fast path accepts some input PyYAML rejects, so strict callers re-parse
+- Stamp the file with the adr-kit and pydantic versions: pickled ADRs are only
+  valid for the model (and parse rules) that built them, so a cache written by
+  another version is discarded before its entries are unpickled
+- Opt-in via ADR_KIT_PARSE_CACHE=1 to keep debugging runs deterministic
+- Keep the cache file in the per-user cache directory, never in the project:
+  it is unpickled on load, so a cache file shipped with a cloned repository
+  must not be trusted
+- Long-lived processes (the MCP server) can keep an in-memory cache instead,
+  so repeated tool calls only stat unchanged files
+- Never fail a parse because of the cache - a broken cache file is ignored
+"""
+
+import atexit
+import copy
+import hashlib
+import os
+import pickle
+from pathlib import Path
+from typing import Any
+
+import pydantic
+
+from .. import __version__
+from .model import ADR
+
+CACHE_ENV_VAR = "ADR_KIT_PARSE_CACHE"
+
+# Bump the format whenever CacheEntry changes shape
+_CACHE_FORMAT = 2
+_CACHE_VERSION = f"{_CACHE_FORMAT}:{__version__}:{pydantic.VERSION}"
+
+# (mtime_ns, size, ADR, raw front-matter, parsed strictly)
+CacheEntry = tuple[int, int, ADR, dict[str, Any], bool]
+
+
+def is_cache_enabled() -> bool:
+    """Check whether the parse cache has been enabled via environment."""
+    return os.environ.get(CACHE_ENV_VAR, "").lower() in {"1", "true", "yes"}
+
+
+def default_cache_path() -> Path:
+    """Get the per-user cache file for the project in the current directory.
+
+    Lives under $XDG_CACHE_HOME (default ~/.cache) and is keyed by the
+    resolved project path, so each project keeps its own cache.
+    """
+    cache_home = os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache"
+    project_key = hashlib.sha256(str(Path.cwd().resolve()).encode()).hexdigest()
+    return Path(cache_home) / "adr-kit" / f"parse-cache-{project_key[:16]}.pkl"
+
+
+def load_cache(cache_path: Path) -> dict[str, CacheEntry]:
+    """Load the parse cache from disk.
+
+    Returns an empty cache if the file is missing, unreadable or was written
+    by another adr-kit or pydantic version.
+    """
+    try:
+        with open(cache_path, "rb") as f:
+            # The version header is pickled on its own so stale ADRs never load
+            if pickle.load(f) != _CACHE_VERSION:
+                return {}
+            data = pickle.load(f)
+    except Exception:
+        return {}
+
+    return data if isinstance(data, dict) else {}
+
+
+def save_cache(cache: dict[str, CacheEntry], cache_path: Path) -> None:
+    """Save the parse cache to disk, dropping entries for deleted files."""
+    live_entries = {path: entry for path, entry in cache.items() if Path(path).exists()}
+
+    try:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = cache_path.with_suffix(".tmp")
+        with open(tmp_path, "wb") as f:
+            pickle.dump(_CACHE_VERSION, f, protocol=pickle.HIGHEST_PROTOCOL)
+            pickle.dump(live_entries, f, protocol=pickle.HIGHEST_PROTOCOL)
+        tmp_path.replace(cache_path)
+    except OSError:
+        pass  # Caching is best effort
+
+
+class ParseCache:
+    """In-memory view of the parse cache, flushed back to disk on save().
+
+    A cache_path of None keeps the cache in memory only.
+    """
+
+    def __init__(self, cache_path: Path | None):
+        self.cache_path = cache_path
+        self.entries = load_cache(cache_path) if cache_path is not None else {}
+        self.dirty = False
+
+    def get(self, file_path: Path, strict: bool = False) -> ADR | None:
+        """Return a copy of the cached ADR if the file is unchanged.
+
+        With strict=True, entries from a lenient parse count as misses.
+        """
+        parsed = self.get_with_front_matter(file_path, strict=strict)
+        return parsed[0] if parsed is not None else None
+
+    def get_with_front_matter(
+        self, file_path: Path, strict: bool = False
+    ) -> tuple[ADR, dict[str, Any]] | None:
+        """Return copies of the cached ADR and raw front-matter if unchanged."""
+        entry = self._fresh_entry(file_path, strict)
+        if entry is None:
+            return None
+
+        # Callers may mutate the ADR, so never hand out the cached instance
+        _, _, adr, front_matter, _ = entry
+        return adr.model_copy(deep=True), copy.deepcopy(front_matter)
+
+    def contains(self, file_path: Path, strict: bool = False) -> bool:
+        """Check whether the file is cached and unchanged, without copying it."""
+        return self._fresh_entry(file_path, strict) is not None
+
+    def _fresh_entry(self, file_path: Path, strict: bool) -> CacheEntry | None:
+        """Return the entry for the file if its mtime and size still match."""
+        try:
+            stat = file_path.stat()
+        except OSError:
+            return None
+
+        entry = self.entries.get(str(file_path.resolve()))
+        if entry is None:
+            return None
+
+        if entry[0] != stat.st_mtime_ns or entry[1] != stat.st_size:
+            return None
+        if strict and not entry[4]:
+            return None
+
+        return entry
+
+    def put(
+        self,
+        file_path: Path,
+        adr: ADR,
+        front_matter: dict[str, Any] | None = None,
+        strict: bool = False,
+    ) -> None:
+        """Store a freshly parsed ADR (and its raw front-matter) for the given file.
+
+        Pass strict=True only if the front-matter went through the full YAML
+        parser; otherwise strict callers will parse the file again.
+        """
+        try:
+            stat = file_path.stat()
+        except OSError:
+            return
+
+        if front_matter is None:
+            front_matter = adr.front_matter.model_dump(exclude_none=True)
+
+        self.entries[str(file_path.resolve())] = (
+            stat.st_mtime_ns,
+            stat.st_size,
+            adr.model_copy(deep=True),
+            copy.deepcopy(front_matter),
+            strict,
+        )
+        self.dirty = True
+
+    def save(self) -> None:
+        """Write the cache to disk if anything changed."""
+        if self.dirty and self.cache_path is not None:
+            save_cache(self.entries, self.cache_path)
+            self.dirty = False
+
+
+_parse_cache: ParseCache | None = None
+
+
+def get_parse_cache() -> ParseCache | None:
+    """Get the process-wide parse cache, or None if caching is disabled.
+
+    The cache is loaded on first use and saved when the process exits.
+    """
+    global _parse_cache
+
+    if _parse_cache is not None and _parse_cache.cache_path is None:
+        return _parse_cache
+
+    if not is_cache_enabled():
+        return None
+
+    if _parse_cache is None:
+        _parse_cache = ParseCache(default_cache_path())
+        atexit.register(_parse_cache.save)
+
+    return _parse_cache
+
+
+def enable_memory_cache() -> ParseCache:
+    """Keep parsed ADRs in memory for the rest of the process.
+
+    Meant for long-running processes such as the MCP server. Entries are
+    still validated against each file's mtime and size, so edits are picked
+    up without explicit invalidation. Nothing is written to disk.
+    """
+    global _parse_cache
+
+    # An enabled on-disk cache already serves unchanged files from memory
+    existing = get_parse_cache()
+    if existing is not None:
+        return existing
+
+    _parse_cache = ParseCache(cache_path=None)
+    return _parse_cache
@@ -5,23 +5,44 @@ Design decisions:
 - Implement semantic rules as separate validation functions
 - Provide detailed validation results with clear error messages
 - Support both individual ADR validation and batch validation
+- Compile each schema file once per process and share it across validators
+- With fastjsonschema installed, valid front-matter is accepted by generated
+  code; anything it rejects is re-checked by jsonschema, which stays the
+  authority and produces the reported error messages
+- Check the JSON schema against raw front-matter from files before building the
+  model; ADR objects have already been through ADRFrontMatter, so the schema pass
+  is opt-in for them
 """
 
 import json
-from dataclasses import dataclass
+from collections.abc import Callable, Iterator
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from functools import lru_cache
 from pathlib import Path
 from typing import Any
 
 import jsonschema
 from jsonschema.exceptions import ValidationError as JsonSchemaError
 
+try:
+    import fastjsonschema
+
+    FASTJSONSCHEMA_AVAILABLE = True
+except ImportError:
+    FASTJSONSCHEMA_AVAILABLE = False
+
 from .immutability import ImmutabilityManager
 from .model import ADR, ADRStatus
-from .parse import ParseError, find_adr_files, parse_adr_file
+from .parse import ParseError, build_adr, find_adr_files, parse_adr_source
+from .parse_cache import get_parse_cache
 from .policy_extractor import PolicyExtractor
 
+# Below this many files a process pool costs more to start than it saves
+PARALLEL_VALIDATION_THRESHOLD = 16
 
-@dataclass
+
+@dataclass(slots=True)
 class ValidationIssue:
     """Represents a single validation issue."""
 
@@ -43,29 +64,112 @@ class ValidationIssue:
         return " ".join(parts)
 
 
-@dataclass
+@dataclass(slots=True)
 class ValidationResult:
-    """Result of ADR validation."""
+    """Result of ADR validation.
+
+    errors and warnings are split out of issues once, on construction.
+    """
 
     is_valid: bool
     issues: list[ValidationIssue]
     adr: ADR | None = None
-
-    @property
-    def errors(self) -> list[ValidationIssue]:
-        """Get only error-level issues."""
-        return [issue for issue in self.issues if issue.level == "error"]
-
-    @property
-    def warnings(self) -> list[ValidationIssue]:
-        """Get only warning-level issues."""
-        return [issue for issue in self.issues if issue.level == "warning"]
+    errors: list[ValidationIssue] = field(init=False, repr=False, compare=False)
+    warnings: list[ValidationIssue] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        self.errors = []
+        self.warnings = []
+        for issue in self.issues:
+            if issue.level == "error":
+                self.errors.append(issue)
+            elif issue.level == "warning":
+                self.warnings.append(issue)
 
     def __bool__(self) -> bool:
         """Return True if validation passed."""
         return self.is_valid
 
 
+# Keywords added after draft 7 that fastjsonschema would silently ignore
+_POST_DRAFT7_KEYWORDS = frozenset(
+    {
+        "$anchor",
+        "$defs",
+        "$dynamicAnchor",
+        "$dynamicRef",
+        "$recursiveAnchor",
+        "$recursiveRef",
+        "dependentRequired",
+        "dependentSchemas",
+        "maxContains",
+        "minContains",
+        "prefixItems",
+        "unevaluatedItems",
+        "unevaluatedProperties",
+    }
+)
+
+FastSchemaCheck = Callable[[dict[str, Any]], Any]
+
+
+def _schema_nodes(schema: Any) -> Iterator[dict[str, Any]]:
+    """Yield every object nested in a schema (property maps included)."""
+    if isinstance(schema, dict):
+        yield schema
+        for value in schema.values():
+            yield from _schema_nodes(value)
+    elif isinstance(schema, list):
+        for item in schema:
+            yield from _schema_nodes(item)
+
+
+def _compile_fast_check(schema: dict[str, Any]) -> FastSchemaCheck | None:
+    """Compile a fastjsonschema check if it can't accept what jsonschema rejects.
+
+    fastjsonschema implements drafts 4-7, so schemas using newer keywords (or
+    array-form items, whose meaning changed in 2020-12) keep jsonschema only.
+    """
+    if not FASTJSONSCHEMA_AVAILABLE:
+        return None
+
+    for node in _schema_nodes(schema):
+        if not _POST_DRAFT7_KEYWORDS.isdisjoint(node) or isinstance(
+            node.get("items"), list
+        ):
+            return None
+
+    try:
+        check: FastSchemaCheck = fastjsonschema.compile(schema)
+    except fastjsonschema.JsonSchemaDefinitionException:
+        return None
+    return check
+
+
+@lru_cache(maxsize=4)
+def _load_compiled_schema(
+    schema_path: Path, mtime_ns: int
+) -> tuple[dict[str, Any], jsonschema.Draft202012Validator, FastSchemaCheck | None]:
+    """Load and compile a JSON schema once per file version.
+
+    Keyed by modification time as well as path so an edited schema is reloaded.
+    """
+    try:
+        with open(schema_path) as f:
+            schema = json.load(f)
+    except (OSError, json.JSONDecodeError) as e:
+        raise ValueError(f"Cannot load schema from {schema_path}: {e}") from e
+
+    if not isinstance(schema, dict):
+        raise ValueError(f"Schema must be a JSON object, got {type(schema)}")
+
+    return (
+        schema,
+        jsonschema.Draft202012Validator(schema),
+        _compile_fast_check(schema),
+    )
+
+
 class ADRValidator:
     """ADR validator with JSON Schema and semantic rule support."""
 
@@ -79,8 +183,7 @@ class ADRValidator:
             project_root: Project root directory for immutability manager.
         """
         self.schema_path = schema_path or self._get_default_schema_path()
-        self.schema = self._load_schema()
-        self.validator = jsonschema.Draft202012Validator(self.schema)
+        self.schema, self.validator, self._fast_check = self._load_schema_validator()
         self.policy_extractor = PolicyExtractor()
         self.immutability_manager = ImmutabilityManager(project_root)
 
@@ -94,30 +197,30 @@ class ADRValidator:
         current_dir = Path(__file__).parent
         return current_dir.parent / "schemas" / "adr.schema.json"
 
-    def _load_schema(self) -> dict[str, Any]:
-        """Load and parse the JSON schema."""
-        if not self.schema_path.exists():
-            raise ValueError(f"Schema file not found: {self.schema_path}")
-
+    def _load_schema_validator(
+        self,
+    ) -> tuple[dict[str, Any], jsonschema.Draft202012Validator, FastSchemaCheck | None]:
+        """Load the JSON schema and its compiled validators, reusing cached ones."""
         try:
-            with open(self.schema_path) as f:
-                schema = json.load(f)
-                if not isinstance(schema, dict):
-                    raise ValueError(
-                        f"Schema must be a JSON object, got {type(schema)}"
-                    )
-                return schema
-        except (OSError, json.JSONDecodeError) as e:
+            mtime_ns = self.schema_path.stat().st_mtime_ns
+        except FileNotFoundError:
+            raise ValueError(f"Schema file not found: {self.schema_path}") from None
+        except OSError as e:
             raise ValueError(f"Cannot load schema from {self.schema_path}: {e}") from e
 
+        return _load_compiled_schema(self.schema_path.resolve(), mtime_ns)
+
     def _convert_for_schema_validation(self, data: dict[str, Any]) -> dict[str, Any]:
         """Convert Pydantic model data to JSON Schema compatible format.
 
         This handles the mismatch where Pydantic models use Python types (like datetime.date)
         but JSON Schema validation expects JSON-compatible types (like strings).
 
+        None values are dropped, matching model_dump(exclude_none=True), since
+        optional fields left empty in YAML would otherwise fail their type checks.
+
         Args:
-            data: Dictionary from Pydantic model
+            data: Dictionary from Pydantic model or raw front-matter
 
         Returns:
             Schema-compatible dictionary with converted types
@@ -126,7 +229,9 @@ class ADRValidator:
 
         converted: dict[str, Any] = {}
         for key, value in data.items():
-            if isinstance(value, date):
+            if value is None:
+                continue
+            elif isinstance(value, date):
                 # Convert datetime.date to ISO format string
                 converted[key] = value.isoformat()
             elif isinstance(value, dict):
@@ -163,14 +268,27 @@ class ADRValidator:
         Returns:
             List of validation issues found
         """
-        issues = []
+        # Convert datetime.date objects back to strings for JSON Schema validation
+        # This handles the mismatch between Pydantic model (uses datetime.date)
+        # and JSON Schema (expects string)
+        schema_compatible_data = self._convert_for_schema_validation(front_matter)
+        return self._check_schema(schema_compatible_data, file_path)
+
+    def _check_schema(
+        self, data: dict[str, Any], file_path: Path | None = None
+    ) -> list[ValidationIssue]:
+        """Run the compiled JSON schema over already JSON-compatible data."""
+        issues: list[ValidationIssue] = []
+
+        if self._fast_check is not None:
+            try:
+                self._fast_check(data)
+                return issues
+            except fastjsonschema.JsonSchemaValueException:
+                pass  # Let jsonschema decide and describe the problem
 
         try:
-            # Convert datetime.date objects back to strings for JSON Schema validation
-            # This handles the mismatch between Pydantic model (uses datetime.date)
-            # and JSON Schema (expects string)
-            schema_compatible_data = self._convert_for_schema_validation(front_matter)
-            self.validator.validate(schema_compatible_data)
+            self.validator.validate(data)
         except JsonSchemaError as e:
             # Convert jsonschema errors to our issue format
             field_path = (
@@ -398,20 +516,39 @@ class ADRValidator:
             ]
         )
 
-    def validate_adr(self, adr: ADR) -> ValidationResult:
+    def validate_adr(
+        self, adr: ADR, *, strict_schema: bool = False
+    ) -> ValidationResult:
         """Validate a single ADR.
 
         Args:
             adr: The ADR to validate
+            strict_schema: Also check the front-matter against the JSON schema.
+                Off by default since ADRFrontMatter already enforces the schema
 
         Returns:
             ValidationResult with issues found
         """
         issues = []
 
-        # Schema validation on front-matter
-        front_matter_dict = adr.front_matter.model_dump(exclude_none=True)
-        issues.extend(self.validate_schema(front_matter_dict, adr.file_path))
+        if strict_schema:
+            # JSON mode makes pydantic's serializer emit dates as ISO strings,
+            # so no Python-side conversion pass is needed
+            front_matter_dict = adr.front_matter.model_dump(
+                mode="json", exclude_none=True
+            )
+            issues.extend(self._check_schema(front_matter_dict, adr.file_path))
+
+        issues.extend(self._validate_rules(adr))
+
+        # Determine if validation passed (no errors, warnings OK)
+        has_errors = any(issue.level == "error" for issue in issues)
+
+        return ValidationResult(is_valid=not has_errors, issues=issues, adr=adr)
+
+    def _validate_rules(self, adr: ADR) -> list[ValidationIssue]:
+        """Run the semantic, policy and immutability checks on an ADR."""
+        issues = []
 
         # Semantic rule validation
         issues.extend(self.validate_semantic_rules(adr))
@@ -422,35 +559,81 @@ class ADRValidator:
         # Immutability validation (V3 feature - Phase 3)
         issues.extend(self.validate_immutability_requirements(adr))
 
-        # Determine if validation passed (no errors, warnings OK)
-        has_errors = any(issue.level == "error" for issue in issues)
-
-        return ValidationResult(is_valid=not has_errors, issues=issues, adr=adr)
+        return issues
 
     def validate_file(self, file_path: Path | str) -> ValidationResult:
         """Validate an ADR file.
 
+        The JSON schema is checked against the front-matter as written. The ADR
+        model is only built once that passes, so schema errors are reported
+        as-is instead of surfacing as Pydantic errors.
+
         Args:
             file_path: Path to the ADR file to validate
 
         Returns:
             ValidationResult with issues found
         """
+        path = Path(file_path)
+        parse_cache = get_parse_cache()
+        cached = (
+            parse_cache.get_with_front_matter(path) if parse_cache is not None else None
+        )
+
+        if cached is None:
+            result, front_matter_dict = self._validate_uncached(path)
+            if (
+                parse_cache is not None
+                and result.adr is not None
+                and front_matter_dict is not None
+            ):
+                parse_cache.put(path, result.adr, front_matter_dict)
+            return result
+
+        adr, front_matter_dict = cached
+        issues = self.validate_schema(front_matter_dict, path)
+        if issues:
+            return ValidationResult(is_valid=False, issues=issues)
+
+        return self._with_rule_issues(adr, issues)
+
+    def _validate_uncached(
+        self, file_path: Path
+    ) -> tuple[ValidationResult, dict[str, Any] | None]:
+        """Parse and validate an ADR file without consulting the parse cache.
+
+        Args:
+            file_path: Path to the ADR file to validate
+
+        Returns:
+            The ValidationResult and the raw front-matter, which is None when
+            the file could not be parsed
+        """
         try:
-            adr = parse_adr_file(file_path, strict=False)
-            return self.validate_adr(adr)
+            front_matter_dict, markdown_content = parse_adr_source(
+                file_path, strict=False
+            )
+            issues = self.validate_schema(front_matter_dict, file_path)
+            if issues:
+                return ValidationResult(is_valid=False, issues=issues), None
+
+            adr = build_adr(front_matter_dict, markdown_content, file_path)
         except ParseError as e:
-            return ValidationResult(
-                is_valid=False,
-                issues=[
-                    ValidationIssue(
-                        level="error",
-                        message=str(e),
-                        rule="parse_error",
-                        file_path=Path(file_path),
-                    )
-                ],
+            issue = ValidationIssue(
+                level="error", message=str(e), rule="parse_error", file_path=file_path
             )
+            return ValidationResult(is_valid=False, issues=[issue]), None
+
+        return self._with_rule_issues(adr, issues), front_matter_dict
+
+    def _with_rule_issues(
+        self, adr: ADR, issues: list[ValidationIssue]
+    ) -> ValidationResult:
+        """Run the rule checks on a schema-valid ADR and build its result."""
+        issues.extend(self._validate_rules(adr))
+        has_errors = any(issue.level == "error" for issue in issues)
+
+        return ValidationResult(is_valid=not has_errors, issues=issues, adr=adr)
 
     def validate_directory(
         self, directory: Path | str = "docs/adr"
@@ -476,7 +659,11 @@ class ADRValidator:
 
 
 def validate_adr(
-    adr: ADR, schema_path: Path | None = None, project_root: Path | None = None
+    adr: ADR,
+    schema_path: Path | None = None,
+    project_root: Path | None = None,
+    *,
+    strict_schema: bool = False,
 ) -> ValidationResult:
     """Validate a single ADR object.
 
@@ -484,12 +671,29 @@ def validate_adr(
         adr: The ADR to validate
         schema_path: Optional path to JSON schema file
         project_root: Optional project root for immutability validation
+        strict_schema: Also check the front-matter against the JSON schema
 
     Returns:
         ValidationResult
     """
     validator = ADRValidator(schema_path, project_root)
-    return validator.validate_adr(adr)
+    return validator.validate_adr(adr, strict_schema=strict_schema)
+
+
+def detect_project_root(file_path: Path | str) -> Path:
+    """Guess the project root for an ADR file.
+
+    Args:
+        file_path: Path to an ADR file
+
+    Returns:
+        Project root directory
+    """
+    file_path_obj = Path(file_path)
+    # Look for common project indicators (docs/adr suggests project root is 2 levels up)
+    if "docs/adr" in str(file_path_obj):
+        return file_path_obj.parent.parent.parent
+    return file_path_obj.parent.parent
 
 
 def validate_adr_file(
@@ -509,12 +713,7 @@ def validate_adr_file(
     """
     # Auto-detect project root from file path if not provided
     if project_root is None:
-        file_path_obj = Path(file_path)
-        # Look for common project indicators (docs/adr suggests project root is 2 levels up)
-        if "docs/adr" in str(file_path_obj):
-            project_root = file_path_obj.parent.parent.parent
-        else:
-            project_root = file_path_obj.parent.parent
+        project_root = detect_project_root(file_path)
 
     validator = ADRValidator(schema_path, project_root)
     return validator.validate_file(file_path)
@@ -534,3 +733,134 @@ def validate_adr_directory(
     """
     validator = ADRValidator(schema_path)
     return validator.validate_directory(directory)
+
+
+# Process pool support for validating many files at once
+
+_worker_validator: ADRValidator | None = None
+
+
+def _init_validation_worker(
+    schema_path: Path | None, project_root: Path | None
+) -> None:
+    """Build one validator per worker process instead of one per file."""
+    global _worker_validator
+    _worker_validator = ADRValidator(schema_path, project_root)
+
+
+def parse_and_validate_one(
+    file_path: Path,
+) -> tuple[ValidationResult, dict[str, Any] | None]:
+    """Parse and validate a single ADR file inside a worker process.
+
+    Workers never touch the parse cache; the parent stores what they return.
+
+    Args:
+        file_path: Path to the ADR file
+
+    Returns:
+        The ValidationResult and the file's raw front-matter (None if unparsed)
+    """
+    global _worker_validator
+    if _worker_validator is None:
+        _worker_validator = ADRValidator()
+    return _worker_validator._validate_uncached(file_path)
+
+
+def validate_adr_files(
+    adr_files: list[Path],
+    schema_path: Path | None = None,
+    project_root: Path | None = None,
+    workers: int | None = None,
+) -> list[ValidationResult]:
+    """Validate ADR files, optionally spreading the work across processes.
+
+    Files are validated serially in this process unless workers > 1 is passed.
+    Only command-line entry points should do that: library and workflow callers
+    (including the MCP server) keep the default so nothing is forked. Files
+    served by the parse cache are always validated here; the pool only gets
+    the cache misses, and is skipped when there are too few of them to pay
+    for its startup. Results from the pool are stored back in the cache.
+
+    Args:
+        adr_files: ADR files to validate
+        schema_path: Optional path to JSON schema file
+        project_root: Optional project root for immutability validation
+        workers: Number of worker processes (None or 1 validates serially)
+
+    Returns:
+        List of ValidationResult objects in the same order as adr_files
+    """
+    validator = ADRValidator(schema_path, project_root)
+    results: list[ValidationResult | None] = [None] * len(adr_files)
+
+    if workers is not None and workers > 1:
+        parse_cache = get_parse_cache()
+        misses = [
+            index
+            for index, file_path in enumerate(adr_files)
+            if parse_cache is None or not parse_cache.contains(file_path)
+        ]
+
+        if len(misses) >= PARALLEL_VALIDATION_THRESHOLD:
+            try:
+                with ProcessPoolExecutor(
+                    max_workers=workers,
+                    initializer=_init_validation_worker,
+                    initargs=(schema_path, project_root),
+                ) as pool:
+                    parsed = list(
+                        pool.map(
+                            parse_and_validate_one,
+                            [adr_files[index] for index in misses],
+                            chunksize=8,
+                        )
+                    )
+            except (OSError, RuntimeError):
+                # No usable pool (e.g. sandboxed environment) - run serially
+                misses, parsed = [], []
+
+            for index, (result, front_matter_dict) in zip(misses, parsed, strict=True):
+                results[index] = result
+                if (
+                    parse_cache is not None
+                    and result.adr is not None
+                    and front_matter_dict is not None
+                ):
+                    parse_cache.put(adr_files[index], result.adr, front_matter_dict)
+
+    return [
+        result if result is not None else validator.validate_file(file_path)
+        for file_path, result in zip(adr_files, results, strict=True)
+    ]
+
+
+def parse_and_validate_all(
+    directory: Path | str = "docs/adr",
+    schema_path: Path | None = None,
+    workers: int | None = None,
+) -> list[tuple[Path, ValidationResult]]:
+    """Parse and validate every ADR file in a directory in a single pass.
+
+    Index builders accept the returned pairs, so commands that write several
+    indexes read and validate each file only once.
+
+    Args:
+        directory: Directory containing ADR files
+        schema_path: Optional path to JSON schema file
+        workers: Number of worker processes (None or 1 validates serially)
+
+    Returns:
+        (file path, ValidationResult) pairs in sorted file order
+    """
+    adr_files = find_adr_files(directory)
+    if not adr_files:
+        return []
+
+    results = validate_adr_files(
+        adr_files,
+        schema_path=schema_path,
+        project_root=detect_project_root(adr_files[0]),
+        workers=workers,
+    )
+    return list(zip(adr_files, results, strict=True))
@@ -9,7 +9,7 @@ from typing import Any
 
 from ...contract.builder import ConstraintsContractBuilder
 from ...core.model import ADR
-from ...core.parse import find_adr_files, parse_adr_file
+from ...core.parse import find_adr_by_id
 from ...core.validate import validate_adr
 from ...enforcement.pipeline import EnforcementPipeline, EnforcementResult
 from ...index.json_index import generate_adr_index
@@ -194,15 +194,9 @@ class ApprovalWorkflow(BaseWorkflow):
 
     def _load_adr_for_approval(self, adr_id: str) -> tuple[ADR, Path]:
         """Load the ADR that needs to be approved."""
-        adr_files = find_adr_files(self.adr_dir)
-
-        for file_path in adr_files:
-            try:
-                adr = parse_adr_file(file_path)
-                if adr.id == adr_id:
-                    return adr, file_path
-            except Exception:
-                continue
+        adr = find_adr_by_id(self.adr_dir, adr_id, strict=True)
+        if adr is not None and adr.file_path is not None:
+            return adr, adr.file_path
 
         raise ValueError(f"ADR {adr_id} not found in {self.adr_dir}")
 
@@ -8,10 +8,41 @@ from typing import Any
 
 from ...contract.builder import ConstraintsContractBuilder
 from ...core.model import ADR, ADRFrontMatter, ADRStatus, PolicyModel
-from ...core.parse import find_adr_files, parse_adr_file
+from ...core.parse import find_adr_by_id, find_adr_files, parse_adr_file
 from ...core.validate import validate_adr
 from .base import BaseWorkflow, WorkflowError, WorkflowResult, WorkflowStatus
 
+# Filename slug rules: drop punctuation, then collapse whitespace/_/- runs
+_SLUG_STRIP_PATTERN = re.compile(r"[^\w\s-]")
+_SLUG_SEPARATOR_PATTERN = re.compile(r"[\s_-]+")
+_ADR_NUMBER_PATTERN = re.compile(r"ADR-(\d+)")
+
+# Common technology and architecture terms, fused so proposals are scanned once.
+# Every alternative matches a whole word, so the matched text doesn't depend on
+# which alternative wins.
+_TECH_TERM_PATTERN = re.compile(
+    r"\b(?:"
+    r"\w*sql\w*|mongo\w*|redis"  # Databases
+    r"|react|vue|angular|svelte"  # Frontend
+    r"|express|django|flask|spring"  # Backend
+    r"|microservice\w*|monolith\w*|serverless"  # Architecture
+    r"|api|rest|graphql|grpc"  # APIs
+    r"|docker|kubernetes|aws|azure"  # Infrastructure
+    r"|typescript|javascript|python|java"  # Languages
+    r")\b",
+    re.IGNORECASE,
+)
+_LONG_WORD_PATTERN = re.compile(r"\b\w{5,}\b")
+
+# (proposal term, existing ADR term) pairs that suggest a contradiction
+_OPPOSING_TERMS = (
+    ("use", "avoid"),
+    ("adopt", "reject"),
+    ("implement", "remove"),
+    ("enable", "disable"),
+    ("allow", "forbid"),
+)
+
 
 @dataclass
 class CreationInput:
@@ -27,6 +58,7 @@ class CreationInput:
     policy: dict[str, Any] | None = None  # Structured policy block
     alternatives: str | None = None  # Alternative options considered
     skip_quality_gate: bool = False  # Skip quality gate (for testing or override)
+    supersedes: list[str] | None = None  # ADRs this one replaces (set by supersede)
 
 
 @dataclass
@@ -195,25 +227,17 @@ class CreationWorkflow(BaseWorkflow):
             return self.result
 
     def _generate_adr_id(self) -> str:
-        """Generate next available ADR ID."""
-        # Scan directory for existing ADR files
-        adr_files = find_adr_files(self.adr_dir)
-        if not adr_files:
-            return "ADR-0001"
-
-        # Extract numbers from existing ADR files
-        numbers = []
-        for file_path in adr_files:
-            filename = Path(file_path).stem
-            match = re.search(r"ADR-(\d+)", filename)
-            if match:
-                numbers.append(int(match.group(1)))
+        """Generate next available ADR ID.
 
-        if not numbers:
-            return "ADR-0001"
+        Only filenames are inspected; no ADR file is opened.
+        """
+        max_num = 0
+        for file_path in find_adr_files(self.adr_dir):
+            match = _ADR_NUMBER_PATTERN.search(file_path.stem)
+            if match:
+                max_num = max(max_num, int(match.group(1)))
 
-        next_num = max(numbers) + 1
-        return f"ADR-{next_num:04d}"
+        return f"ADR-{max_num + 1:04d}"
 
     def _validate_creation_input(self, input_data: CreationInput) -> None:
         """Validate the input data for ADR creation with helpful error messages."""
@@ -279,8 +303,13 @@ class CreationWorkflow(BaseWorkflow):
                         f"{existing_adr.title} {existing_adr.context} {existing_adr.decision}"
                     ).lower()
 
+                    # One substring pass per term feeds both the score and
+                    # the reported matches
+                    matching_terms = [
+                        term for term in key_terms if term in existing_text
+                    ]
                     relevance_score = self._calculate_relevance(
-                        key_terms, existing_text
+                        key_terms, matching_terms
                     )
 
                     if relevance_score > 0.3:  # Threshold for relevance
@@ -289,9 +318,7 @@ class CreationWorkflow(BaseWorkflow):
                                 "adr_id": existing_adr.id,
                                 "title": existing_adr.title,
                                 "relevance_score": relevance_score,
-                                "matching_terms": [
-                                    term for term in key_terms if term in existing_text
-                                ],
+                                "matching_terms": matching_terms,
                                 "tags_overlap": bool(
                                     set(input_data.tags or [])
                                     & set(existing_adr.front_matter.tags or [])
@@ -318,53 +345,20 @@ class CreationWorkflow(BaseWorkflow):
 
     def _extract_key_terms(self, text: str) -> list[str]:
         """Extract key technical terms from text."""
-        # Common technology and architecture terms
-        tech_patterns = [
-            r"\b\w*sql\w*\b",
-            r"\bmongo\w*\b",
-            r"\bredis\b",  # Databases
-            r"\breact\b",
-            r"\bvue\b",
-            r"\bangular\b",
-            r"\bsvelte\b",  # Frontend
-            r"\bexpress\b",
-            r"\bdjango\b",
-            r"\bflask\b",
-            r"\bspring\b",  # Backend
-            r"\bmicroservice\w*\b",
-            r"\bmonolith\w*\b",
-            r"\bserverless\b",  # Architecture
-            r"\bapi\b",
-            r"\brest\b",
-            r"\bgraphql\b",
-            r"\bgrpc\b",  # APIs
-            r"\bdocker\b",
-            r"\bkubernetes\b",
-            r"\baws\b",
-            r"\bazure\b",  # Infrastructure
-            r"\btypescript\b",
-            r"\bjavascript\b",
-            r"\bpython\b",
-            r"\bjava\b",  # Languages
-        ]
-
-        terms = []
-        for pattern in tech_patterns:
-            matches = re.findall(pattern, text, re.IGNORECASE)
-            terms.extend([match.lower() for match in matches])
+        terms = [match.lower() for match in _TECH_TERM_PATTERN.findall(text)]
 
         # Add important words (length > 5)
-        words = re.findall(r"\b\w{5,}\b", text.lower())
-        terms.extend(words)
+        terms.extend(_LONG_WORD_PATTERN.findall(text.lower()))
 
         return list(set(terms))  # Remove duplicates
 
-    def _calculate_relevance(self, key_terms: list[str], existing_text: str) -> float:
-        """Calculate relevance score between proposal and existing ADR."""
+    def _calculate_relevance(
+        self, key_terms: list[str], matching_terms: list[str]
+    ) -> float:
+        """Calculate relevance score from the proposal terms an ADR matches."""
         if not key_terms:
             return 0.0
 
-        matching_terms = [term for term in key_terms if term in existing_text]
         return len(matching_terms) / len(key_terms)
 
     def _detect_conflicts(
@@ -440,35 +434,27 @@ class CreationWorkflow(BaseWorkflow):
         """Check if proposal contradicts a specific ADR."""
         # This is a simplified version - could be enhanced with NLP
 
-        # Load the related ADR
+        # Load the related ADR (filename lookup, no directory scan)
         try:
-            adr_files = find_adr_files(self.adr_dir)
-            for file_path in adr_files:
-                adr = parse_adr_file(file_path)
-                if adr.id == related_adr_id:
-                    # Simple keyword-based contradiction detection
-                    proposal_decision = input_data.decision.lower()
-                    existing_decision = adr.decision.lower()
-
-                    # Look for opposing terms
-                    opposing_pairs = [
-                        ("use", "avoid"),
-                        ("adopt", "reject"),
-                        ("implement", "remove"),
-                        ("enable", "disable"),
-                        ("allow", "forbid"),
-                    ]
-
-                    for word1, word2 in opposing_pairs:
-                        if word1 in proposal_decision and word2 in existing_decision:
-                            return {
-                                "adr_id": related_adr_id,
-                                "conflict_type": "decision_contradiction",
-                                "conflict_detail": f"Proposal uses '{word1}' while {related_adr_id} uses '{word2}'",
-                            }
-                    break
+            adr = find_adr_by_id(self.adr_dir, related_adr_id, strict=True)
         except Exception:
-            pass
+            return None
+
+        if adr is None:
+            return None
+
+        # Simple keyword-based contradiction detection
+        proposal_decision = input_data.decision.lower()
+        existing_decision = adr.decision.lower()
+
+        # Look for opposing terms
+        for word1, word2 in _OPPOSING_TERMS:
+            if word1 in proposal_decision and word2 in existing_decision:
+                return {
+                    "adr_id": related_adr_id,
+                    "conflict_type": "decision_contradiction",
+                    "conflict_detail": f"Proposal uses '{word1}' while {related_adr_id} uses '{word2}'",
+                }
 
         return None
 
@@ -483,7 +469,7 @@ class CreationWorkflow(BaseWorkflow):
             date=date.today(),
             deciders=input_data.deciders or [],
             tags=input_data.tags or [],
-            supersedes=[],
+            supersedes=input_data.supersedes or [],
             superseded_by=[],
             depends_on=[],
             related_to=[],
@@ -572,8 +558,8 @@ class CreationWorkflow(BaseWorkflow):
     def _generate_adr_file(self, adr: ADR) -> str:
         """Generate the ADR file."""
         # Create filename with slugified title
-        title_slug = re.sub(r"[^\w\s-]", "", adr.title.lower())
-        title_slug = re.sub(r"[\s_-]+", "-", title_slug).strip("-")
+        title_slug = _SLUG_STRIP_PATTERN.sub("", adr.title.lower())
+        title_slug = _SLUG_SEPARATOR_PATTERN.sub("-", title_slug).strip("-")
         file_path = Path(self.adr_dir) / f"{adr.id}-{title_slug}.md"
 
         # Ensure directory exists
@@ -1,17 +1,37 @@
 """Supersede Workflow - Replace existing ADR with new decision."""
 
 import re
-from dataclasses import dataclass
+from dataclasses import dataclass, replace
 from datetime import datetime
 from pathlib import Path
 from typing import Any
 
 from ...core.model import ADR
-from ...core.parse import find_adr_files, parse_adr_file
+from ...core.parse import find_adr_by_id, find_adr_files, parse_adr_file
 from .approval import ApprovalInput, ApprovalWorkflow
 from .base import BaseWorkflow, WorkflowResult, WorkflowStatus
 from .creation import CreationInput, CreationWorkflow
 
+# Front-matter lines rewritten in place in the superseded ADR
+_STATUS_LINE_PATTERN = re.compile(r"^status:\s*\w+$", re.MULTILINE)
+_SUPERSEDED_BY_LINE_PATTERN = re.compile(r"^superseded_by:\s*.*$", re.MULTILINE)
+
+
+def _split_front_matter(content: str) -> tuple[str, str | None]:
+    """Split ADR text into its front-matter lines and the rest of the file.
+
+    The header ends just after the last front-matter line, so new fields can
+    be appended to it; the rest starts at the closing fence and is never
+    touched. Without a "\n---\n" closing fence the whole text is the header
+    and the rest is None.
+    """
+    yaml_end = content.find("\n---\n")
+    if yaml_end == -1:
+        return content, None
+    # find() points at the newline ending the last frontmatter field; keep it
+    # in the header so appended fields land on their own line.
+    return content[: yaml_end + 1], content[yaml_end + 1 :]
+
 
 @dataclass
 class SupersedeInput:
@@ -47,10 +67,10 @@ class SupersedeWorkflow(BaseWorkflow):
 
     Workflow Steps:
     1. Validate that old ADR exists and can be superseded
-    2. Create new ADR proposal using CreationWorkflow
-    3. Update old ADR status to 'superseded'
-    4. Update bidirectional relationships (supersedes/superseded_by)
-    5. Update any ADRs that referenced the old ADR
+    2. Create new ADR proposal (with its supersedes link) using CreationWorkflow
+    3. Update old ADR status to 'superseded' and record superseded_by
+    4. Update any ADRs that referenced the old ADR
+    5. Resolve conflicts that existed with the old ADR
     6. Optionally approve new ADR (triggering ApprovalWorkflow)
     7. Generate comprehensive superseding report
     """
@@ -73,9 +93,12 @@ class SupersedeWorkflow(BaseWorkflow):
             )
             old_status = old_adr.status
 
-            # Step 2: Create new ADR proposal
+            # Step 2: Create new ADR proposal, already recording what it supersedes
             creation_result = self._execute_step(
-                "create_new_adr", self._create_new_adr, input_data.new_proposal
+                "create_new_adr",
+                self._create_new_adr,
+                input_data.new_proposal,
+                input_data.old_adr_id,
             )
 
             new_adr_id = creation_result.data["creation_result"].adr_id
@@ -90,15 +113,7 @@ class SupersedeWorkflow(BaseWorkflow):
                 input_data.supersede_reason,
             )
 
-            # Step 4: Update new ADR with supersedes relationship
-            self._execute_step(
-                "update_new_adr_relationships",
-                self._update_new_adr_relationships,
-                new_adr_id,
-                input_data.old_adr_id,
-            )
-
-            # Step 5: Update related ADRs
+            # Step 4: Update related ADRs
             updated_relationships = self._execute_step(
                 "update_related_adr_relationships",
                 self._update_related_adr_relationships,
@@ -106,7 +121,7 @@ class SupersedeWorkflow(BaseWorkflow):
                 new_adr_id,
             )
 
-            # Step 6: Resolve conflicts
+            # Step 5: Resolve conflicts
             resolved_conflicts = self._execute_step(
                 "resolve_conflicts",
                 self._resolve_conflicts_through_superseding,
@@ -114,7 +129,7 @@ class SupersedeWorkflow(BaseWorkflow):
                 creation_result.data["creation_result"].conflicts_detected,
             )
 
-            # Step 7: Optionally approve new ADR
+            # Step 6: Optionally approve new ADR
             automation_triggered = False
             new_adr_status = "proposed"
 
@@ -125,7 +140,7 @@ class SupersedeWorkflow(BaseWorkflow):
                 automation_triggered = approval_result.get("success", False)
                 new_adr_status = "accepted" if automation_triggered else "proposed"
 
-            # Step 8: Generate guidance
+            # Step 7: Generate guidance
             next_steps = self._execute_step(
                 "generate_supersede_guidance",
                 self._generate_supersede_guidance,
@@ -172,8 +187,18 @@ class SupersedeWorkflow(BaseWorkflow):
 
         return self.result
 
-    def _create_new_adr(self, new_proposal: Any) -> WorkflowResult:
-        """Create new ADR using the creation workflow."""
+    def _create_new_adr(
+        self, new_proposal: CreationInput, old_adr_id: str
+    ) -> WorkflowResult:
+        """Create new ADR using the creation workflow.
+
+        The supersedes link is part of the front-matter the creation workflow
+        writes, so the new file doesn't have to be read and patched afterwards.
+        """
+        new_proposal = replace(
+            new_proposal,
+            supersedes=[*(new_proposal.supersedes or []), old_adr_id],
+        )
         creation_workflow = CreationWorkflow(adr_dir=self.adr_dir)
         creation_result = creation_workflow.execute(input_data=new_proposal)
 
@@ -196,21 +221,16 @@ class SupersedeWorkflow(BaseWorkflow):
 
     def _validate_supersede_preconditions(self, old_adr_id: str) -> tuple[ADR, Path]:
         """Validate that the old ADR exists and can be superseded."""
-        adr_files = find_adr_files(self.adr_dir)
+        adr = find_adr_by_id(self.adr_dir, old_adr_id, strict=True)
 
-        for file_path in adr_files:
-            try:
-                adr = parse_adr_file(file_path)
-                if adr.id == old_adr_id:
-                    # Check if already superseded
-                    if adr.status == "superseded":
-                        raise ValueError(f"ADR {old_adr_id} is already superseded")
+        if adr is None or adr.file_path is None:
+            raise ValueError(f"ADR {old_adr_id} not found in {self.adr_dir}")
 
-                    return adr, file_path
-            except Exception:
-                continue
+        # Check if already superseded
+        if adr.status == "superseded":
+            raise ValueError(f"ADR {old_adr_id} is already superseded")
 
-        raise ValueError(f"ADR {old_adr_id} not found in {self.adr_dir}")
+        return adr, adr.file_path
 
     def _update_old_adr_status(
         self, old_adr: ADR, old_adr_file: Path, new_adr_id: str, reason: str
@@ -221,89 +241,31 @@ class SupersedeWorkflow(BaseWorkflow):
         with open(old_adr_file, encoding="utf-8") as f:
             content = f.read()
 
+        # Only the front-matter is rewritten; the body is copied through as-is
+        header, rest = _split_front_matter(content)
+
         # Update status
-        status_pattern = r"^status:\s*\w+$"
-        content = re.sub(
-            status_pattern, "status: superseded", content, flags=re.MULTILINE
-        )
+        header = _STATUS_LINE_PATTERN.sub("status: superseded", header)
 
         # Update or add superseded_by field
-        superseded_by_pattern = r"^superseded_by:\s*.*$"
         superseded_by_line = f'superseded_by: ["{new_adr_id}"]'
 
-        if re.search(superseded_by_pattern, content, flags=re.MULTILINE):
+        if _SUPERSEDED_BY_LINE_PATTERN.search(header):
             # Replace existing superseded_by
-            content = re.sub(
-                superseded_by_pattern, superseded_by_line, content, flags=re.MULTILINE
-            )
-        else:
+            header = _SUPERSEDED_BY_LINE_PATTERN.sub(superseded_by_line, header)
+        elif rest is not None:
             # Add superseded_by before end of YAML front-matter
-            yaml_end = content.find("\n---\n")
-            if yaml_end != -1:
-                # find() points at the newline ending the last frontmatter
-                # field; advance past it so the insert lands on its own line
-                # instead of being welded onto that field's value.
-                yaml_end += 1
-                supersede_metadata = (
-                    f"{superseded_by_line}\n"
-                    f'supersede_date: {datetime.now().strftime("%Y-%m-%d")}\n'
-                    f'supersede_reason: "{reason}"\n'
-                )
-                content = content[:yaml_end] + supersede_metadata + content[yaml_end:]
+            header += (
+                f"{superseded_by_line}\n"
+                f'supersede_date: {datetime.now().strftime("%Y-%m-%d")}\n'
+                f'supersede_reason: "{reason}"\n'
+            )
 
         # Write updated content
         with open(old_adr_file, "w", encoding="utf-8") as f:
-            f.write(content)
-
-    def _update_new_adr_relationships(self, new_adr_id: str, old_adr_id: str) -> None:
-        """Update new ADR to include supersedes relationship."""
-        adr_files = find_adr_files(self.adr_dir)
-
-        for file_path in adr_files:
-            try:
-                adr = parse_adr_file(file_path)
-                if adr.id == new_adr_id:
-                    # Read and update file
-                    with open(file_path, encoding="utf-8") as f:
-                        content = f.read()
-
-                    # Update or add supersedes field
-                    supersedes_pattern = r"^supersedes:\s*.*$"
-                    supersedes_line = f'supersedes: ["{old_adr_id}"]'
-
-                    if re.search(supersedes_pattern, content, flags=re.MULTILINE):
-                        # Replace existing supersedes
-                        content = re.sub(
-                            supersedes_pattern,
-                            supersedes_line,
-                            content,
-                            flags=re.MULTILINE,
-                        )
-                    else:
-                        # Add supersedes before end of YAML front-matter
-                        yaml_end = content.find("\n---\n")
-                        if yaml_end != -1:
-                            # find() points at the newline ending the last
-                            # frontmatter field; advance past it so the insert
-                            # lands on its own line instead of being welded
-                            # onto that field's value. The trailing "\n" then
-                            # separates the inserted line from the closing
-                            # fence.
-                            yaml_end += 1
-                            content = (
-                                content[:yaml_end]
-                                + supersedes_line
-                                + "\n"
-                                + content[yaml_end:]
-                            )
-
-                    # Write updated content
-                    with open(file_path, "w", encoding="utf-8") as f:
-                        f.write(content)
-
-                    break
-            except Exception:
-                continue
+            f.write(header)
+            if rest is not None:
+                f.write(rest)
 
     def _update_related_adr_relationships(
         self, old_adr_id: str, new_adr_id: str
@@ -5,19 +5,39 @@ Design decisions:
 - Generate ESLint rules to ban disallowed imports
 - Support common patterns like "Use React Query instead of X"
 - Generate rules for deprecated patterns based on superseded ADRs
+- Remember legacy pattern extraction per file (path, mtime, size) when the
+  opt-in parse cache is enabled, so unchanged ADRs skip parsing and regexes
+- Serialize generated configs with orjson when installed, else stdlib json
+- Memoize generated configs per directory until an ADR file's name, mtime or
+  size changes, so repeated exports skip parsing entirely
 """
 
 import json
-import re
+import string
+from functools import lru_cache
 from pathlib import Path
 from typing import Any, TypedDict
 
+try:
+    import orjson
+
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 from ...contract.models import MergedConstraints
 from ...core.model import ADR, ADRStatus
-from ...core.parse import ParseError, find_adr_files, parse_adr_file
+from ...core.parse import (
+    ParseError,
+    adr_directory_fingerprint,
+    find_adr_files,
+    parse_adr_file,
+)
+from ...core.parse_cache import is_cache_enabled
 from ...core.policy_extractor import PolicyExtractor
 from ..clause_kinds import ClauseKind, EnforcementStage, OutputMode
 from .base import BaseAdapter, ConfigFragment
+from .regex_engine import compile_pattern
 
 
 class ADRMetadata(TypedDict):
@@ -136,21 +156,57 @@ class StructuredESLintGenerator:
         return config
 
 
+# Library names may carry npm scopes and subpaths (@scope/pkg)
+_LIBRARY = r"[a-zA-Z0-9\-_@/]+"
+
+# Phrases that mark a library as banned in legacy (unstructured) ADRs. The
+# outer named group of each alternative tells which phrase matched
+# (Match.lastgroup). Compiled with RE2 when installed, so matching stays
+# linear in the ADR length.
+_BAN_PATTERN = compile_pattern(
+    r"(?i)"
+    # "Don't use X", "Avoid X", "Ban X"
+    rf"(?P<ban>(?:don't\s+use|avoid|ban|deprecated?)\s+(?P<ban_old>{_LIBRARY}))"
+    # "No longer use X"
+    rf"|(?P<no_longer>no\s+longer\s+use\s+(?P<no_longer_old>{_LIBRARY}))"
+)
+
+# Phrases that name a replacement as well. Each gets its own scan because an
+# alternation drops overlapping matches, and these overlap ban phrases in
+# practice ("avoid use Y instead of X" must still ban X and prefer Y).
+_PREFERENCE_PATTERNS = (
+    # "Use Y instead of X"
+    compile_pattern(
+        rf"(?i)use\s+(?P<new>{_LIBRARY})\s+instead\s+of\s+(?P<old>{_LIBRARY})"
+    ),
+    # "Replace X with Y"
+    compile_pattern(rf"(?i)replace\s+(?P<old>{_LIBRARY})\s+with\s+(?P<new>{_LIBRARY})"),
+)
+
+# Every ban and preference phrase contains one of these words, so content
+# without any of them can skip the regexes (substring checks are far cheaper)
+_BAN_ANCHORS = ("use", "avoid", "ban", "deprecate", "replace")
+
+# Markdown emphasis/code markers that would otherwise hide library names
+_MARKDOWN_MARKERS = str.maketrans("", "", "*`")
+
+# ADR tags that enable backend-specific rules
+_BACKEND_TAGS = frozenset({"backend", "api", "server"})
+# Characters allowed in a library name (same set as _LIBRARY), checked without a regex
+_LIBRARY_NAME_CHARS = frozenset(string.ascii_letters + string.digits + "-_@/")
+# Common words the ban phrases can capture that are never library names
+_SKIP_WORDS = frozenset(
+    "the a an and or but in on at to for of with by avoid use replace".split()
+)
+
+
 class ESLintRuleExtractor:
     """Extract ESLint rules from ADR content (legacy pattern-based approach)."""
 
     def __init__(self) -> None:
         # Common patterns for identifying banned imports/libraries
-        self.ban_patterns = [
-            # "Don't use X", "Avoid X", "Ban X"
-            r"(?i)(?:don't\s+use|avoid|ban|deprecated?)\s+([a-zA-Z0-9\-_@/]+)",
-            # "Use Y instead of X"
-            r"(?i)use\s+([a-zA-Z0-9\-_@/]+)\s+instead\s+of\s+([a-zA-Z0-9\-_@/]+)",
-            # "Replace X with Y"
-            r"(?i)replace\s+([a-zA-Z0-9\-_@/]+)\s+with\s+([a-zA-Z0-9\-_@/]+)",
-            # "No longer use X"
-            r"(?i)no\s+longer\s+use\s+([a-zA-Z0-9\-_@/]+)",
-        ]
+        self.ban_pattern = _BAN_PATTERN
+        self.preference_patterns = _PREFERENCE_PATTERNS
 
         # Common library name mappings
         self.library_mappings = {
@@ -189,38 +245,55 @@ class ESLintRuleExtractor:
         if adr.front_matter.status != ADRStatus.ACCEPTED:
             return rules
 
-        content = f"{adr.front_matter.title} {adr.content}".lower()
-
-        # Extract banned imports using patterns
-        for pattern in self.ban_patterns:
-            matches = re.findall(pattern, content)
-            for match in matches:
-                if isinstance(match, tuple):
-                    # Pattern with replacement (e.g., "use Y instead of X")
-                    if len(match) == 2:
-                        preferred, banned = match
-                        banned_lib = self._normalize_library_name(banned.strip())
-                        preferred_lib = self._normalize_library_name(preferred.strip())
-
-                        if banned_lib:
-                            rules["banned_imports"].append(banned_lib)
-                            if preferred_lib:
-                                rules["preferred_imports"][banned_lib] = preferred_lib
-                else:
-                    # Simple ban pattern
-                    banned_lib = self._normalize_library_name(match.strip())
-                    if banned_lib:
-                        rules["banned_imports"].append(banned_lib)
-
-        # Check for frontend-specific rules
-        if "frontend" in (adr.front_matter.tags or []):
-            rules.update(self._extract_frontend_rules(content))
-
-        # Check for backend-specific rules
-        if any(
-            tag in (adr.front_matter.tags or []) for tag in ["backend", "api", "server"]
-        ):
-            rules.update(self._extract_backend_rules(content))
+        content = f"{adr.front_matter.title} {adr.content}".lower().translate(
+            _MARKDOWN_MARKERS
+        )
+
+        # Extract (banned, preferred) library names; repeated mentions of a
+        # library are recorded once, in first-seen order
+        mentions: list[tuple[str, str | None]] = []
+        if any(anchor in content for anchor in _BAN_ANCHORS):
+            mentions.extend(
+                (match.group(f"{match.lastgroup}_old"), None)
+                for match in self.ban_pattern.finditer(content)
+            )
+            # Patterns with a replacement (e.g., "use Y instead of X")
+            for pattern in self.preference_patterns:
+                mentions.extend(
+                    (match.group("old"), match.group("new"))
+                    for match in pattern.finditer(content)
+                )
+
+        seen_banned: set[str] = set()
+        for banned_name, preferred_name in mentions:
+            banned_lib = self._normalize_library_name(banned_name)
+            if not banned_lib:
+                continue
+
+            if banned_lib not in seen_banned:
+                seen_banned.add(banned_lib)
+                banned_imports.append(banned_lib)
+
+            if preferred_name is not None:
+                preferred_lib = self._normalize_library_name(preferred_name)
+                if preferred_lib:
+                    preferred_imports[banned_lib] = preferred_lib
+
+        tags = set(adr.front_matter.tags or ())
+        is_frontend = "frontend" in tags
+        is_backend = not tags.isdisjoint(_BACKEND_TAGS)
+
+        if is_frontend or is_backend:
+            # Both tag-specific extractors need this, so scan for it only once
+            discouraged = "don't" in content or "avoid" in content
+
+            # Check for frontend-specific rules
+            if is_frontend:
+                custom_rules.extend(self._extract_frontend_rules(content, discouraged))
+
+            # Check for backend-specific rules
+            if is_backend:
+                custom_rules.extend(self._extract_backend_rules(content, discouraged))
 
         return rules
 
@@ -229,58 +302,108 @@ class ESLintRuleExtractor:
         name = name.lower().strip()
 
         # Check direct mappings
-        if name in self.library_mappings:
-            return self.library_mappings[name]
+        mapped = self.library_mappings.get(name)
+        if mapped:
+            return mapped
 
         # Skip common words that aren't libraries
-        skip_words = {
-            "the",
-            "a",
-            "an",
-            "and",
-            "or",
-            "but",
-            "in",
-            "on",
-            "at",
-            "to",
-            "for",
-            "of",
-            "with",
-            "by",
-        }
-        if name in skip_words or len(name) < 2:
+        if name in _SKIP_WORDS or len(name) < 2:
             return None
 
         # Basic validation - should look like a library name
-        if re.match(r"^[a-zA-Z0-9\-_@/]+$", name):
+        if _LIBRARY_NAME_CHARS.issuperset(name):
             return name
 
         return None
 
-    def _extract_frontend_rules(self, content: str) -> dict[str, Any]:
-        """Extract frontend-specific ESLint rules."""
-        rules: dict[str, list[dict[str, str]]] = {"custom_rules": []}
+    def _extract_frontend_rules(
+        self, content: str, discouraged: bool
+    ) -> list[dict[str, str]]:
+        """Extract frontend-specific ESLint rules.
 
+        Args:
+            content: Lowercased ADR title and body
+            discouraged: Whether the content says "don't" or "avoid"
+        """
         # React-specific patterns
-        if "react" in content:
-            if "hooks" in content and ("don't" in content or "avoid" in content):
-                rules["custom_rules"].append(
-                    {"rule": "react-hooks/rules-of-hooks", "severity": "error"}
-                )
+        if discouraged and "react" in content and "hooks" in content:
+            return [{"rule": "react-hooks/rules-of-hooks", "severity": "error"}]
 
-        return rules
+        return []
 
-    def _extract_backend_rules(self, content: str) -> dict[str, Any]:
-        """Extract backend-specific ESLint rules."""
-        rules: dict[str, list[dict[str, str]]] = {"custom_rules": []}
+    def _extract_backend_rules(
+        self, content: str, discouraged: bool
+    ) -> list[dict[str, str]]:
+        """Extract backend-specific ESLint rules.
 
-        # Node.js specific patterns
-        if "node" in content or "nodejs" in content:
-            if "synchronous" in content and ("don't" in content or "avoid" in content):
-                rules["custom_rules"].append({"rule": "no-sync", "severity": "error"})
+        Args:
+            content: Lowercased ADR title and body
+            discouraged: Whether the content says "don't" or "avoid"
+        """
+        # Node.js specific patterns ("node" also covers "nodejs")
+        if discouraged and "node" in content and "synchronous" in content:
+            return [{"rule": "no-sync", "severity": "error"}]
 
-        return rules
+        return []
+
+
+# Legacy extraction results, keyed by file path. Bump the version whenever the
+# extraction logic changes so stale results are discarded.
+RULES_CACHE_PATH = Path(".project-index/eslint-rules-cache.json")
+_RULES_CACHE_VERSION = 1
+
+
+def _load_rules_cache(cache_path: Path) -> dict[str, Any]:
+    """Load cached legacy extraction results, or an empty cache."""
+    try:
+        data = json.loads(cache_path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
+
+    if not isinstance(data, dict) or data.get("version") != _RULES_CACHE_VERSION:
+        return {}
+    entries = data.get("entries")
+    return entries if isinstance(entries, dict) else {}
+
+
+def _save_rules_cache(cache_path: Path, entries: dict[str, Any]) -> None:
+    """Write legacy extraction results; caching is best effort."""
+    live_entries = {
+        path: entry for path, entry in entries.items() if Path(path).exists()
+    }
+
+    try:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        cache_path.write_text(
+            json.dumps({"version": _RULES_CACHE_VERSION, "entries": live_entries}),
+            encoding="utf-8",
+        )
+    except OSError:
+        pass
+
+
+def _dumps_config(config: Any) -> str:
+    """Serialize a config as two-space indented JSON, keeping non-ASCII as-is."""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(config, option=orjson.OPT_INDENT_2).decode("utf-8")
+    return json.dumps(config, indent=2, ensure_ascii=False)
+
+
+def _extract_legacy_banned_imports(
+    extractor: "ESLintRuleExtractor", file_path: Path
+) -> list[str]:
+    """Extract banned imports from an ADR without a structured import policy."""
+    adr = parse_adr_file(file_path, strict=False)
+    if not adr or adr.front_matter.status != ADRStatus.ACCEPTED:
+        return []
+
+    # Skip if already has structured policy
+    if adr.front_matter.policy and adr.front_matter.policy.imports:
+        return []
+
+    # Use pattern extraction for legacy ADRs
+    banned: list[str] = extractor.extract_from_adr(adr)["banned_imports"]
+    return banned
 
 
 def generate_eslint_config(adr_directory: Path | str = "docs/adr") -> str:
@@ -294,6 +417,14 @@ def generate_eslint_config(adr_directory: Path | str = "docs/adr") -> str:
     Returns:
         JSON string with ESLint configuration
     """
+    return _generate_eslint_config(
+        str(adr_directory), adr_directory_fingerprint(adr_directory)
+    )
+
+
+@lru_cache(maxsize=32)
+def _generate_eslint_config(adr_directory: str, fingerprint: str) -> str:
+    """Build the ESLint config; memoized until the ADR files change."""
     # Use structured policy generator (primary)
     structured_generator = StructuredESLintGenerator()
     config = structured_generator.generate_eslint_config(str(adr_directory))
@@ -305,29 +436,46 @@ def generate_eslint_config(adr_directory: Path | str = "docs/adr") -> str:
     additional_banned = set()
     adr_files = find_adr_files(adr_directory)
 
+    use_cache = is_cache_enabled()
+    cache = _load_rules_cache(RULES_CACHE_PATH) if use_cache else {}
+    cache_dirty = False
+
     for file_path in adr_files:
         try:
-            adr = parse_adr_file(file_path, strict=False)
-            if not adr or adr.front_matter.status != ADRStatus.ACCEPTED:
+            stat = file_path.stat()
+            key = str(file_path.resolve())
+            entry = cache.get(key)
+            if (
+                entry
+                and entry["mtime_ns"] == stat.st_mtime_ns
+                and entry["size"] == stat.st_size
+            ):
+                additional_banned.update(entry["banned_imports"])
                 continue
 
-            # Skip if already has structured policy
-            if adr.front_matter.policy and adr.front_matter.policy.imports:
-                continue
+            banned = _extract_legacy_banned_imports(extractor, file_path)
+            additional_banned.update(banned)
 
-            # Use pattern extraction for legacy ADRs
-            rules = extractor.extract_from_adr(adr)
-            additional_banned.update(rules["banned_imports"])
+            if use_cache:
+                cache[key] = {
+                    "mtime_ns": stat.st_mtime_ns,
+                    "size": stat.st_size,
+                    "banned_imports": banned,
+                }
+                cache_dirty = True
 
-        except ParseError:
+        except (OSError, ParseError):
             continue
 
+    if cache_dirty:
+        _save_rules_cache(RULES_CACHE_PATH, cache)
+
     # Merge additional pattern-based rules into structured config
     if additional_banned and "no-restricted-imports" in config["rules"]:
         existing_paths = config["rules"]["no-restricted-imports"][1]["paths"]
         existing_names = {item["name"] for item in existing_paths}
 
-        for lib in additional_banned:
+        for lib in sorted(additional_banned):
             if lib not in existing_names:
                 existing_paths.append(
                     {
@@ -338,7 +486,7 @@ def generate_eslint_config(adr_directory: Path | str = "docs/adr") -> str:
     elif additional_banned:
         # No structured rules, use pattern-based only
         banned_patterns = []
-        for lib in additional_banned:
+        for lib in sorted(additional_banned):
             banned_patterns.append(
                 {
                     "name": lib,
@@ -348,7 +496,7 @@ def generate_eslint_config(adr_directory: Path | str = "docs/adr") -> str:
         config["rules"]["no-restricted-imports"] = ["error", {"paths": banned_patterns}]
 
     # Return the enhanced configuration as JSON
-    return json.dumps(config, indent=2)
+    return _dumps_config(config)
 
 
 def generate_eslint_config_from_contract(constraints: Any) -> ESLintConfig:
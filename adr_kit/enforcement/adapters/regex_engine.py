@@ -0,0 +1,38 @@
+"""Regex engine selection for legacy ADR phrase extraction.
+
+Design decisions:
+- Prefer google-re2 (linear-time automaton, no catastrophic backtracking) when installed
+- Fall back to the stdlib re engine, which accepts the same pattern subset
+- Patterns compiled here must stay within RE2 syntax: no backreferences or lookaround
+- Flags are written inline (e.g. "(?i)") since both engines understand them
+"""
+
+import re
+from typing import Any
+
+try:
+    import re2
+
+    RE2_AVAILABLE = True
+except ImportError:
+    RE2_AVAILABLE = False
+
+
+def compile_pattern(pattern: str) -> Any:
+    """Compile a pattern with RE2 when available, otherwise with re.
+
+    Args:
+        pattern: Regular expression restricted to the RE2-compatible subset
+
+    Returns:
+        Compiled pattern object with a re-compatible finditer/search API
+    """
+    if RE2_AVAILABLE:
+        options = re2.Options()
+        options.log_errors = False
+        try:
+            return re2.compile(pattern, options)
+        except re2.error:
+            pass  # Unsupported by RE2, use the backtracking engine instead
+
+    return re.compile(pattern)
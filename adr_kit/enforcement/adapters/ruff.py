@@ -5,10 +5,13 @@ Design decisions:
 - Create import-linter rules to enforce architectural boundaries
 - Support common Python library migration patterns
 - Generate rules for deprecated packages based on superseded ADRs
+- Memoize generated configs per directory until an ADR file's name, mtime or
+  size changes, so repeated exports skip parsing entirely
 """
 
 import configparser
 import re
+from functools import lru_cache
 from io import StringIO
 from pathlib import Path
 from typing import Any
@@ -17,9 +20,53 @@ import toml
 
 from ...contract.models import MergedConstraints
 from ...core.model import ADR, ADRStatus
-from ...core.parse import ParseError, find_adr_files, parse_adr_file
+from ...core.parse import (
+    ParseError,
+    adr_directory_fingerprint,
+    find_adr_files,
+    parse_adr_file,
+)
 from ..clause_kinds import ClauseKind, EnforcementStage, OutputMode
 from .base import BaseAdapter, ConfigFragment
+from .regex_engine import compile_pattern
+
+_PYTHON_LIBRARY = r"[a-zA-Z0-9\-_]+"
+
+# Phrases that mark a library as banned in legacy (unstructured) ADRs. The
+# outer named group of each alternative tells which phrase matched
+# (Match.lastgroup). Compiled with RE2 when installed, so matching stays
+# linear in the ADR length.
+_PYTHON_BAN_PATTERN = compile_pattern(
+    r"(?i)"
+    rf"(?P<ban>(?:don't\s+use|avoid|ban|deprecated?)\s+(?P<ban_old>{_PYTHON_LIBRARY}))"
+    rf"|(?P<no_longer>no\s+longer\s+use\s+(?P<no_longer_old>{_PYTHON_LIBRARY}))"
+)
+
+# Phrases that name a replacement as well, scanned one at a time because an
+# alternation drops overlapping matches ("avoid use Y instead of X")
+_PYTHON_PREFERENCE_PATTERNS = (
+    compile_pattern(
+        rf"(?i)use\s+(?P<new>{_PYTHON_LIBRARY})\s+instead\s+of\s+(?P<old>{_PYTHON_LIBRARY})"
+    ),
+    compile_pattern(
+        rf"(?i)replace\s+(?P<old>{_PYTHON_LIBRARY})\s+with\s+(?P<new>{_PYTHON_LIBRARY})"
+    ),
+)
+
+# Every ban and preference phrase contains one of these words, so content
+# without any of them can skip the regexes (substring checks are far cheaper)
+_BAN_ANCHORS = ("use", "avoid", "ban", "deprecate", "replace")
+
+# Markdown emphasis/code markers that would otherwise hide library names
+_MARKDOWN_MARKERS = str.maketrans("", "", "*`")
+_PYTHON_MODULE_NAME_PATTERN = re.compile(r"[a-zA-Z][a-zA-Z0-9_]*\Z")
+# Common words the ban phrases can capture that are never library names
+_SKIP_WORDS = frozenset(
+    "the a an and or but in on at to for of with by avoid use replace".split()
+)
+_DOMAIN_INFRA_PATTERN = re.compile(
+    r"domain.*should not.*depend.*infrastructure", re.IGNORECASE
+)
 
 
 class PythonRuleExtractor:
@@ -27,12 +74,8 @@ class PythonRuleExtractor:
 
     def __init__(self) -> None:
         # Common patterns for Python library decisions
-        self.python_ban_patterns = [
-            r"(?i)(?:don't\s+use|avoid|ban|deprecated?)\s+([a-zA-Z0-9\-_]+)",
-            r"(?i)use\s+([a-zA-Z0-9\-_]+)\s+instead\s+of\s+([a-zA-Z0-9\-_]+)",
-            r"(?i)replace\s+([a-zA-Z0-9\-_]+)\s+with\s+([a-zA-Z0-9\-_]+)",
-            r"(?i)no\s+longer\s+use\s+([a-zA-Z0-9\-_]+)",
-        ]
+        self.python_ban_pattern = _PYTHON_BAN_PATTERN
+        self.python_preference_patterns = _PYTHON_PREFERENCE_PATTERNS
 
         # Python library mappings
         self.python_libraries = {
@@ -69,29 +112,39 @@ class PythonRuleExtractor:
         if adr.front_matter.status != ADRStatus.ACCEPTED:
             return rules
 
-        content = f"{adr.front_matter.title} {adr.content}".lower()
+        content = f"{adr.front_matter.title} {adr.content}".lower().translate(
+            _MARKDOWN_MARKERS
+        )
         tags = adr.front_matter.tags or []
 
-        # Extract banned Python imports
-        for pattern in self.python_ban_patterns:
-            matches = re.findall(pattern, content)
-            for match in matches:
-                if isinstance(match, tuple):
-                    if len(match) == 2:
-                        preferred, banned = match
-                        banned_lib = self._normalize_python_library(banned.strip())
-                        preferred_lib = self._normalize_python_library(
-                            preferred.strip()
-                        )
-
-                        if banned_lib:
-                            rules["banned_imports"].append(banned_lib)
-                            if preferred_lib:
-                                rules["preferred_imports"][banned_lib] = preferred_lib
-                else:
-                    banned_lib = self._normalize_python_library(match.strip())
-                    if banned_lib:
-                        rules["banned_imports"].append(banned_lib)
+        # Extract (banned, preferred) Python library names; repeated mentions
+        # of a library are recorded once, in first-seen order
+        mentions: list[tuple[str, str | None]] = []
+        if any(anchor in content for anchor in _BAN_ANCHORS):
+            mentions.extend(
+                (match.group(f"{match.lastgroup}_old"), None)
+                for match in self.python_ban_pattern.finditer(content)
+            )
+            for pattern in self.python_preference_patterns:
+                mentions.extend(
+                    (match.group("old"), match.group("new"))
+                    for match in pattern.finditer(content)
+                )
+
+        seen_banned: set[str] = set()
+        for banned_name, preferred_name in mentions:
+            banned_lib = self._normalize_python_library(banned_name)
+            if not banned_lib:
+                continue
+
+            if banned_lib not in seen_banned:
+                seen_banned.add(banned_lib)
+                rules["banned_imports"].append(banned_lib)
+
+            if preferred_name is not None:
+                preferred_lib = self._normalize_python_library(preferred_name)
+                if preferred_lib:
+                    rules["preferred_imports"][banned_lib] = preferred_lib
 
         # Extract architectural rules
         if "architecture" in tags or "layering" in tags:
@@ -113,27 +166,11 @@ class PythonRuleExtractor:
             return self.python_libraries[name]
 
         # Skip common words
-        skip_words = {
-            "the",
-            "a",
-            "an",
-            "and",
-            "or",
-            "but",
-            "in",
-            "on",
-            "at",
-            "to",
-            "for",
-            "of",
-            "with",
-            "by",
-        }
-        if name in skip_words or len(name) < 2:
+        if name in _SKIP_WORDS or len(name) < 2:
             return None
 
         # Basic validation for Python module names
-        if re.match(r"^[a-zA-Z][a-zA-Z0-9_]*$", name):
+        if _PYTHON_MODULE_NAME_PATTERN.match(name):
             return name
 
         return None
@@ -147,8 +184,7 @@ class PythonRuleExtractor:
         # Look for layer separation rules
         if "layer" in content or "boundary" in content:
             # Example: "Domain layer should not depend on infrastructure"
-            domain_infra_pattern = r"domain.*should not.*depend.*infrastructure"
-            if re.search(domain_infra_pattern, content, re.IGNORECASE):
+            if _DOMAIN_INFRA_PATTERN.search(content):
                 rules.append(
                     {
                         "name": f"domain-infra-separation-{adr.front_matter.id.lower()}",
@@ -202,6 +238,14 @@ def generate_ruff_config(adr_directory: Path | str = "docs/adr") -> str:
     Returns:
         TOML string with Ruff configuration
     """
+    return _generate_ruff_config(
+        str(adr_directory), adr_directory_fingerprint(adr_directory)
+    )
+
+
+@lru_cache(maxsize=32)
+def _generate_ruff_config(adr_directory: str, fingerprint: str) -> str:
+    """Build the Ruff config; memoized until the ADR files change."""
     extractor = PythonRuleExtractor()
 
     # Find and parse all ADRs
@@ -236,7 +280,7 @@ def generate_ruff_config(adr_directory: Path | str = "docs/adr") -> str:
 
     # Add banned imports if any
     if all_banned_imports:
-        banned_list = list(all_banned_imports)
+        banned_list = sorted(all_banned_imports)
         ruff_config["flake8-import-conventions"] = {"banned-imports": banned_list}
 
         # Add custom error messages
@@ -297,6 +341,14 @@ def generate_import_linter_config(adr_directory: Path | str = "docs/adr") -> str
     Returns:
         INI string with import-linter configuration
     """
+    return _generate_import_linter_config(
+        str(adr_directory), adr_directory_fingerprint(adr_directory)
+    )
+
+
+@lru_cache(maxsize=32)
+def _generate_import_linter_config(adr_directory: str, fingerprint: str) -> str:
+    """Build the import-linter config; memoized until the ADR files change."""
     extractor = PythonRuleExtractor()
 
     # Find and parse all ADRs
@@ -25,6 +25,8 @@ if TYPE_CHECKING:
     from .adapters.base import ConfigFragment
     from .pipeline import EnforcementConflict
 
+_ADR_ID_REFERENCE_PATTERN = re.compile(r"ADR-\d+")
+
 
 class ConflictDetector:
     """Detects conflicts in the enforcement pipeline.
@@ -69,8 +71,9 @@ class ConflictDetector:
         # Python import disallow vs existing import prefer
         if new_policy.python and new_policy.python.disallow_imports:
             if contract.constraints.imports and contract.constraints.imports.prefer:
+                existing_prefer = frozenset(contract.constraints.imports.prefer)
                 for item in new_policy.python.disallow_imports:
-                    if item in contract.constraints.imports.prefer:
+                    if item in existing_prefer:
                         source = contract._find_provenance_for_rule(
                             f"imports.prefer.{item}"
                         )
@@ -297,4 +300,4 @@ class ConflictDetector:
     @staticmethod
     def _extract_adr_ids(text: str) -> list[str]:
         """Extract ADR-NNNN identifiers from a conflict description string."""
-        return sorted(set(re.findall(r"ADR-\d+", text)))
+        return sorted(set(_ADR_ID_REFERENCE_PATTERN.findall(text)))
@@ -5,6 +5,7 @@ Design decisions:
 - Include summary data with relationships between ADRs
 - Support filtering and searching via the index
 - Maintain compatibility with Log4brains and other tools
+- Serialize with orjson when installed (writes bytes directly), else stdlib json
 """
 
 import json
@@ -12,9 +13,16 @@ from datetime import date, datetime
 from pathlib import Path
 from typing import Any
 
+try:
+    import orjson
+
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 from ..core.model import ADR, ADRStatus
 from ..core.parse import ParseError, find_adr_files, parse_adr_file
-from ..core.validate import validate_adr_file
+from ..core.validate import ValidationResult, parse_and_validate_all
 
 
 class IndexEntry:
@@ -50,12 +58,14 @@ class IndexEntry:
         # Remove markdown headers and get first paragraph
         lines = self.adr.content.split("\n")
         content_lines = []
+        joined_length = -1  # len(" ".join(content_lines)), kept as lines are added
 
         for line in lines:
             line = line.strip()
             if line and not line.startswith("#"):
                 content_lines.append(line)
-                if len(" ".join(content_lines)) > max_length:
+                joined_length += len(line) + 1
+                if joined_length > max_length:
                     break
 
         preview = " ".join(content_lines)
@@ -73,40 +83,44 @@ class ADRIndex:
         self.entries: list[IndexEntry] = []
         self.metadata: dict[str, Any] = {}
 
-    def build_index(self, validate: bool = True) -> None:
+    def build_index(
+        self,
+        validate: bool = True,
+        validated: list[tuple[Path, ValidationResult]] | None = None,
+    ) -> None:
         """Build the ADR index from files in the directory.
 
         Args:
             validate: If True, only include valid ADRs in the index
+            validated: Results from parse_and_validate_all to reuse instead of
+                validating the directory again
         """
         self.entries = []
         errors = []
 
-        adr_files = find_adr_files(self.adr_directory)
-
-        for file_path in adr_files:
-            try:
-                if validate:
-                    # Validate the ADR first
-                    result = validate_adr_file(file_path)
-                    if not result.is_valid:
-                        errors.append(
-                            {
-                                "file": str(file_path),
-                                "errors": [str(issue) for issue in result.errors],
-                            }
-                        )
-                        continue
-                    adr = result.adr
-                else:
+        if validate:
+            if validated is None:
+                validated = parse_and_validate_all(self.adr_directory)
+            for file_path, result in validated:
+                if not result.is_valid:
+                    errors.append(
+                        {
+                            "file": str(file_path),
+                            "errors": [str(issue) for issue in result.errors],
+                        }
+                    )
+                    continue
+                if result.adr:
+                    self.entries.append(IndexEntry(result.adr))
+        else:
+            for file_path in find_adr_files(self.adr_directory):
+                try:
                     # Just parse without validation
                     adr = parse_adr_file(file_path, strict=False)
-
-                if adr:
-                    self.entries.append(IndexEntry(adr))
-
-            except ParseError as e:
-                errors.append({"file": str(file_path), "errors": [str(e)]})
+                    if adr:
+                        self.entries.append(IndexEntry(adr))
+                except ParseError as e:
+                    errors.append({"file": str(file_path), "errors": [str(e)]})
 
         # Sort entries by ID
         self.entries.sort(key=lambda entry: entry.adr.front_matter.id)
@@ -159,9 +173,7 @@ class ADRIndex:
         """
         output_file = Path(output_path)
         output_file.parent.mkdir(parents=True, exist_ok=True)
-
-        with open(output_file, "w", encoding="utf-8") as f:
-            json.dump(self.to_dict(), f, indent=indent, ensure_ascii=False)
+        output_file.write_bytes(_dump_json_bytes(self.to_dict(), indent))
 
     def filter_by_status(
         self, status: ADRStatus | str | list[ADRStatus | str]
@@ -177,12 +189,9 @@ class ADRIndex:
         if isinstance(status, str | ADRStatus):
             status = [status]
 
-        status_strings = []
-        for s in status:
-            if isinstance(s, ADRStatus):
-                status_strings.append(s.value)
-            else:
-                status_strings.append(str(s))
+        status_strings = {
+            s.value if isinstance(s, ADRStatus) else str(s) for s in status
+        }
 
         return [
             entry
@@ -202,21 +211,20 @@ class ADRIndex:
         Returns:
             Filtered list of index entries
         """
-        if isinstance(tags, str):
-            tags = [tags]
-
-        filtered = []
-        for entry in self.entries:
-            adr_tags = entry.adr.front_matter.tags or []
+        tag_set = frozenset([tags] if isinstance(tags, str) else tags)
 
-            if match_all:
-                if all(tag in adr_tags for tag in tags):
-                    filtered.append(entry)
-            else:
-                if any(tag in adr_tags for tag in tags):
-                    filtered.append(entry)
+        if match_all:
+            return [
+                entry
+                for entry in self.entries
+                if tag_set.issubset(entry.adr.front_matter.tags or ())
+            ]
 
-        return filtered
+        return [
+            entry
+            for entry in self.entries
+            if not tag_set.isdisjoint(entry.adr.front_matter.tags or ())
+        ]
 
     def find_by_id(self, adr_id: str) -> IndexEntry | None:
         """Find an ADR entry by ID.
@@ -233,11 +241,67 @@ class ADRIndex:
         return None
 
 
+def _json_default(obj: Any) -> str:
+    """Serialize values the JSON encoders don't handle natively."""
+    if isinstance(obj, date | datetime):
+        return obj.isoformat()
+    if isinstance(obj, Path):
+        return str(obj)
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def _dump_json_bytes(data: dict[str, Any], indent: int) -> bytes:
+    """Encode index data as UTF-8 JSON.
+
+    orjson only supports two-space indentation, so other indents use stdlib json.
+    """
+    if ORJSON_AVAILABLE and indent == 2:
+        return orjson.dumps(data, default=_json_default, option=orjson.OPT_INDENT_2)
+
+    return json.dumps(
+        data, indent=indent, ensure_ascii=False, default=_json_default
+    ).encode("utf-8")
+
+
+def load_index_paths(
+    index_path: Path | str, adr_directory: Path | str
+) -> dict[str, Path]:
+    """Map ADR IDs to files from a saved JSON index, if it is up to date.
+
+    Args:
+        index_path: Path of a JSON index written by generate_adr_index
+        adr_directory: Directory containing the indexed ADR files
+
+    Returns:
+        Dictionary of ADR ID to file path. Empty if the index is missing,
+        unreadable, or older than any ADR file in the directory.
+    """
+    index_file = Path(index_path)
+    try:
+        index_mtime = index_file.stat().st_mtime_ns
+        if any(
+            file_path.stat().st_mtime_ns > index_mtime
+            for file_path in find_adr_files(adr_directory)
+        ):
+            return {}
+
+        raw = index_file.read_bytes()
+        data = orjson.loads(raw) if ORJSON_AVAILABLE else json.loads(raw)
+        return {
+            entry["id"]: Path(entry["file_path"])
+            for entry in data["adrs"]
+            if entry.get("file_path")
+        }
+    except (OSError, ValueError, KeyError, TypeError):
+        return {}
+
+
 def generate_adr_index(
     adr_directory: Path | str = "docs/adr",
     output_path: Path | str = "docs/adr/adr-index.json",
     validate: bool = True,
     indent: int = 2,
+    validated: list[tuple[Path, ValidationResult]] | None = None,
 ) -> ADRIndex:
     """Generate and save ADR JSON index.
 
@@ -246,11 +310,12 @@ def generate_adr_index(
         output_path: Path where to save the JSON index
         validate: If True, validate ADRs before indexing
         indent: JSON indentation for pretty printing
+        validated: Results from parse_and_validate_all to reuse
 
     Returns:
         ADRIndex object with generated index
     """
     index = ADRIndex(adr_directory)
-    index.build_index(validate=validate)
+    index.build_index(validate=validate, validated=validated)
     index.save_to_file(output_path, indent=indent)
     return index
@@ -4,7 +4,8 @@ Design decisions:
 - Use SQLite for queryable ADR catalog with relational data
 - Store ADR metadata in structured tables for complex queries
 - Support ADR relationship tracking (supersedes/superseded_by)
-- Enable full-text search on ADR content
+- Enable full-text search on ADR content, ranked by FTS5's BM25 score
+- Rebuild in one transaction with relaxed durability (the index is derived data)
 """
 
 import sqlite3
@@ -14,7 +15,10 @@ from typing import Any
 
 from ..core.model import ADR, ADRStatus
 from ..core.parse import ParseError, find_adr_files, parse_adr_file
-from ..core.validate import validate_adr_file
+from ..core.validate import ValidationResult, parse_and_validate_all
+
+# Stored in PRAGMA user_version; bump when existing databases need migrating
+_SCHEMA_VERSION = 1
 
 
 class ADRSQLiteIndex:
@@ -29,6 +33,12 @@ class ADRSQLiteIndex:
         self.db_path.parent.mkdir(parents=True, exist_ok=True)
         self.connection = sqlite3.connect(str(self.db_path))
         self.connection.row_factory = sqlite3.Row  # Enable dict-like access
+        # The index is derived data that can always be rebuilt from the ADR
+        # files, so trade crash durability for write speed
+        self.connection.executescript(
+            "PRAGMA synchronous=OFF; PRAGMA journal_mode=MEMORY; "
+            "PRAGMA temp_store=MEMORY;"
+        )
         self._create_tables()
 
     def disconnect(self) -> None:
@@ -115,6 +125,11 @@ class ADRSQLiteIndex:
         cursor.execute("CREATE INDEX IF NOT EXISTS idx_adrs_status ON adrs (status)")
         cursor.execute("CREATE INDEX IF NOT EXISTS idx_adrs_date ON adrs (date)")
         cursor.execute("CREATE INDEX IF NOT EXISTS idx_adr_tags_tag ON adr_tags (tag)")
+        # Covers decider filters; the primary key only serves adr_id lookups
+        cursor.execute(
+            "CREATE INDEX IF NOT EXISTS idx_adr_deciders_decider"
+            " ON adr_deciders (decider, adr_id)"
+        )
         cursor.execute(
             "CREATE INDEX IF NOT EXISTS idx_adr_links_from ON adr_links (from_adr_id)"
         )
@@ -138,30 +153,46 @@ class ADRSQLiteIndex:
         """
         )
 
-        # Create triggers to keep FTS table in sync
-        cursor.execute(
+        # adr_fts is an external-content table keyed by the adrs rowid, so the
+        # triggers must pass rowids and remove old rows with the 'delete'
+        # command. Databases from before schema version 1 had triggers that
+        # left the index inconsistent after a rebuild; replace them once and
+        # rebuild the full-text index from the adrs table.
+        if cursor.execute("PRAGMA user_version").fetchone()[0] < _SCHEMA_VERSION:
+            for trigger in ("adr_fts_insert", "adr_fts_update", "adr_fts_delete"):
+                cursor.execute(f"DROP TRIGGER IF EXISTS {trigger}")
+
+            cursor.execute(
+                """
+                CREATE TRIGGER adr_fts_insert AFTER INSERT ON adrs BEGIN
+                    INSERT INTO adr_fts(rowid, id, title, content)
+                    VALUES (new.rowid, new.id, new.title, new.content);
+                END
             """
-            CREATE TRIGGER IF NOT EXISTS adr_fts_insert AFTER INSERT ON adrs BEGIN
-                INSERT INTO adr_fts(id, title, content) VALUES (new.id, new.title, new.content);
-            END
-        """
-        )
+            )
 
-        cursor.execute(
+            cursor.execute(
+                """
+                CREATE TRIGGER adr_fts_update AFTER UPDATE ON adrs BEGIN
+                    INSERT INTO adr_fts(adr_fts, rowid, id, title, content)
+                    VALUES ('delete', old.rowid, old.id, old.title, old.content);
+                    INSERT INTO adr_fts(rowid, id, title, content)
+                    VALUES (new.rowid, new.id, new.title, new.content);
+                END
             """
-            CREATE TRIGGER IF NOT EXISTS adr_fts_update AFTER UPDATE ON adrs BEGIN
-                UPDATE adr_fts SET title=new.title, content=new.content WHERE id=new.id;
-            END
-        """
-        )
+            )
 
-        cursor.execute(
+            cursor.execute(
+                """
+                CREATE TRIGGER adr_fts_delete AFTER DELETE ON adrs BEGIN
+                    INSERT INTO adr_fts(adr_fts, rowid, id, title, content)
+                    VALUES ('delete', old.rowid, old.id, old.title, old.content);
+                END
             """
-            CREATE TRIGGER IF NOT EXISTS adr_fts_delete AFTER DELETE ON adrs BEGIN
-                DELETE FROM adr_fts WHERE id=old.id;
-            END
-        """
-        )
+            )
+
+            cursor.execute("INSERT INTO adr_fts(adr_fts) VALUES ('rebuild')")
+            cursor.execute(f"PRAGMA user_version = {_SCHEMA_VERSION}")
 
         self.connection.commit()
 
@@ -170,13 +201,16 @@ class ADRSQLiteIndex:
         if not self.connection:
             raise RuntimeError("Database not connected")
 
-        cursor = self.connection.cursor()
+        self._clear_tables(self.connection.cursor())
+        self.connection.commit()
+
+    def _clear_tables(self, cursor: sqlite3.Cursor) -> None:
+        """Delete all ADR rows without committing."""
         cursor.execute("DELETE FROM adr_links")
         cursor.execute("DELETE FROM adr_tags")
         cursor.execute("DELETE FROM adr_deciders")
+        # The delete trigger removes the matching full-text rows
         cursor.execute("DELETE FROM adrs")
-        cursor.execute("DELETE FROM adr_fts")
-        self.connection.commit()
 
     def index_adr(self, adr: ADR) -> None:
         """Add or update a single ADR in the index.
@@ -187,7 +221,12 @@ class ADRSQLiteIndex:
         if not self.connection:
             raise RuntimeError("Database not connected")
 
-        cursor = self.connection.cursor()
+        self._write_adr(self.connection.cursor(), adr)
+        self.connection.commit()
+
+    def _write_adr(self, cursor: sqlite3.Cursor, adr: ADR) -> None:
+        """Insert or replace a single ADR's rows without committing."""
+        adr_id = adr.front_matter.id
 
         # Convert date to string
         date_str = (
@@ -204,15 +243,18 @@ class ADRSQLiteIndex:
         # Generate content preview
         content_preview = self._generate_content_preview(adr.content)
 
-        # Insert or update ADR record
+        # Replace the ADR record. REPLACE conflict resolution doesn't fire
+        # delete triggers, so remove the old row explicitly to keep adr_fts
+        # in sync.
+        cursor.execute("DELETE FROM adrs WHERE id = ?", (adr_id,))
         cursor.execute(
             """
-            INSERT OR REPLACE INTO adrs
+            INSERT INTO adrs
             (id, title, status, date, file_path, content, content_preview, updated_at)
             VALUES (?, ?, ?, ?, ?, ?, ?, ?)
         """,
             (
-                adr.front_matter.id,
+                adr_id,
                 adr.front_matter.title,
                 status_str,
                 date_str,
@@ -224,58 +266,47 @@ class ADRSQLiteIndex:
         )
 
         # Clear existing relationships for this ADR
-        cursor.execute(
-            "DELETE FROM adr_deciders WHERE adr_id = ?", (adr.front_matter.id,)
-        )
-        cursor.execute("DELETE FROM adr_tags WHERE adr_id = ?", (adr.front_matter.id,))
-        cursor.execute(
-            "DELETE FROM adr_links WHERE from_adr_id = ?", (adr.front_matter.id,)
-        )
+        cursor.execute("DELETE FROM adr_deciders WHERE adr_id = ?", (adr_id,))
+        cursor.execute("DELETE FROM adr_tags WHERE adr_id = ?", (adr_id,))
+        cursor.execute("DELETE FROM adr_links WHERE from_adr_id = ?", (adr_id,))
 
         # Insert deciders
-        if adr.front_matter.deciders:
-            for decider in adr.front_matter.deciders:
-                cursor.execute(
-                    "INSERT INTO adr_deciders (adr_id, decider) VALUES (?, ?)",
-                    (adr.front_matter.id, decider),
-                )
+        cursor.executemany(
+            "INSERT INTO adr_deciders (adr_id, decider) VALUES (?, ?)",
+            [(adr_id, decider) for decider in adr.front_matter.deciders or []],
+        )
 
         # Insert tags
-        if adr.front_matter.tags:
-            for tag in adr.front_matter.tags:
-                cursor.execute(
-                    "INSERT INTO adr_tags (adr_id, tag) VALUES (?, ?)",
-                    (adr.front_matter.id, tag),
-                )
-
-        # Insert supersedes relationships
-        if adr.front_matter.supersedes:
-            for superseded_id in adr.front_matter.supersedes:
-                cursor.execute(
-                    "INSERT INTO adr_links (from_adr_id, to_adr_id, link_type) VALUES (?, ?, ?)",
-                    (adr.front_matter.id, superseded_id, "supersedes"),
-                )
-
-        # Insert superseded_by relationships
-        if adr.front_matter.superseded_by:
-            for superseding_id in adr.front_matter.superseded_by:
-                cursor.execute(
-                    "INSERT INTO adr_links (from_adr_id, to_adr_id, link_type) VALUES (?, ?, ?)",
-                    (adr.front_matter.id, superseding_id, "superseded_by"),
-                )
+        cursor.executemany(
+            "INSERT INTO adr_tags (adr_id, tag) VALUES (?, ?)",
+            [(adr_id, tag) for tag in adr.front_matter.tags or []],
+        )
 
-        self.connection.commit()
+        # Insert supersedes and superseded_by relationships
+        links = [
+            (adr_id, superseded_id, "supersedes")
+            for superseded_id in adr.front_matter.supersedes or []
+        ] + [
+            (adr_id, superseding_id, "superseded_by")
+            for superseding_id in adr.front_matter.superseded_by or []
+        ]
+        cursor.executemany(
+            "INSERT INTO adr_links (from_adr_id, to_adr_id, link_type) VALUES (?, ?, ?)",
+            links,
+        )
 
     def _generate_content_preview(self, content: str, max_length: int = 200) -> str:
         """Generate a preview of ADR content."""
         lines = content.split("\n")
         content_lines = []
+        joined_length = -1  # len(" ".join(content_lines)), kept as lines are added
 
         for line in lines:
             line = line.strip()
             if line and not line.startswith("#"):
                 content_lines.append(line)
-                if len(" ".join(content_lines)) > max_length:
+                joined_length += len(line) + 1
+                if joined_length > max_length:
                     break
 
         preview = " ".join(content_lines)
@@ -285,61 +316,82 @@ class ADRSQLiteIndex:
         return preview
 
     def build_index(
-        self, adr_directory: Path | str = "docs/adr", validate: bool = True
+        self,
+        adr_directory: Path | str = "docs/adr",
+        validate: bool = True,
+        validated: list[tuple[Path, ValidationResult]] | None = None,
     ) -> dict[str, Any]:
         """Build the complete ADR index.
 
         Args:
             adr_directory: Directory containing ADR files
             validate: If True, validate ADRs before indexing
+            validated: Results from parse_and_validate_all to reuse instead of
+                validating the directory again
 
         Returns:
             Dictionary with indexing statistics
         """
         if not self.connection:
             self.connect()
+        if not self.connection:
+            raise RuntimeError("Database not connected")
 
-        self.clear_index()
-
-        adr_files = find_adr_files(adr_directory)
+        if validate:
+            if validated is None:
+                validated = parse_and_validate_all(adr_directory)
+            adr_files = [file_path for file_path, _ in validated]
+        else:
+            adr_files = find_adr_files(adr_directory)
         stats: dict[str, Any] = {
             "total_files": len(adr_files),
             "indexed": 0,
             "errors": [],
         }
 
-        for file_path in adr_files:
-            try:
-                if validate:
-                    result = validate_adr_file(file_path)
-                    if not result.is_valid:
-                        stats["errors"].append(
-                            {
-                                "file": str(file_path),
-                                "errors": [str(issue) for issue in result.errors],
-                            }
-                        )
-                        continue
-                    adr = result.adr
-                else:
+        # Parse/validate everything first so the write transaction stays short
+        adrs: list[tuple[Path, ADR]] = []
+        if validate and validated is not None:
+            for file_path, result in validated:
+                if not result.is_valid:
+                    stats["errors"].append(
+                        {
+                            "file": str(file_path),
+                            "errors": [str(issue) for issue in result.errors],
+                        }
+                    )
+                elif result.adr:
+                    adrs.append((file_path, result.adr))
+        else:
+            for file_path in adr_files:
+                try:
                     adr = parse_adr_file(file_path, strict=False)
-
-                if adr:
-                    self.index_adr(adr)
+                    if adr:
+                        adrs.append((file_path, adr))
+                except (ParseError, Exception) as e:
+                    stats["errors"].append({"file": str(file_path), "errors": [str(e)]})
+
+        # Rebuild in a single transaction instead of committing per ADR
+        with self.connection:
+            cursor = self.connection.cursor()
+            self._clear_tables(cursor)
+
+            for file_path, adr in adrs:
+                try:
+                    self._write_adr(cursor, adr)
                     stats["indexed"] += 1
+                except Exception as e:
+                    stats["errors"].append({"file": str(file_path), "errors": [str(e)]})
 
-            except (ParseError, Exception) as e:
-                stats["errors"].append({"file": str(file_path), "errors": [str(e)]})
-
-        # Update index metadata
-        self._update_metadata(stats, adr_directory)
+            # Update index metadata
+            self._update_metadata(stats, adr_directory)
 
         return stats
 
     def _update_metadata(
         self, stats: dict[str, Any], adr_directory: Path | str
     ) -> None:
-        """Update index metadata."""
+        """Update index metadata. The caller commits."""
         if not self.connection:
             raise RuntimeError("Database not connected")
 
@@ -351,13 +403,11 @@ class ADRSQLiteIndex:
             ("total_errors", str(len(stats["errors"]))),
         ]
 
-        for key, value in metadata:
-            cursor.execute(
-                "INSERT OR REPLACE INTO index_metadata (key, value, updated_at) VALUES (?, ?, ?)",
-                (key, value, datetime.now().isoformat()),
-            )
-
-        self.connection.commit()
+        updated_at = datetime.now().isoformat()
+        cursor.executemany(
+            "INSERT OR REPLACE INTO index_metadata (key, value, updated_at) VALUES (?, ?, ?)",
+            [(key, value, updated_at) for key, value in metadata],
+        )
 
     def query_adrs(
         self,
@@ -373,7 +423,8 @@ class ADRSQLiteIndex:
             status: Filter by status (single or multiple)
             tags: Filter by tags (single or multiple)
             deciders: Filter by deciders (single or multiple)
-            search_text: Full-text search in title/content
+            search_text: Full-text search in title/content; results are
+                ordered by relevance instead of ID
             limit: Maximum number of results
 
         Returns:
@@ -382,27 +433,41 @@ class ADRSQLiteIndex:
         if not self.connection:
             raise RuntimeError("Database not connected")
 
+        query, params = self._build_query(status, tags, deciders, search_text, limit)
         cursor = self.connection.cursor()
+        cursor.execute(query, params)
+        return [dict(row) for row in cursor.fetchall()]
 
-        # Build query
-        base_query = "SELECT DISTINCT a.* FROM adrs a"
+    @staticmethod
+    def _build_query(
+        status: str | list[str] | None,
+        tags: str | list[str] | None,
+        deciders: str | list[str] | None,
+        search_text: str | None,
+        limit: int | None,
+    ) -> tuple[str, list[Any]]:
+        """Build the SQL and parameters for query_adrs."""
+        base_query = "SELECT a.* FROM adrs a"
         conditions = []
-        params = []
+        params: list[Any] = []
 
-        # Join with tags table if needed
+        # Tag and decider filters are semi-joins, so an ADR matching several
+        # values comes back once without a DISTINCT pass over every column
         if tags:
-            base_query += " JOIN adr_tags at ON a.id = at.adr_id"
             tag_list = [tags] if isinstance(tags, str) else tags
             placeholders = ",".join(["?" for _ in tag_list])
-            conditions.append(f"at.tag IN ({placeholders})")
+            conditions.append(
+                f"a.id IN (SELECT adr_id FROM adr_tags WHERE tag IN ({placeholders}))"
+            )
             params.extend(tag_list)
 
-        # Join with deciders table if needed
         if deciders:
-            base_query += " JOIN adr_deciders ad ON a.id = ad.adr_id"
             decider_list = [deciders] if isinstance(deciders, str) else deciders
             placeholders = ",".join(["?" for _ in decider_list])
-            conditions.append(f"ad.decider IN ({placeholders})")
+            conditions.append(
+                "a.id IN (SELECT adr_id FROM adr_deciders"
+                f" WHERE decider IN ({placeholders}))"
+            )
             params.extend(decider_list)
 
         # Status filter
@@ -412,9 +477,9 @@ class ADRSQLiteIndex:
             conditions.append(f"a.status IN ({placeholders})")
             params.extend(status_list)
 
-        # Full-text search
+        # Full-text search, joined on the rowid adr_fts shares with adrs
         if search_text:
-            base_query += " JOIN adr_fts fts ON a.id = fts.id"
+            base_query += " JOIN adr_fts ON adr_fts.rowid = a.rowid"
             conditions.append("adr_fts MATCH ?")
             params.append(search_text)
 
@@ -422,13 +487,15 @@ class ADRSQLiteIndex:
         if conditions:
             base_query += " WHERE " + " AND ".join(conditions)
 
-        # Add ordering and limit
-        base_query += " ORDER BY a.id"
+        # Add ordering and limit; text matches come back best BM25 rank first
+        base_query += (
+            " ORDER BY adr_fts.rank, a.id" if search_text else " ORDER BY a.id"
+        )
         if limit:
-            base_query += f" LIMIT {limit}"
+            base_query += " LIMIT ?"
+            params.append(limit)
 
-        cursor.execute(base_query, params)
-        return [dict(row) for row in cursor.fetchall()]
+        return base_query, params
 
     def get_adr_relationships(self, adr_id: str) -> dict[str, list[str]]:
         """Get ADR relationships (supersedes/superseded_by).
@@ -501,6 +568,7 @@ def generate_sqlite_index(
     adr_directory: Path | str = "docs/adr",
     db_path: Path | str = ".project-index/catalog.db",
     validate: bool = True,
+    validated: list[tuple[Path, ValidationResult]] | None = None,
 ) -> dict[str, Any]:
     """Generate SQLite ADR index.
 
@@ -508,6 +576,7 @@ def generate_sqlite_index(
         adr_directory: Directory containing ADR files
         db_path: Path to SQLite database file
         validate: If True, validate ADRs before indexing
+        validated: Results from parse_and_validate_all to reuse
 
     Returns:
         Dictionary with indexing statistics
@@ -515,6 +584,6 @@ def generate_sqlite_index(
     index = ADRSQLiteIndex(db_path)
     try:
         index.connect()
-        return index.build_index(adr_directory, validate=validate)
+        return index.build_index(adr_directory, validate=validate, validated=validated)
     finally:
         index.disconnect()
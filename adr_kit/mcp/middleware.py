@@ -10,17 +10,48 @@ GitHub Issues:
 The middleware detects stringified JSON and parses it back to objects before
 Pydantic validation, making ADR Kit compatible with buggy clients while remaining
 forward-compatible with fixed clients.
+
+Design decisions:
+- Every tool call passes through here, so the stringified-JSON check peeks at the
+  first/last characters and only strips when the value has surrounding whitespace
+- Parse with orjson when installed, falling back to stdlib json for anything it
+  rejects (e.g. NaN or integers wider than 64 bits)
 """
 
 import json
 import logging
 from typing import Any
 
+try:
+    import orjson
+
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 from fastmcp.server.middleware import Middleware, MiddlewareContext
 
 logger = logging.getLogger(__name__)
 
 
+def _could_be_stringified_json(value: Any) -> bool:
+    """Cheap first-character check run before the full _is_stringified_json."""
+    if not isinstance(value, str) or not value:
+        return False
+    first = value[0]
+    return first == "{" or first == "[" or first.isspace()
+
+
+def _loads_json(value: str) -> Any:
+    """Parse a JSON string, preferring orjson when it is installed."""
+    if ORJSON_AVAILABLE:
+        try:
+            return orjson.loads(value)
+        except orjson.JSONDecodeError:
+            pass  # Let stdlib json accept it or raise the usual error
+    return json.loads(value)
+
+
 class StringifiedParameterFixMiddleware(Middleware):
     """Fix stringified JSON parameters from buggy MCP clients.
 
@@ -66,28 +97,42 @@ class StringifiedParameterFixMiddleware(Middleware):
             # Arguments are not a dict, can't process
             return await call_next(context)
 
-        # Check each argument for stringified JSON
+        if not any(_could_be_stringified_json(value) for value in arguments.values()):
+            # Fixed clients send objects as objects, so there is nothing to do
+            return await call_next(context)
+
+        # Per-parameter details are formatted only if a handler would emit them
+        log_fixes = self.debug and logger.isEnabledFor(logging.INFO)
+        log_types = log_fixes and logger.isEnabledFor(logging.DEBUG)
+
+        # Check each argument for stringified JSON. Only values are replaced,
+        # so the dict can be iterated directly without copying its items.
         fixed_count = 0
-        for key, value in list(arguments.items()):
-            if self._is_stringified_json(value):
-                try:
-                    parsed = json.loads(value)
-                    arguments[key] = parsed
-                    fixed_count += 1
-
-                    if self.debug:
-                        logger.info(
-                            f"Fixed stringified parameter '{key}' in tool '{context.message.name}'"
-                        )
-                        logger.debug(f"  Original type: {type(value).__name__}")
-                        logger.debug(f"  Parsed type: {type(parsed).__name__}")
-
-                except json.JSONDecodeError as e:
-                    # Looks like JSON but isn't valid, leave it as-is
-                    if self.debug:
-                        logger.warning(
-                            f"Parameter '{key}' looks like JSON but failed to parse: {e}"
-                        )
+        for key in arguments:
+            value = arguments[key]
+            if not self._is_stringified_json(value):
+                continue
+
+            try:
+                parsed = _loads_json(value)
+            except json.JSONDecodeError as e:
+                # Looks like JSON but isn't valid, leave it as-is
+                if self.debug:
+                    logger.warning(
+                        f"Parameter '{key}' looks like JSON but failed to parse: {e}"
+                    )
+                continue
+
+            arguments[key] = parsed
+            fixed_count += 1
+
+            if log_fixes:
+                logger.info(
+                    f"Fixed stringified parameter '{key}' in tool '{context.message.name}'"
+                )
+            if log_types:
+                logger.debug(f"  Original type: {type(value).__name__}")
+                logger.debug(f"  Parsed type: {type(parsed).__name__}")
 
         if fixed_count > 0:
             logger.info(
@@ -106,13 +151,16 @@ class StringifiedParameterFixMiddleware(Middleware):
         Returns:
             True if the value appears to be stringified JSON
         """
-        if not isinstance(value, str):
+        if not isinstance(value, str) or not value:
             return False
 
-        # Trim whitespace
-        trimmed = value.strip()
+        first, last = value[0], value[-1]
+        if first.isspace() or last.isspace():
+            # Only pay for a stripped copy when there is whitespace to trim
+            value = value.strip()
+            if not value:
+                return False
+            first, last = value[0], value[-1]
 
         # Check if it looks like a JSON object or array
-        return (trimmed.startswith("{") and trimmed.endswith("}")) or (
-            trimmed.startswith("[") and trimmed.endswith("]")
-        )
+        return (first == "{" and last == "}") or (first == "[" and last == "]")
@@ -4,11 +4,15 @@ This is the proper MCP server that provides clean agent-friendly interfaces
 while preserving all the sophisticated workflow automation and business logic.
 """
 
+import copy
 import logging
+from functools import lru_cache
 from typing import Any
 
 from fastmcp import FastMCP
 
+from ..core.parse import adr_directory_fingerprint
+
 # Import the full workflow system (this is where the real business logic lives)
 from ..decision.workflows.analyze import AnalyzeProjectWorkflow
 from ..decision.workflows.approval import ApprovalInput, ApprovalWorkflow
@@ -462,6 +466,21 @@ def adr_planning_context(request: PlanningContextRequest) -> dict[str, Any]:
         )
 
 
+@lru_cache(maxsize=8)
+def _build_index_data(adr_dir: str, fingerprint: str) -> dict[str, Any]:
+    """Build the index data for an ADR directory state.
+
+    The fingerprint is only part of the cache key; it changes whenever an ADR
+    file is added, removed or rewritten.
+    """
+    from ..index.json_index import ADRIndex
+
+    # Build in memory only; FastMCP serializes the returned data itself
+    adr_index = ADRIndex(adr_dir)
+    adr_index.build_index(validate=False)
+    return adr_index.to_dict()  # Return structured data, not JSON string
+
+
 # Resource for ADR index (proper structured data)
 @mcp.resource("adr://index")
 def adr_index_resource() -> dict[str, Any]:
@@ -469,14 +488,12 @@ def adr_index_resource() -> dict[str, Any]:
     Read-only access to ADR index with structured data.
     """
     try:
-        from ..index.json_index import generate_adr_index
-
-        # Use default ADR directory
+        # Unchanged ADR files yield the same fingerprint, so repeated reads
+        # reuse the last index instead of walking every ADR again. Each read
+        # gets its own copy so a caller mutating it can't corrupt the cache.
         adr_dir = "docs/adr"
-        adr_index = generate_adr_index(adr_directory=adr_dir, validate=False)
-        index_data = adr_index.to_dict()
-
-        return index_data  # Return structured data, not JSON string
+        index_data = _build_index_data(adr_dir, adr_directory_fingerprint(adr_dir))
+        return copy.deepcopy(index_data)
 
     except Exception as e:
         logger.error(f"ADR index resource failed: {e}")
@@ -500,34 +517,28 @@ def adr_individual_resource(adr_id: str) -> dict[str, Any]:
     field pointing here.
     """
     try:
-        from ..core.parse import find_adr_files, parse_adr_file
-
-        adr_dir = "docs/adr"
-        adr_files = find_adr_files(adr_dir)
-
-        for file_path in adr_files:
-            adr = parse_adr_file(file_path, strict=False)
-            if adr and adr.id == adr_id:
-                fm = adr.front_matter
-                return {
-                    "id": adr.id,
-                    "title": fm.title,
-                    "status": (
-                        fm.status.value
-                        if hasattr(fm.status, "value")
-                        else str(fm.status)
-                    ),
-                    "date": str(fm.date),
-                    "deciders": fm.deciders or [],
-                    "tags": fm.tags or [],
-                    "supersedes": fm.supersedes or [],
-                    "superseded_by": fm.superseded_by or [],
-                    "policy": (
-                        fm.policy.model_dump(exclude_none=True) if fm.policy else None
-                    ),
-                    "content": adr.content,
-                    "resource_uri": f"adr://{adr_id}",
-                }
+        from ..core.parse import find_adr_by_id
+
+        adr = find_adr_by_id("docs/adr", adr_id)
+        if adr is not None:
+            fm = adr.front_matter
+            return {
+                "id": adr.id,
+                "title": fm.title,
+                "status": (
+                    fm.status.value if hasattr(fm.status, "value") else str(fm.status)
+                ),
+                "date": str(fm.date),
+                "deciders": fm.deciders or [],
+                "tags": fm.tags or [],
+                "supersedes": fm.supersedes or [],
+                "superseded_by": fm.superseded_by or [],
+                "policy": (
+                    fm.policy.model_dump(exclude_none=True) if fm.policy else None
+                ),
+                "content": adr.content,
+                "resource_uri": f"adr://{adr_id}",
+            }
 
         return {
             "error": f"ADR {adr_id!r} not found in docs/adr",
@@ -545,6 +556,11 @@ def run_stdio_server() -> None:
     """Run the MCP server over stdio for agent integration."""
     import sys
 
+    from ..core.parse_cache import enable_memory_cache
+
+    # Tool calls re-read the ADR directory; only re-parse files that changed
+    enable_memory_cache()
+
     try:
         logger.info("Starting ADR Kit MCP Server with full workflow backend")
         mcp.run()
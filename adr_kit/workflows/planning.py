@@ -423,9 +423,8 @@ class PlanningWorkflow(BaseWorkflow):
         relevance += tag_matches * 0.3
 
         # Boost for title matches (titles are very specific)
-        title_matches = sum(
-            1 for keyword in task_keywords if keyword in adr.title.lower()
-        )
+        title = adr.title.lower()
+        title_matches = sum(1 for keyword in task_keywords if keyword in title)
         relevance += title_matches * 0.5
 
         return min(relevance, 1.0)  # Cap at 1.0
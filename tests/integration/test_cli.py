@@ -1,6 +1,8 @@
 """Tests for CLI functionality."""
 
 import json
+import subprocess
+import sys
 from pathlib import Path
 from tempfile import TemporaryDirectory
 from unittest.mock import patch
@@ -8,7 +10,8 @@ from unittest.mock import patch
 import pytest
 from typer.testing import CliRunner
 
-from adr_kit.cli import app
+from adr_kit import __main__ as entry
+from adr_kit.cli import app, get_next_adr_id
 from adr_kit.core.model import ADRStatus
 
 
@@ -42,6 +45,17 @@ class TestCLI:
         assert "Legacy CLI Mode" in result.output
         assert "MCP server" in result.output
 
+    def test_mcp_health_missing_module(self):
+        """Test adr-kit mcp-health reports modules it can't locate."""
+        with (
+            patch("adr_kit.cli.check_for_updates_async"),
+            patch("importlib.util.find_spec", return_value=None),
+        ):
+            result = self.runner.invoke(app, ["mcp-health"])
+
+        assert result.exit_code == 1
+        assert "No module named 'fastmcp'" in result.output
+
     def test_validate_command(self):
         """Test adr-kit validate command runs properly."""
         with TemporaryDirectory() as tmpdir:
@@ -98,9 +112,14 @@ Test decision."""
 
             result = self.runner.invoke(app, ["validate", "--adr-dir", str(adr_dir)])
 
-            # CLI exits with code 3 for validation failures, not 1
-            assert result.exit_code == 3  # Validation errors
-            assert "Validation failed" in result.output
+            # Schema errors are reported per file rather than aborting the run
+            assert result.exit_code == 1  # Validation errors
+            assert "❌ ADR-0001-invalid.md: Invalid" in result.output
+            assert "'INVALID-ID' does not match" in result.output
+            # Errors go to stderr; stdout keeps only the summary
+            assert "❌ ADR-0001-invalid.md: Invalid" in result.stderr
+            assert "Invalid" not in result.stdout
+            assert "Total ADRs: 1" in result.stdout
 
     def test_index_command(self):
         """Test adr-kit index command."""
@@ -202,3 +221,112 @@ Another decision with clear policy directives."""
 
             assert result.exit_code == 0
             assert "Total ADRs: 1" in result.stdout  # Only validated the specific ADR
+
+    def test_validate_specific_adr_with_mismatched_filename(self):
+        """Test --id falls back to front-matter IDs when filenames disagree."""
+        with TemporaryDirectory() as tmpdir:
+            adr_dir = Path(tmpdir) / "docs" / "adr"
+            adr_dir.mkdir(parents=True)
+
+            adr = """---
+id: ADR-0001
+title: Renamed ADR
+status: proposed
+date: 2025-09-03
+---
+
+# Decision
+
+The file was renamed after the ID was assigned."""
+
+            (adr_dir / "ADR-0005-renamed.md").write_text(adr)
+            (adr_dir / "ADR-0001-other.md").write_text(
+                adr.replace("ADR-0001", "ADR-0002")
+            )
+
+            result = self.runner.invoke(
+                app, ["validate", "--id", "ADR-0001", "--adr-dir", str(adr_dir)]
+            )
+            missing = self.runner.invoke(
+                app, ["validate", "--id", "ADR-0003", "--adr-dir", str(adr_dir)]
+            )
+
+            assert result.exit_code == 0
+            assert "Total ADRs: 1" in result.stdout
+            assert missing.exit_code == 3
+            assert "ADR with ID ADR-0003 not found" in missing.stderr
+
+    def test_get_next_adr_id_from_filenames(self):
+        """Test next ID is derived from filenames without parsing."""
+        with TemporaryDirectory() as tmpdir:
+            adr_dir = Path(tmpdir)
+
+            assert get_next_adr_id(adr_dir) == "ADR-0001"
+
+            # Content is deliberately unparseable: only the filename is used
+            (adr_dir / "ADR-0001-first.md").write_text("not an adr")
+            (adr_dir / "ADR-0007-seventh.md").write_text("not an adr")
+            (adr_dir / "README.md").write_text("# README")
+
+            assert get_next_adr_id(adr_dir) == "ADR-0008"
+
+    def test_cli_import_stays_lightweight(self):
+        """Test importing the CLI doesn't load core, index, MCP or rich modules."""
+        code = (
+            "import sys, adr_kit.cli; "
+            "print(' '.join(m for m in sys.modules if m.startswith("
+            "('adr_kit.core', 'adr_kit.index', 'adr_kit.mcp', 'fastmcp', 'rich'))))"
+        )
+        result = subprocess.run(
+            [sys.executable, "-c", code],
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+
+        assert result.stdout.strip() == ""
+
+
+class TestEntryPoint:
+    """Test the console entry point's stdio server fast path."""
+
+    @pytest.mark.parametrize(
+        "argv, expected",
+        [
+            (["adr-kit", "mcp-server"], True),
+            (["adr-kit", "mcp-server", "--stdio"], True),
+            (["adr-kit", "mcp-server", "--http"], False),
+            (["adr-kit", "mcp-server", "--help"], False),
+            (["adr-kit", "validate"], False),
+            (["adr-kit"], False),
+        ],
+    )
+    def test_is_stdio_server(self, argv, expected):
+        assert entry._is_stdio_server(argv) is expected
+
+    def test_stdio_server_skips_typer_app(self, monkeypatch):
+        monkeypatch.setattr("sys.argv", ["adr-kit", "mcp-server"])
+        with (
+            patch("adr_kit._update_check.check_for_updates_async"),
+            patch("adr_kit.mcp.server.run_stdio_server") as run_stdio_server,
+            patch("adr_kit.cli.app") as cli_app,
+        ):
+            entry.main()
+
+        run_stdio_server.assert_called_once_with()
+        cli_app.assert_not_called()
+
+    def test_update_check_does_not_import_typer(self):
+        code = (
+            "import sys, adr_kit._update_check; "
+            "print(' '.join(m for m in sys.modules "
+            "if m.startswith(('typer', 'click', 'adr_kit.cli'))))"
+        )
+        result = subprocess.run(
+            [sys.executable, "-c", code],
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+
+        assert result.stdout.strip() == ""
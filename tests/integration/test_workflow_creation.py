@@ -369,6 +369,39 @@ MySQL is reliable and well-supported.
         # At minimum, should complete and populate related_adrs field
         assert isinstance(creation_result.related_adrs, list)
 
+    def test_key_terms_cover_tech_names_and_long_words(self, temp_adr_dir):
+        """Test key term extraction from proposal text."""
+        workflow = CreationWorkflow(adr_dir=temp_adr_dir)
+
+        terms = workflow._extract_key_terms(
+            "Use PostgreSQL and React on AWS, not Java or JavaScript APIs."
+        )
+
+        assert {"postgresql", "react", "aws", "java", "javascript"} <= set(terms)
+        assert "apis" not in terms  # Not a whole-word tech term, too short
+        assert len(terms) == len(set(terms))
+
+    def test_related_adr_score_matches_reported_terms(self, temp_adr_dir, existing_adr):
+        """Test related ADRs report the terms their relevance score counts."""
+        workflow = CreationWorkflow(adr_dir=temp_adr_dir)
+        proposal = CreationInput(
+            title="Replace MySQL",
+            context="The database needs sharding.",
+            decision="Adopt CockroachDB.",
+            consequences="Migration work.",
+        )
+
+        related = workflow._find_related_adrs(proposal)
+        key_terms = workflow._extract_key_terms(
+            f"{proposal.title} {proposal.context} {proposal.decision}".lower()
+        )
+
+        assert [adr["adr_id"] for adr in related] == ["ADR-0001"]
+        assert {"mysql", "database"} <= set(related[0]["matching_terms"])
+        assert related[0]["relevance_score"] == len(related[0]["matching_terms"]) / len(
+            key_terms
+        )
+
     def test_date_setting(self, temp_adr_dir, sample_creation_input):
         """Test that ADR gets proper date setting."""
         workflow = CreationWorkflow(adr_dir=temp_adr_dir)
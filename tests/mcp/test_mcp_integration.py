@@ -408,6 +408,114 @@ class TestPlanningContext:
             assert "checklist" in data
 
 
+class TestIndividualResource:
+    """Test the adr://{adr_id} resource."""
+
+    @pytest.mark.anyio
+    @pytest.mark.parametrize("anyio_backend", ["asyncio"])
+    async def test_reads_adr_by_id(self, tmp_path, monkeypatch):
+        """Test that a broken sibling ADR doesn't hide the requested one."""
+        adr_dir = tmp_path / "docs" / "adr"
+        adr_dir.mkdir(parents=True)
+        (adr_dir / "ADR-0001-broken.md").write_text("no front-matter")
+        (adr_dir / "ADR-0002-postgres.md").write_text(
+            "---\nid: ADR-0002\ntitle: Use PostgreSQL\nstatus: accepted\n"
+            "date: 2025-09-03\n---\n\n## Decision\n\nUse PostgreSQL."
+        )
+        monkeypatch.chdir(tmp_path)
+
+        async with Client(mcp) as client:
+            result = await client.read_resource("adr://ADR-0002")
+            response = json.loads(result[0].text)
+
+        assert response["title"] == "Use PostgreSQL"
+        assert response["status"] == "accepted"
+        assert "Use PostgreSQL." in response["content"]
+
+
+class TestIndexResource:
+    """Test the adr://index resource."""
+
+    @pytest.mark.anyio
+    @pytest.mark.parametrize("anyio_backend", ["asyncio"])
+    async def test_reads_index_without_writing_it(self, tmp_path, monkeypatch):
+        """Test that reading the index leaves the ADR directory untouched."""
+        adr_dir = tmp_path / "docs" / "adr"
+        adr_dir.mkdir(parents=True)
+        (adr_dir / "ADR-0001-postgres.md").write_text(
+            "---\nid: ADR-0001\ntitle: Use PostgreSQL\nstatus: accepted\n"
+            "date: 2025-09-03\n---\n\n## Decision\n\nUse PostgreSQL."
+        )
+        monkeypatch.chdir(tmp_path)
+
+        async with Client(mcp) as client:
+            result = await client.read_resource("adr://index")
+            response = json.loads(result[0].text)
+
+        assert [adr["id"] for adr in response["adrs"]] == ["ADR-0001"]
+        assert response["metadata"]["total_adrs"] == 1
+        assert not (adr_dir / "adr-index.json").exists()
+
+    @pytest.mark.anyio
+    @pytest.mark.parametrize("anyio_backend", ["asyncio"])
+    async def test_unchanged_directory_reuses_index(self, tmp_path, monkeypatch):
+        """Test that repeated reads only rebuild the index after ADR edits."""
+        from adr_kit.index import json_index
+
+        adr_dir = tmp_path / "docs" / "adr"
+        adr_dir.mkdir(parents=True)
+        adr_text = (
+            "---\nid: {adr_id}\ntitle: Use PostgreSQL\nstatus: accepted\n"
+            "date: 2025-09-03\n---\n\n## Decision\n\nUse PostgreSQL."
+        )
+        (adr_dir / "ADR-0001-postgres.md").write_text(
+            adr_text.format(adr_id="ADR-0001")
+        )
+        monkeypatch.chdir(tmp_path)
+        builds = []
+        build_index = json_index.ADRIndex.build_index
+
+        def counting_build_index(self, *args, **kwargs):
+            builds.append(self.adr_directory)
+            return build_index(self, *args, **kwargs)
+
+        monkeypatch.setattr(json_index.ADRIndex, "build_index", counting_build_index)
+
+        async with Client(mcp) as client:
+            await client.read_resource("adr://index")
+            await client.read_resource("adr://index")
+            assert len(builds) == 1
+
+            (adr_dir / "ADR-0002-mysql.md").write_text(
+                adr_text.format(adr_id="ADR-0002")
+            )
+            result = await client.read_resource("adr://index")
+            response = json.loads(result[0].text)
+
+        assert len(builds) == 2
+        assert response["metadata"]["total_adrs"] == 2
+
+    def test_cached_index_is_not_shared_between_reads(self, tmp_path, monkeypatch):
+        """Test that mutating one read leaves later reads intact."""
+        from adr_kit.mcp import server
+
+        adr_dir = tmp_path / "docs" / "adr"
+        adr_dir.mkdir(parents=True)
+        (adr_dir / "ADR-0001-postgres.md").write_text(
+            "---\nid: ADR-0001\ntitle: Use PostgreSQL\nstatus: accepted\n"
+            "date: 2025-09-03\n---\n\n## Decision\n\nUse PostgreSQL."
+        )
+        monkeypatch.chdir(tmp_path)
+
+        first = server.adr_index_resource()
+        first["adrs"].clear()
+        first["metadata"]["total_adrs"] = 0
+        second = server.adr_index_resource()
+
+        assert [adr["id"] for adr in second["adrs"]] == ["ADR-0001"]
+        assert second["metadata"]["total_adrs"] == 1
+
+
 class TestEndToEndWorkflow:
     """Test complete ADR workflow."""
 
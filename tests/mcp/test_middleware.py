@@ -0,0 +1,82 @@
+"""Tests for the stringified-parameter fix middleware."""
+
+import asyncio
+import math
+from types import SimpleNamespace
+from typing import Any
+
+import pytest
+
+from adr_kit.mcp import middleware
+from adr_kit.mcp.middleware import StringifiedParameterFixMiddleware
+
+
+def _call_tool(arguments: dict[str, Any], debug: bool = False) -> dict[str, Any]:
+    """Run a tool call through the middleware and return the arguments seen."""
+    context = SimpleNamespace(
+        message=SimpleNamespace(name="adr_create", arguments=arguments)
+    )
+
+    async def call_next(ctx: Any) -> dict[str, Any]:
+        return ctx.message.arguments
+
+    return asyncio.run(
+        StringifiedParameterFixMiddleware(debug=debug).on_call_tool(context, call_next)
+    )
+
+
+class TestIsStringifiedJson:
+    """Test detection of JSON objects and arrays sent as strings."""
+
+    @pytest.mark.parametrize("value", ['{"a": 1}', "[1, 2]", '  {"a": 1}\n', "\t[]"])
+    def test_detects_json(self, value):
+        assert StringifiedParameterFixMiddleware()._is_stringified_json(value)
+
+    @pytest.mark.parametrize(
+        "value", ["", "   ", "ADR-0001", "{not closed", '{"a": 1]', 42, None]
+    )
+    def test_rejects_other_values(self, value):
+        assert not StringifiedParameterFixMiddleware()._is_stringified_json(value)
+
+
+class TestOnCallTool:
+    """Test argument rewriting on tool calls."""
+
+    def test_parses_stringified_arguments(self):
+        arguments = _call_tool(
+            {"title": "Use Postgres", "policy": '{"imports": {"disallow": ["mysql"]}}'}
+        )
+
+        assert arguments == {
+            "title": "Use Postgres",
+            "policy": {"imports": {"disallow": ["mysql"]}},
+        }
+
+    def test_plain_arguments_skip_the_json_check(self, monkeypatch):
+        def fail(*args, **kwargs):
+            raise AssertionError("argument checked for stringified JSON")
+
+        monkeypatch.setattr(
+            StringifiedParameterFixMiddleware, "_is_stringified_json", fail
+        )
+        arguments = {"adr_id": "ADR-0001", "force": True, "policy": {"a": 1}}
+
+        assert _call_tool(dict(arguments)) == arguments
+
+    def test_invalid_json_is_left_alone(self):
+        assert _call_tool({"note": "{oops}"}) == {"note": "{oops}"}
+
+    def test_stdlib_fallback_for_values_orjson_rejects(self):
+        assert math.isnan(_call_tool({"values": "[NaN]"})["values"][0])
+
+    def test_works_without_orjson(self, monkeypatch):
+        monkeypatch.setattr(middleware, "ORJSON_AVAILABLE", False)
+
+        assert _call_tool({"tags": '["db"]'}) == {"tags": ["db"]}
+
+    def test_fixes_are_logged_in_debug_mode(self, caplog):
+        with caplog.at_level("DEBUG", logger=middleware.__name__):
+            _call_tool({"tags": "[]"}, debug=True)
+
+        assert "Fixed stringified parameter 'tags'" in caplog.text
+        assert "Parsed type: list" in caplog.text
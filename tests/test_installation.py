@@ -109,7 +109,7 @@ class TestInstallation:
                 break
 
         assert adr_kit_entry is not None, "adr-kit entry point not found"
-        assert "adr_kit.cli:app" in adr_kit_entry.value
+        assert "adr_kit.__main__:main" in adr_kit_entry.value
 
     def test_import_main_module(self):
         """Test that main module can be imported."""
@@ -0,0 +1,64 @@
+"""Shared fixtures for unit tests."""
+
+from collections.abc import Callable, Sequence
+from pathlib import Path
+
+import pytest
+
+WriteADRs = Callable[..., list[Path]]
+
+
+def _flow_list(items: Sequence[str]) -> str:
+    return "[" + ", ".join(items) + "]"
+
+
+@pytest.fixture
+def write_adrs() -> WriteADRs:
+    """Return a factory writing ADR-0001..ADR-<count> into a directory.
+
+    Optional front-matter fields are only written when given. With
+    ``supersede_previous`` each ADR supersedes the one before it, and
+    ``broken`` adds a trailing file without front-matter.
+    """
+
+    def write(
+        adr_dir: Path,
+        count: int,
+        *,
+        title: str = "Decision {num}",
+        status: str = "proposed",
+        tags: Sequence[str] | None = None,
+        deciders: Sequence[str] | None = None,
+        supersede_previous: bool = False,
+        broken: bool = False,
+    ) -> list[Path]:
+        adr_dir.mkdir(parents=True, exist_ok=True)
+        paths = []
+        for num in range(1, count + 1):
+            adr_id = f"ADR-{num:04d}"
+            lines = [
+                "---",
+                f"id: {adr_id}",
+                f"title: {title.format(num=num)}",
+                f"status: {status}",
+                "date: 2025-09-03",
+            ]
+            if tags is not None:
+                lines.append(f"tags: {_flow_list(tags)}")
+            if deciders is not None:
+                lines.append(f"deciders: {_flow_list(deciders)}")
+            if supersede_previous and num > 1:
+                lines.append(f"supersedes: [ADR-{num - 1:04d}]")
+            lines += ["---", "", "## Decision", "", f"Decision number {num}."]
+
+            path = adr_dir / f"{adr_id}-decision.md"
+            path.write_text("\n".join(lines), encoding="utf-8")
+            paths.append(path)
+
+        if broken:
+            path = adr_dir / f"ADR-{count + 1:04d}-broken.md"
+            path.write_text("no front-matter", encoding="utf-8")
+            paths.append(path)
+        return paths
+
+    return write
@@ -5,12 +5,18 @@ from pathlib import Path
 from tempfile import NamedTemporaryFile, TemporaryDirectory
 
 import pytest
+import yaml
 from pydantic import ValidationError
 
+from adr_kit.core import parse
 from adr_kit.core.model import ADRStatus
 from adr_kit.core.parse import (
     ParseError,
+    _fast_parse_front_matter,
+    adr_id_from_filename,
+    find_adr_by_id,
     find_adr_files,
+    index_adr_ids,
     parse_adr_content,
     parse_adr_file,
     parse_front_matter,
@@ -72,6 +78,68 @@ invalid: yaml: content: [
             parse_front_matter(content)
 
 
+class TestFastParseFrontMatter:
+    """Test the non-YAML fast path for simple front-matter."""
+
+    @pytest.mark.parametrize(
+        "yaml_content",
+        [
+            "id: ADR-0001\ntitle: Use React Query\nstatus: accepted\n"
+            "date: 2025-09-03\ntags: [frontend, data]",
+            "id: ADR-0002\ntitle: 'Quoted: title'\ndeciders:\n  - alice\n  - bob\n"
+            "supersedes: []\nsuperseded_by:",
+            '# comment\nid: ADR-0003\n\ntitle: "Use Postgres"\ntags:\n- db',
+        ],
+    )
+    def test_matches_yaml(self, yaml_content):
+        """Test that the fast path produces the same dict as PyYAML."""
+        assert _fast_parse_front_matter(yaml_content) == yaml.safe_load(yaml_content)
+
+    @pytest.mark.parametrize(
+        "yaml_content",
+        [
+            "title: |\n  multi\n  line",
+            "title: >\n  folded",
+            "base: &anchor value\nother: *anchor",
+            "policy:\n  imports:\n    disallow: [lodash]",
+            "count: 12",
+            "enabled: yes",
+            "title: Use a: colon",
+            "title: value # comment",
+            "title: value\t# comment",
+            "title: 'it''s'",
+            "- orphan item",
+        ],
+    )
+    def test_falls_back_to_yaml(self, yaml_content):
+        """Test that anything beyond the simple subset returns None."""
+        assert _fast_parse_front_matter(yaml_content) is None
+
+    def test_nested_mapping_skips_scalar_resolution(self, monkeypatch):
+        """Test that a policy block bails out before any scalar is resolved."""
+
+        def fail(value):
+            raise AssertionError(f"resolved {value!r}")
+
+        monkeypatch.setattr(parse, "_fast_parse_scalar", fail)
+        yaml_content = "id: ADR-0001\ntitle: Use Postgres\npolicy:\n  imports: [pg]"
+
+        assert _fast_parse_front_matter(yaml_content) is None
+
+    def test_lenient_parse_uses_fast_path(self):
+        """Test that non-strict parsing gives the same result as strict."""
+        content = """---
+id: ADR-0001
+title: Use React Query
+status: accepted
+date: 2025-09-03
+---
+
+# Decision"""
+
+        assert parse_front_matter(content, strict=False) == parse_front_matter(content)
+
+
 class TestParseADRContent:
     """Test ADR content parsing."""
 
@@ -227,3 +295,76 @@ class TestFindADRFiles:
             decision_files = find_adr_files(tmpdir_path, "decision-*.md")
             assert len(decision_files) == 1
             assert "decision-001.md" in str(decision_files[0])
+
+    def test_sorted_and_skips_directories(self):
+        """Test results are sorted and directories matching the pattern are skipped."""
+        with TemporaryDirectory() as tmpdir:
+            tmpdir_path = Path(tmpdir)
+
+            (tmpdir_path / "ADR-0002-second.md").write_text("# Second")
+            (tmpdir_path / "ADR-0001-first.md").write_text("# First")
+            (tmpdir_path / "ADR-0003-folder.md").mkdir()
+
+            adr_files = find_adr_files(tmpdir_path)
+
+            assert adr_files == [
+                tmpdir_path / "ADR-0001-first.md",
+                tmpdir_path / "ADR-0002-second.md",
+            ]
+
+
+def _write_adr(path: Path, adr_id: str, title: str = "Test ADR") -> None:
+    path.write_text(
+        f"---\nid: {adr_id}\ntitle: {title}\nstatus: proposed\n"
+        f"date: 2025-09-03\n---\n\n## Decision\n\n{title}."
+    )
+
+
+class TestFindADRById:
+    """Test filename-based ADR lookup."""
+
+    def test_adr_id_from_filename(self):
+        """Test deriving IDs from canonical and non-canonical filenames."""
+        assert adr_id_from_filename("ADR-0007-use-postgres.md") == "ADR-0007"
+        assert adr_id_from_filename(Path("docs/adr/ADR-0001.md")) == "ADR-0001"
+        assert adr_id_from_filename("ADR-7-short.md") is None
+        assert adr_id_from_filename("README.md") is None
+
+    def test_index_adr_ids(self):
+        """Test mapping IDs to files from filenames alone."""
+        with TemporaryDirectory() as tmpdir:
+            tmpdir_path = Path(tmpdir)
+            (tmpdir_path / "ADR-0001-first.md").write_text("not parsed")
+            (tmpdir_path / "ADR-0002.md").write_text("not parsed")
+            (tmpdir_path / "README.md").write_text("# README")
+
+            assert index_adr_ids(tmpdir_path) == {
+                "ADR-0001": tmpdir_path / "ADR-0001-first.md",
+                "ADR-0002": tmpdir_path / "ADR-0002.md",
+            }
+            assert index_adr_ids(tmpdir_path / "missing") == {}
+
+    def test_find_by_filename(self):
+        """Test finding an ADR whose filename carries its ID."""
+        with TemporaryDirectory() as tmpdir:
+            tmpdir_path = Path(tmpdir)
+            _write_adr(tmpdir_path / "ADR-0001-first.md", "ADR-0001", "First")
+            _write_adr(tmpdir_path / "ADR-0002-second.md", "ADR-0002", "Second")
+
+            adr = find_adr_by_id(tmpdir_path, "ADR-0002")
+
+            assert adr is not None
+            assert adr.title == "Second"
+            assert adr.file_path == tmpdir_path / "ADR-0002-second.md"
+
+    def test_find_falls_back_to_front_matter(self):
+        """Test that a filename/front-matter mismatch still resolves."""
+        with TemporaryDirectory() as tmpdir:
+            tmpdir_path = Path(tmpdir)
+            _write_adr(tmpdir_path / "ADR-0001-renamed.md", "ADR-0005", "Renamed")
+
+            adr = find_adr_by_id(tmpdir_path, "ADR-0005")
+
+            assert adr is not None
+            assert adr.title == "Renamed"
+            assert find_adr_by_id(tmpdir_path, "ADR-0001") is None
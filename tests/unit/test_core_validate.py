@@ -0,0 +1,264 @@
+"""Tests for ADR validation."""
+
+import os
+
+import pytest
+
+from adr_kit.core import parse_cache, validate
+from adr_kit.core.parse import parse_adr_file
+from adr_kit.core.validate import (
+    PARALLEL_VALIDATION_THRESHOLD,
+    ADRValidator,
+    ValidationIssue,
+    ValidationResult,
+    parse_and_validate_all,
+    validate_adr_directory,
+)
+
+
+class TestParallelValidation:
+    """Test process-pool validation of many files."""
+
+    @pytest.mark.parametrize("count", [3, PARALLEL_VALIDATION_THRESHOLD + 4])
+    def test_matches_serial_results(self, tmp_path, write_adrs, monkeypatch, count):
+        """Parallel and serial validation report the same results in order."""
+        monkeypatch.chdir(tmp_path)
+        adr_dir = tmp_path / "docs" / "adr"
+        write_adrs(adr_dir, count, broken=True)
+
+        serial = validate_adr_directory(adr_dir)
+        parallel = [r for _, r in parse_and_validate_all(adr_dir, workers=2)]
+
+        assert len(parallel) == count + 1
+        assert [r.is_valid for r in parallel] == [r.is_valid for r in serial]
+        assert [r.adr.id if r.adr else None for r in parallel] == [
+            r.adr.id if r.adr else None for r in serial
+        ]
+        assert parallel[-1].issues[0].rule == "parse_error"
+
+    def test_serial_unless_workers_given(self, tmp_path, write_adrs, monkeypatch):
+        monkeypatch.chdir(tmp_path)
+        adr_dir = tmp_path / "docs" / "adr"
+        write_adrs(adr_dir, PARALLEL_VALIDATION_THRESHOLD + 4, broken=True)
+
+        def fail(*args, **kwargs):
+            raise AssertionError("process pool started")
+
+        monkeypatch.setattr(validate, "ProcessPoolExecutor", fail)
+
+        assert len(parse_and_validate_all(adr_dir)) == PARALLEL_VALIDATION_THRESHOLD + 5
+        assert len(validate_adr_directory(adr_dir)) == PARALLEL_VALIDATION_THRESHOLD + 5
+
+    def test_pool_fills_parse_cache(self, tmp_path, write_adrs, monkeypatch):
+        monkeypatch.chdir(tmp_path)
+        adr_dir = tmp_path / "docs" / "adr"
+        write_adrs(adr_dir, PARALLEL_VALIDATION_THRESHOLD + 4, broken=True)
+        cache = parse_cache.ParseCache(tmp_path / "p.pkl")
+        monkeypatch.setenv(parse_cache.CACHE_ENV_VAR, "1")
+        monkeypatch.setattr(parse_cache, "_parse_cache", cache)
+
+        parse_and_validate_all(adr_dir, workers=2)
+        assert len(cache.entries) == PARALLEL_VALIDATION_THRESHOLD + 4
+
+        # Cache hits are served here, so the warm run needs no pool
+        monkeypatch.setattr(validate, "ProcessPoolExecutor", None)
+        warm = parse_and_validate_all(adr_dir, workers=2)
+        assert [r.is_valid for _, r in warm].count(True) == len(cache.entries)
+
+
+class TestParseAndValidateAll:
+    """Test the single-pass parse/validate entry point."""
+
+    def test_pairs_files_with_results(self, tmp_path, write_adrs, monkeypatch):
+        monkeypatch.chdir(tmp_path)
+        adr_dir = tmp_path / "docs" / "adr"
+        write_adrs(adr_dir, 2, broken=True)
+
+        pairs = parse_and_validate_all(adr_dir)
+
+        assert [path.name for path, _ in pairs] == [
+            "ADR-0001-decision.md",
+            "ADR-0002-decision.md",
+            "ADR-0003-broken.md",
+        ]
+        assert [result.is_valid for _, result in pairs] == [True, True, False]
+
+    def test_empty_directory(self, tmp_path):
+        assert parse_and_validate_all(tmp_path / "missing") == []
+
+
+class TestSchemaCache:
+    """Test reuse of the compiled JSON schema validator."""
+
+    def test_validators_share_compiled_schema(self, tmp_path):
+        first = ADRValidator(project_root=tmp_path)
+        second = ADRValidator(project_root=tmp_path)
+
+        assert first.validator is second.validator
+
+    def test_edited_schema_is_reloaded(self, tmp_path):
+        schema_path = tmp_path / "schema.json"
+        schema_path.write_text('{"type": "object"}')
+        before = ADRValidator(schema_path, project_root=tmp_path)
+
+        schema_path.write_text('{"type": "object", "required": ["id"]}')
+        mtime_ns = schema_path.stat().st_mtime_ns + 10**9
+        os.utime(schema_path, ns=(mtime_ns, mtime_ns))
+        after = ADRValidator(schema_path, project_root=tmp_path)
+
+        assert "required" not in before.schema
+        assert after.schema["required"] == ["id"]
+
+    def test_missing_schema_raises(self, tmp_path):
+        with pytest.raises(ValueError, match="Schema file not found"):
+            ADRValidator(tmp_path / "missing.json", project_root=tmp_path)
+
+
+class TestFastSchemaCheck:
+    """Test the optional fastjsonschema shortcut for valid front-matter."""
+
+    @pytest.mark.skipif(
+        not validate.FASTJSONSCHEMA_AVAILABLE, reason="fastjsonschema missing"
+    )
+    def test_bundled_schema_gets_fast_check(self, tmp_path):
+        assert ADRValidator(project_root=tmp_path)._fast_check is not None
+
+    @pytest.mark.skipif(
+        not validate.FASTJSONSCHEMA_AVAILABLE, reason="fastjsonschema missing"
+    )
+    def test_rejections_are_described_by_jsonschema(self, tmp_path):
+        validator = ADRValidator(project_root=tmp_path)
+        front_matter = {
+            "id": "ADR-1",
+            "title": "Decision",
+            "status": "proposed",
+            "date": "2025-09-03",
+        }
+
+        issues = validator.validate_schema(front_matter)
+
+        assert [issue.message for issue in issues] == [
+            "'ADR-1' does not match '^ADR-\\\\d{4}$'"
+        ]
+
+    @pytest.mark.skipif(
+        not validate.FASTJSONSCHEMA_AVAILABLE, reason="fastjsonschema missing"
+    )
+    def test_stricter_fast_check_defers_to_jsonschema(self, tmp_path):
+        # fastjsonschema asserts "format": "date"; jsonschema only annotates it
+        validator = ADRValidator(project_root=tmp_path)
+        front_matter = {
+            "id": "ADR-0001",
+            "title": "Decision",
+            "status": "proposed",
+            "date": "2025-13-45",
+        }
+
+        assert validator.validate_schema(front_matter) == []
+
+    @pytest.mark.parametrize(
+        "schema",
+        [
+            {"type": "object", "unevaluatedProperties": False},
+            {"properties": {"tags": {"prefixItems": [{"type": "string"}]}}},
+            {"properties": {"tags": {"items": [{"type": "string"}]}}},
+        ],
+    )
+    def test_newer_draft_keywords_keep_jsonschema_only(self, schema):
+        assert validate._compile_fast_check(schema) is None
+
+    def test_unavailable_without_fastjsonschema(self, monkeypatch):
+        monkeypatch.setattr(validate, "FASTJSONSCHEMA_AVAILABLE", False)
+
+        assert validate._compile_fast_check({"type": "object"}) is None
+
+
+class TestFrontMatterSchemaCheck:
+    """Test schema validation of parsed front-matter."""
+
+    def test_model_dump_matches_dict_path(self, tmp_path, write_adrs):
+        write_adrs(tmp_path, 1)
+        validator = ADRValidator(project_root=tmp_path)
+        adr = parse_adr_file(tmp_path / "ADR-0001-decision.md")
+
+        raw = adr.front_matter.model_dump(exclude_none=True)
+        dict_issues = validator.validate_schema(raw, adr.file_path)
+        result = validator.validate_adr(adr, strict_schema=True)
+
+        assert dict_issues == []
+        assert not [i for i in result.issues if i.rule == "json_schema"]
+
+    def test_adr_objects_skip_schema_unless_strict(self, tmp_path, write_adrs):
+        write_adrs(tmp_path, 1)
+        schema_path = tmp_path / "schema.json"
+        schema_path.write_text('{"type": "object", "required": ["owner"]}')
+        validator = ADRValidator(schema_path, project_root=tmp_path)
+        adr = parse_adr_file(tmp_path / "ADR-0001-decision.md")
+
+        assert validator.validate_adr(adr).is_valid
+        strict = validator.validate_adr(adr, strict_schema=True)
+        assert [i.rule for i in strict.errors] == ["json_schema"]
+
+    def test_file_schema_check_sees_raw_front_matter(self, tmp_path, write_adrs):
+        (adr_file,) = write_adrs(tmp_path, 1)
+        # Pydantic drops the unknown policy key; the schema forbids it
+        adr_file.write_text(
+            adr_file.read_text().replace(
+                "status: proposed", "status: proposed\npolicy:\n  import: [lodash]"
+            )
+        )
+
+        result = ADRValidator(project_root=tmp_path).validate_file(adr_file)
+
+        assert not result.is_valid
+        assert [i.rule for i in result.errors] == ["json_schema"]
+
+    def test_schema_errors_are_reported_before_model_build(self, tmp_path, write_adrs):
+        (adr_file,) = write_adrs(tmp_path, 1)
+        adr_file.write_text(adr_file.read_text().replace("ADR-0001", "ADR-1"))
+
+        result = ADRValidator(project_root=tmp_path).validate_file(adr_file)
+
+        assert result.adr is None
+        assert [(i.rule, i.file_path) for i in result.errors] == [
+            ("json_schema", adr_file)
+        ]
+
+    def test_cache_hit_matches_miss_on_schema_errors(
+        self, tmp_path, write_adrs, monkeypatch
+    ):
+        (adr_file,) = write_adrs(tmp_path, 1)
+        adr_file.write_text(
+            adr_file.read_text().replace(
+                "status: proposed", "status: superseded\npolicy:\n  import: [lodash]"
+            )
+        )
+        validator = ADRValidator(project_root=tmp_path)
+        miss = validator.validate_file(adr_file)
+
+        monkeypatch.setenv(parse_cache.CACHE_ENV_VAR, "1")
+        monkeypatch.setattr(
+            parse_cache, "_parse_cache", parse_cache.ParseCache(tmp_path / "p.pkl")
+        )
+        # Warm the cache the way the MCP server does, then validate from it
+        parse_adr_file(adr_file)
+        hit = validator.validate_file(adr_file)
+
+        assert hit.adr is miss.adr is None
+        assert [i.rule for i in hit.issues] == [i.rule for i in miss.issues]
+        assert [i.rule for i in hit.issues] == ["json_schema"]
+
+
+class TestValidationResult:
+    """Test the result containers."""
+
+    def test_issues_are_split_by_level(self):
+        error = ValidationIssue(level="error", message="bad id")
+        warning = ValidationIssue(level="warning", message="no deciders")
+
+        result = ValidationResult(is_valid=False, issues=[warning, error])
+
+        assert result.errors == [error]
+        assert result.warnings == [warning]
+        assert not hasattr(result, "__dict__")
+        assert not hasattr(error, "__dict__")
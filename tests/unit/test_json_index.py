@@ -0,0 +1,142 @@
+"""Tests for JSON ADR index generation."""
+
+import json
+import os
+
+import pytest
+
+from adr_kit.core.model import ADRStatus
+from adr_kit.core.parse import parse_adr_content
+from adr_kit.core.validate import parse_and_validate_all
+from adr_kit.index import json_index
+from adr_kit.index.json_index import (
+    IndexEntry,
+    generate_adr_index,
+    load_index_paths,
+)
+
+ADR_FIELDS = {"title": "Décision {num}", "tags": ["backend"]}
+
+
+class TestGenerateADRIndex:
+    """Test writing the JSON index."""
+
+    @pytest.mark.skipif(not json_index.ORJSON_AVAILABLE, reason="orjson missing")
+    def test_orjson_output_matches_stdlib(self, tmp_path, write_adrs, monkeypatch):
+        adr_dir = tmp_path / "docs" / "adr"
+        write_adrs(adr_dir, 2, **ADR_FIELDS)
+
+        generate_adr_index(adr_dir, tmp_path / "fast.json", validate=False)
+        monkeypatch.setattr(json_index, "ORJSON_AVAILABLE", False)
+        generate_adr_index(adr_dir, tmp_path / "stdlib.json", validate=False)
+
+        fast = (tmp_path / "fast.json").read_text(encoding="utf-8")
+        stdlib = (tmp_path / "stdlib.json").read_text(encoding="utf-8")
+        fast_data, stdlib_data = json.loads(fast), json.loads(stdlib)
+        # Generation timestamps differ between the two runs
+        fast_data["metadata"].pop("generated_at", None)
+        stdlib_data["metadata"].pop("generated_at", None)
+        assert fast_data == stdlib_data
+        assert "Décision 1" in fast
+
+    def test_non_default_indent_uses_stdlib(self, tmp_path, write_adrs):
+        adr_dir = tmp_path / "docs" / "adr"
+        write_adrs(adr_dir, 1, **ADR_FIELDS)
+        output = tmp_path / "index.json"
+
+        index = generate_adr_index(adr_dir, output, validate=False, indent=4)
+
+        assert output.read_text(encoding="utf-8") == index.to_json(indent=4)
+
+    def test_reuses_validated_results(self, tmp_path, write_adrs, monkeypatch):
+        monkeypatch.chdir(tmp_path)
+        adr_dir = tmp_path / "docs" / "adr"
+        write_adrs(adr_dir, 2, **ADR_FIELDS)
+        validated = parse_and_validate_all(adr_dir)
+
+        def fail(*args, **kwargs):
+            raise AssertionError("directory validated twice")
+
+        monkeypatch.setattr(json_index, "parse_and_validate_all", fail)
+        index = generate_adr_index(
+            adr_dir, tmp_path / "index.json", validated=validated
+        )
+
+        assert index.metadata["total_adrs"] == 2
+
+
+class TestContentPreview:
+    """Test the content preview stored with each index entry."""
+
+    def test_preview_skips_headings_and_stops_at_max_length(self, tmp_path, write_adrs):
+        (adr_file,) = write_adrs(tmp_path, 1, **ADR_FIELDS)
+        content = "## Context\n\n" + "\n".join(
+            f"Line {num} of text." for num in range(50)
+        )
+        adr = parse_adr_content(
+            adr_file.read_text(encoding="utf-8").split("## Decision")[0] + content
+        )
+
+        preview = IndexEntry(adr)._get_content_preview(max_length=40)
+
+        assert preview == "Line 0 of text. Line 1 of text. Line 2..."
+
+
+class TestADRIndexFilters:
+    """Test in-memory status and tag filters."""
+
+    @pytest.fixture
+    def index(self, tmp_path, write_adrs):
+        adr_dir = tmp_path / "docs" / "adr"
+        write_adrs(adr_dir, 2, **ADR_FIELDS)
+        second = adr_dir / "ADR-0002-decision.md"
+        second.write_text(
+            second.read_text(encoding="utf-8").replace(
+                "tags: [backend]", "tags: [backend, data]"
+            ),
+            encoding="utf-8",
+        )
+        return generate_adr_index(adr_dir, tmp_path / "index.json", validate=False)
+
+    @staticmethod
+    def _ids(entries) -> list[str]:
+        return [entry.adr.id for entry in entries]
+
+    def test_any_and_all_tags(self, index):
+        assert self._ids(index.filter_by_tags(["data", "ml"])) == ["ADR-0002"]
+        assert self._ids(index.filter_by_tags("backend")) == ["ADR-0001", "ADR-0002"]
+        assert self._ids(index.filter_by_tags(["backend", "data"], match_all=True)) == [
+            "ADR-0002"
+        ]
+        assert index.filter_by_tags([]) == []
+
+    def test_status_accepts_enums_and_strings(self, index):
+        assert len(index.filter_by_status([ADRStatus.PROPOSED, "accepted"])) == 2
+        assert index.filter_by_status("accepted") == []
+
+
+class TestLoadIndexPaths:
+    """Test ID lookups from a saved JSON index."""
+
+    def test_fresh_index_maps_ids_to_files(self, tmp_path, write_adrs):
+        adr_dir = tmp_path / "docs" / "adr"
+        write_adrs(adr_dir, 2, **ADR_FIELDS)
+        index_path = adr_dir / "adr-index.json"
+        generate_adr_index(adr_dir, index_path, validate=False)
+
+        paths = load_index_paths(index_path, adr_dir)
+
+        assert paths["ADR-0002"] == adr_dir / "ADR-0002-decision.md"
+
+    def test_stale_or_missing_index_is_ignored(self, tmp_path, write_adrs):
+        adr_dir = tmp_path / "docs" / "adr"
+        write_adrs(adr_dir, 2, **ADR_FIELDS)
+        index_path = adr_dir / "adr-index.json"
+        assert load_index_paths(index_path, adr_dir) == {}
+
+        generate_adr_index(adr_dir, index_path, validate=False)
+        index_mtime = index_path.stat().st_mtime_ns
+        edited = adr_dir / "ADR-0001-decision.md"
+        os.utime(edited, ns=(index_mtime + 10**9, index_mtime + 10**9))
+
+        assert load_index_paths(index_path, adr_dir) == {}
@@ -0,0 +1,179 @@
+"""Tests for the persistent ADR parse cache."""
+
+import os
+import pickle
+from datetime import date
+from pathlib import Path
+
+import pytest
+
+from adr_kit.core import parse_cache
+from adr_kit.core.parse import parse_adr_file
+from adr_kit.core.parse_cache import ParseCache, load_cache, save_cache
+
+ADR_CONTENT = """---
+id: ADR-0001
+title: {title}
+status: proposed
+date: 2025-09-03
+---
+
+## Decision
+
+Use PostgreSQL."""
+
+
+@pytest.fixture
+def adr_file(tmp_path: Path) -> Path:
+    path = tmp_path / "ADR-0001-postgres.md"
+    path.write_text(ADR_CONTENT.format(title="Use PostgreSQL"))
+    return path
+
+
+@pytest.fixture
+def enabled_cache(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> ParseCache:
+    """Enable caching with a fresh cache stored under tmp_path."""
+    cache = ParseCache(tmp_path / "parse-cache.pkl")
+    monkeypatch.setenv(parse_cache.CACHE_ENV_VAR, "1")
+    monkeypatch.setattr(parse_cache, "_parse_cache", cache)
+    return cache
+
+
+class TestParseCache:
+    """Test cache hits, invalidation and persistence."""
+
+    def test_disabled_by_default(self, monkeypatch):
+        monkeypatch.delenv(parse_cache.CACHE_ENV_VAR, raising=False)
+        assert parse_cache.get_parse_cache() is None
+
+    def test_hit_returns_copy(self, adr_file, enabled_cache):
+        first = parse_adr_file(adr_file)
+        assert enabled_cache.dirty
+
+        second = parse_adr_file(adr_file)
+        assert second.title == "Use PostgreSQL"
+        assert second is not first
+
+        # Mutating a returned ADR must not leak into later cache hits
+        second.front_matter.title = "Mutated"
+        assert parse_adr_file(adr_file).title == "Use PostgreSQL"
+
+    def test_changed_file_is_reparsed(self, adr_file, enabled_cache):
+        parse_adr_file(adr_file)
+
+        adr_file.write_text(ADR_CONTENT.format(title="Use PostgreSQL 16"))
+        stat = adr_file.stat()
+        os.utime(adr_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+        assert parse_adr_file(adr_file).title == "Use PostgreSQL 16"
+
+    def test_lenient_entry_is_reparsed_for_strict_callers(
+        self, adr_file, enabled_cache
+    ):
+        parse_adr_file(adr_file, strict=False)
+        assert enabled_cache.get(adr_file) is not None
+        assert enabled_cache.get(adr_file, strict=True) is None
+
+        # A strict parse upgrades the entry for every caller
+        parse_adr_file(adr_file, strict=True)
+        assert enabled_cache.get(adr_file, strict=True) is not None
+        assert enabled_cache.get(adr_file) is not None
+
+    def test_save_and_load_round_trip(self, tmp_path, adr_file, enabled_cache):
+        parse_adr_file(adr_file)
+        enabled_cache.save()
+
+        reloaded = ParseCache(enabled_cache.cache_path)
+        cached = reloaded.get(adr_file)
+        assert cached is not None
+        assert cached.id == "ADR-0001"
+
+    def test_hit_keeps_raw_front_matter(self, adr_file, enabled_cache):
+        parse_adr_file(adr_file)
+
+        first = enabled_cache.get_with_front_matter(adr_file)
+        second = enabled_cache.get_with_front_matter(adr_file)
+
+        assert first is not None and second is not None
+        assert first[1] == {
+            "id": "ADR-0001",
+            "title": "Use PostgreSQL",
+            "status": "proposed",
+            "date": date(2025, 9, 3),
+        }
+        assert first[1] is not second[1]
+
+    def test_other_version_cache_is_discarded(
+        self, adr_file, enabled_cache, monkeypatch
+    ):
+        parse_adr_file(adr_file)
+        enabled_cache.save()
+        assert load_cache(enabled_cache.cache_path)
+
+        # As if adr-kit or pydantic had been upgraded since the cache was written
+        monkeypatch.setattr(parse_cache, "_CACHE_VERSION", "1:0.0.0:0.0.0")
+        assert load_cache(enabled_cache.cache_path) == {}
+
+    def test_unversioned_cache_is_discarded(self, adr_file, enabled_cache):
+        adr = parse_adr_file(adr_file)
+        stat = adr_file.stat()
+        entries = {str(adr_file.resolve()): (stat.st_mtime_ns, stat.st_size, adr)}
+        enabled_cache.cache_path.write_bytes(pickle.dumps(entries))
+
+        assert load_cache(enabled_cache.cache_path) == {}
+
+    def test_save_drops_deleted_files(self, tmp_path, adr_file, enabled_cache):
+        parse_adr_file(adr_file)
+        adr_file.unlink()
+        enabled_cache.save()
+
+        assert load_cache(enabled_cache.cache_path) == {}
+
+    def test_corrupt_cache_file_is_ignored(self, tmp_path):
+        cache_path = tmp_path / "parse-cache.pkl"
+        cache_path.write_bytes(b"not a pickle")
+
+        assert load_cache(cache_path) == {}
+        save_cache({}, cache_path)
+        assert load_cache(cache_path) == {}
+
+    def test_cache_file_lives_outside_project(self, tmp_path, monkeypatch):
+        project = tmp_path / "project"
+        project.mkdir()
+        monkeypatch.chdir(project)
+        monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path / "cache"))
+        monkeypatch.setenv(parse_cache.CACHE_ENV_VAR, "1")
+        monkeypatch.setattr(parse_cache, "_parse_cache", None)
+
+        # A cache file committed to the project must never be unpickled
+        planted = project / ".project-index" / "parse-cache.pkl"
+        planted.parent.mkdir()
+        planted.write_bytes(b"not a pickle")
+
+        cache = parse_cache.get_parse_cache()
+        assert cache is not None and cache.cache_path is not None
+        assert cache.cache_path.parent == tmp_path / "cache" / "adr-kit"
+        assert cache.entries == {}
+
+
+class TestMemoryCache:
+    """Test the in-memory cache used by long-running processes."""
+
+    @pytest.fixture(autouse=True)
+    def no_cache(self, monkeypatch):
+        monkeypatch.delenv(parse_cache.CACHE_ENV_VAR, raising=False)
+        monkeypatch.setattr(parse_cache, "_parse_cache", None)
+
+    def test_serves_hits_without_env_var(self, adr_file, tmp_path, monkeypatch):
+        monkeypatch.chdir(tmp_path)
+        cache = parse_cache.enable_memory_cache()
+        parse_adr_file(adr_file)
+
+        assert parse_cache.get_parse_cache() is cache
+        assert cache.get(adr_file) is not None
+
+        cache.save()
+        assert not (tmp_path / ".project-index").exists()
+
+    def test_keeps_enabled_disk_cache(self, enabled_cache):
+        assert parse_cache.enable_memory_cache() is enabled_cache
@@ -9,6 +9,9 @@ from adr_kit.core.model import ADR, ADRFrontMatter, ADRStatus
 from adr_kit.core.policy_extractor import PolicyExtractor
 from adr_kit.decision.workflows.creation import CreationInput, CreationWorkflow
 
+# PolicyExtractor is stateless, so one instance serves every test
+EXTRACTOR = PolicyExtractor()
+
 
 class TestPolicyValidation:
     """Test policy validation during ADR creation."""
@@ -112,10 +115,9 @@ class TestPolicyValidation:
 
         adr = ADR(front_matter=front_matter, content="Test content")
 
-        extractor = PolicyExtractor()
-        assert extractor.has_extractable_policy(adr) is True
+        assert EXTRACTOR.has_extractable_policy(adr) is True
 
-        policy = extractor.extract_policy(adr)
+        policy = EXTRACTOR.extract_policy(adr)
         assert policy.get_disallowed_imports() == ["flask"]
         assert policy.get_preferred_imports() == ["fastapi"]
 
@@ -142,8 +144,7 @@ Provides good performance.
 
         adr = ADR(front_matter=front_matter, content=content)
 
-        extractor = PolicyExtractor()
-        assert extractor.has_extractable_policy(adr) is False
+        assert EXTRACTOR.has_extractable_policy(adr) is False
 
     def test_policy_guidance_provided_when_no_policy(self):
         """Should provide policy guidance when no policy provided."""
@@ -220,10 +221,9 @@ Provides good performance.
 
         adr = ADR(front_matter=front_matter, content="Test content")
 
-        extractor = PolicyExtractor()
-        assert extractor.has_extractable_policy(adr) is True
+        assert EXTRACTOR.has_extractable_policy(adr) is True
 
-        policy = extractor.extract_policy(adr)
+        policy = EXTRACTOR.extract_policy(adr)
         assert policy.patterns is not None
         assert policy.patterns.patterns is not None
         assert "async_handlers" in policy.patterns.patterns
@@ -262,10 +262,9 @@ Provides good performance.
 
         adr = ADR(front_matter=front_matter, content="Test content")
 
-        extractor = PolicyExtractor()
-        assert extractor.has_extractable_policy(adr) is True
+        assert EXTRACTOR.has_extractable_policy(adr) is True
 
-        policy = extractor.extract_policy(adr)
+        policy = EXTRACTOR.extract_policy(adr)
         assert policy.architecture is not None
         assert policy.architecture.layer_boundaries is not None
         assert len(policy.architecture.layer_boundaries) == 1
@@ -307,10 +306,9 @@ Provides good performance.
 
         adr = ADR(front_matter=front_matter, content="Test content")
 
-        extractor = PolicyExtractor()
-        assert extractor.has_extractable_policy(adr) is True
+        assert EXTRACTOR.has_extractable_policy(adr) is True
 
-        policy = extractor.extract_policy(adr)
+        policy = EXTRACTOR.extract_policy(adr)
         assert policy.config_enforcement is not None
         assert policy.config_enforcement.typescript is not None
         assert policy.config_enforcement.typescript.tsconfig is not None
@@ -345,8 +343,7 @@ Provides good performance.
             },
         )
         adr_patterns = ADR(front_matter=front_matter_patterns, content="Test")
-        extractor = PolicyExtractor()
-        assert extractor.has_extractable_policy(adr_patterns) is True
+        assert EXTRACTOR.has_extractable_policy(adr_patterns) is True
 
         # Test with architecture policy only
         front_matter_arch = ADRFrontMatter(
@@ -361,7 +358,7 @@ Provides good performance.
             },
         )
         adr_arch = ADR(front_matter=front_matter_arch, content="Test")
-        assert extractor.has_extractable_policy(adr_arch) is True
+        assert EXTRACTOR.has_extractable_policy(adr_arch) is True
 
         # Test with config enforcement policy only
         front_matter_config = ADRFrontMatter(
@@ -374,7 +371,7 @@ Provides good performance.
             },
         )
         adr_config = ADR(front_matter=front_matter_config, content="Test")
-        assert extractor.has_extractable_policy(adr_config) is True
+        assert EXTRACTOR.has_extractable_policy(adr_config) is True
 
 
 class TestRelationFields:
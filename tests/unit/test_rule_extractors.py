@@ -0,0 +1,329 @@
+"""Tests for the legacy pattern-based rule extractors.
+
+Covers:
+- ESLintRuleExtractor ban/replacement phrase extraction
+- Markdown emphasis doesn't hide library names
+- Tag-gated frontend/backend rules
+- PythonRuleExtractor ban/replacement phrase extraction
+- Non-accepted ADRs produce no rules
+- Content without ban words skips the ban regex
+- Regex engine selection falls back to the stdlib re module
+- generate_eslint_config reuses cached legacy extraction for unchanged files
+- Generated configs are memoized until the ADR directory changes
+"""
+
+import json
+import os
+import re
+from datetime import date
+
+import pytest
+
+from adr_kit.core import parse_cache
+from adr_kit.core.model import ADR, ADRFrontMatter, ADRStatus
+from adr_kit.enforcement.adapters import eslint, regex_engine, ruff
+from adr_kit.enforcement.adapters.eslint import ESLintRuleExtractor
+from adr_kit.enforcement.adapters.ruff import PythonRuleExtractor
+
+
+def _make_adr(
+    content: str,
+    status: ADRStatus = ADRStatus.ACCEPTED,
+    tags: list[str] | None = None,
+) -> ADR:
+    front_matter = ADRFrontMatter(
+        id="ADR-0001",
+        title="Library choice",
+        status=status,
+        date=date(2025, 9, 3),
+        tags=tags,
+    )
+    return ADR(front_matter=front_matter, content=content)
+
+
+class TestESLintRuleExtractor:
+    """Test ban phrase extraction for JavaScript libraries."""
+
+    def test_extracts_bans_and_replacements(self):
+        adr = _make_adr(
+            "We don't use jquery anymore. Use dayjs instead of moment. "
+            "No longer use underscore."
+        )
+
+        rules = ESLintRuleExtractor().extract_from_adr(adr)
+
+        assert set(rules["banned_imports"]) == {"jquery", "moment", "underscore"}
+        assert rules["preferred_imports"] == {"moment": "dayjs"}
+
+    def test_repeated_bans_are_recorded_once(self):
+        adr = _make_adr("Avoid moment. We avoid moment everywhere. Ban jquery.")
+
+        rules = ESLintRuleExtractor().extract_from_adr(adr)
+
+        assert rules["banned_imports"] == ["moment", "jquery"]
+
+    def test_replace_bans_the_old_library(self):
+        adr = _make_adr("Replace axios with fetch across the app.")
+
+        rules = ESLintRuleExtractor().extract_from_adr(adr)
+
+        assert rules["banned_imports"] == ["axios"]
+        assert rules["preferred_imports"] == {"axios": "fetch"}
+
+    @pytest.mark.parametrize(
+        ("content", "banned", "preferred"),
+        [
+            # A ban phrase overlapping a replacement phrase loses neither
+            ("Avoid use dayjs instead of moment.", ["moment"], {"moment": "dayjs"}),
+            ("Don't use use dayjs instead of lodash.", ["lodash"], {"lodash": "dayjs"}),
+            # Phrase words are never taken for library names
+            ("Replace avoid with dayjs.", [], {}),
+        ],
+    )
+    def test_overlapping_phrases(self, content, banned, preferred):
+        rules = ESLintRuleExtractor().extract_from_adr(_make_adr(content))
+
+        assert rules["banned_imports"] == banned
+        assert rules["preferred_imports"] == preferred
+
+    def test_markdown_emphasis_is_ignored(self):
+        adr = _make_adr("We **avoid** `lodash` and *don't use* **moment**.")
+
+        rules = ESLintRuleExtractor().extract_from_adr(adr)
+
+        assert rules["banned_imports"] == ["lodash", "moment"]
+
+    def test_scoped_package_names(self):
+        adr = _make_adr("Avoid @angular/core in this service.")
+
+        rules = ESLintRuleExtractor().extract_from_adr(adr)
+
+        assert rules["banned_imports"] == ["@angular/core"]
+
+    def test_common_words_are_not_libraries(self):
+        adr = _make_adr("Avoid the legacy client. Ban lodash.")
+
+        rules = ESLintRuleExtractor().extract_from_adr(adr)
+
+        assert rules["banned_imports"] == ["lodash"]
+
+    def test_backend_tags_enable_backend_rules(self):
+        adr = _make_adr("Avoid synchronous file access in node services.", tags=["api"])
+
+        rules = ESLintRuleExtractor().extract_from_adr(adr)
+
+        assert rules["custom_rules"] == [{"rule": "no-sync", "severity": "error"}]
+
+    def test_frontend_and_backend_rules_combine(self):
+        adr = _make_adr(
+            "Avoid conditional react hooks and synchronous node file access.",
+            tags=["frontend", "backend"],
+        )
+
+        rules = ESLintRuleExtractor().extract_from_adr(adr)
+
+        assert rules["custom_rules"] == [
+            {"rule": "react-hooks/rules-of-hooks", "severity": "error"},
+            {"rule": "no-sync", "severity": "error"},
+        ]
+
+    def test_content_without_ban_words_skips_regex(self, monkeypatch):
+        extractor = ESLintRuleExtractor()
+        monkeypatch.setattr(extractor, "ban_pattern", None)
+        monkeypatch.setattr(extractor, "preference_patterns", None)
+        adr = _make_adr("Don't call synchronous node APIs.", tags=["backend"])
+
+        rules = extractor.extract_from_adr(adr)
+
+        assert rules["banned_imports"] == []
+        assert rules["custom_rules"] == [{"rule": "no-sync", "severity": "error"}]
+
+    def test_ban_anchors_cover_every_phrase(self):
+        phrases = ["don't use", "avoid", "ban", "deprecated", "deprecate"]
+        phrases += ["use dayjs instead of", "replace moment with", "no longer use"]
+
+        for phrase in phrases:
+            assert any(anchor in phrase for anchor in eslint._BAN_ANCHORS)
+            assert any(anchor in phrase for anchor in ruff._BAN_ANCHORS)
+
+    @pytest.mark.parametrize(
+        ("name", "expected"),
+        [
+            ("React-Query", "@tanstack/react-query"),
+            (" @scope/pkg ", "@scope/pkg"),
+            ("the", None),
+            ("x", None),
+            ("lodash.get", None),
+        ],
+    )
+    def test_normalize_library_name(self, name, expected):
+        assert ESLintRuleExtractor()._normalize_library_name(name) == expected
+
+    def test_skips_non_accepted_adrs(self):
+        adr = _make_adr("Avoid lodash.", status=ADRStatus.PROPOSED)
+
+        rules = ESLintRuleExtractor().extract_from_adr(adr)
+
+        assert rules["banned_imports"] == []
+
+
+class TestPythonRuleExtractor:
+    """Test ban phrase extraction for Python libraries."""
+
+    def test_extracts_bans_and_replacements(self):
+        adr = _make_adr("Use httpx instead of requests. Avoid flask.")
+
+        rules = PythonRuleExtractor().extract_from_adr(adr)
+
+        assert set(rules["banned_imports"]) == {"requests", "flask"}
+        assert rules["preferred_imports"] == {"requests": "httpx"}
+
+    @pytest.mark.parametrize(
+        ("content", "banned", "preferred"),
+        [
+            (
+                "Avoid use httpx instead of requests.",
+                ["requests"],
+                {"requests": "httpx"},
+            ),
+            ("Don't use use httpx instead of urllib.", ["urllib"], {"urllib": "httpx"}),
+            ("Replace avoid with httpx.", [], {}),
+        ],
+    )
+    def test_overlapping_phrases(self, content, banned, preferred):
+        rules = PythonRuleExtractor().extract_from_adr(_make_adr(content))
+
+        assert rules["banned_imports"] == banned
+        assert rules["preferred_imports"] == preferred
+
+    def test_domain_infrastructure_rule(self):
+        adr = _make_adr(
+            "The domain layer should not depend on infrastructure.",
+            tags=["architecture"],
+        )
+
+        rules = PythonRuleExtractor().extract_from_adr(adr)
+
+        assert rules["architectural_rules"][0]["forbidden_modules"] == [
+            "infrastructure",
+            "adapters",
+        ]
+
+
+class TestRegexEngine:
+    """Test RE2/re engine selection."""
+
+    def test_falls_back_to_re_without_re2(self, monkeypatch):
+        monkeypatch.setattr(regex_engine, "RE2_AVAILABLE", False)
+
+        pattern = regex_engine.compile_pattern(r"(?i)avoid\s+(?P<lib>\w+)")
+
+        assert isinstance(pattern, re.Pattern)
+        assert pattern.search("AVOID lodash").group("lib") == "lodash"
+
+    def test_unsupported_syntax_uses_re(self):
+        # Backreferences are outside RE2 syntax
+        pattern = regex_engine.compile_pattern(r"(\w)\1")
+
+        assert pattern.search("lodash shelljs").group(0) == "ll"
+
+    @pytest.mark.skipif(not regex_engine.RE2_AVAILABLE, reason="google-re2 missing")
+    def test_ban_patterns_compile_with_re2(self):
+        # A lookaround or backreference would silently fall back to re
+        patterns = [eslint._BAN_PATTERN, *eslint._PREFERENCE_PATTERNS]
+        patterns += [ruff._PYTHON_BAN_PATTERN, *ruff._PYTHON_PREFERENCE_PATTERNS]
+        assert not any(isinstance(pattern, re.Pattern) for pattern in patterns)
+
+
+class TestGenerateESLintConfig:
+    """Test the hybrid ESLint config generator's legacy extraction cache."""
+
+    ADR_TEXT = """---
+id: ADR-0001
+title: Date handling
+status: accepted
+date: 2025-09-03
+---
+
+## Decision
+
+Use dayjs instead of {old}."""
+
+    @pytest.fixture
+    def adr_file(self, tmp_path, monkeypatch):
+        monkeypatch.setenv(parse_cache.CACHE_ENV_VAR, "1")
+        monkeypatch.setattr(
+            parse_cache, "_parse_cache", parse_cache.ParseCache(tmp_path / "parse.pkl")
+        )
+        monkeypatch.setattr(eslint, "RULES_CACHE_PATH", tmp_path / "rules.json")
+        adr_dir = tmp_path / "docs" / "adr"
+        adr_dir.mkdir(parents=True)
+        path = adr_dir / "ADR-0001-dates.md"
+        path.write_text(self.ADR_TEXT.format(old="moment"))
+        return path
+
+    @staticmethod
+    def _banned(adr_dir) -> set[str]:
+        # Bypass the in-process memo so the on-disk rules cache is exercised
+        eslint._generate_eslint_config.cache_clear()
+        config = json.loads(eslint.generate_eslint_config(adr_dir))
+        paths = config["rules"]["no-restricted-imports"][1]["paths"]
+        return {item["name"] for item in paths}
+
+    def test_banned_imports_are_sorted(self, adr_file):
+        adr_file.write_text(
+            self.ADR_TEXT.format(old="moment") + " Avoid underscore. Ban axios."
+        )
+
+        config = json.loads(eslint.generate_eslint_config(adr_file.parent))
+        paths = config["rules"]["no-restricted-imports"][1]["paths"]
+
+        assert [item["name"] for item in paths] == ["axios", "moment", "underscore"]
+
+    @pytest.mark.skipif(not eslint.ORJSON_AVAILABLE, reason="orjson missing")
+    def test_orjson_output_matches_stdlib(self, monkeypatch):
+        config = {"rules": {"no-restricted-imports": ["error", {"paths": []}]}}
+        config["settings"] = {"note": "Décision ADR-0001"}
+
+        fast = eslint._dumps_config(config)
+        monkeypatch.setattr(eslint, "ORJSON_AVAILABLE", False)
+
+        assert eslint._dumps_config(config) == fast
+
+    def test_unchanged_files_reuse_cached_extraction(self, adr_file, monkeypatch):
+        assert self._banned(adr_file.parent) == {"moment"}
+
+        def fail(*args, **kwargs):
+            raise AssertionError("cached ADR extracted again")
+
+        monkeypatch.setattr(eslint, "_extract_legacy_banned_imports", fail)
+        assert self._banned(adr_file.parent) == {"moment"}
+
+    def test_unchanged_directory_reuses_generated_config(self, adr_file, monkeypatch):
+        first = eslint.generate_eslint_config(adr_file.parent)
+
+        def fail(*args, **kwargs):
+            raise AssertionError("unchanged directory parsed again")
+
+        monkeypatch.setattr(eslint, "find_adr_files", fail)
+        assert eslint.generate_eslint_config(adr_file.parent) == first
+
+    def test_ruff_configs_follow_edits(self, adr_file):
+        adr_file.write_text(self.ADR_TEXT.format(old="requests"))
+        assert "requests" in ruff.generate_ruff_config(adr_file.parent)
+
+        adr_file.write_text(self.ADR_TEXT.format(old="flask"))
+        stat = adr_file.stat()
+        os.utime(adr_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+        assert "flask" in ruff.generate_ruff_config(adr_file.parent)
+        assert "requests" not in ruff.generate_ruff_config(adr_file.parent)
+
+    def test_edited_files_are_extracted_again(self, adr_file):
+        self._banned(adr_file.parent)
+
+        adr_file.write_text(self.ADR_TEXT.format(old="luxon"))
+        stat = adr_file.stat()
+        os.utime(adr_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+        assert self._banned(adr_file.parent) == {"luxon"}
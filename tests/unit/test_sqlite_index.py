@@ -0,0 +1,176 @@
+"""Tests for SQLite ADR index generation."""
+
+import sqlite3
+from pathlib import Path
+
+import pytest
+
+from adr_kit.core.parse import parse_adr_file
+from adr_kit.index.sqlite_index import ADRSQLiteIndex, generate_sqlite_index
+
+# Each ADR supersedes the previous one, so three ADRs give two links
+ADR_FIELDS = {
+    "status": "accepted",
+    "tags": ["backend", "data"],
+    "deciders": ["alice"],
+    "supersede_previous": True,
+}
+
+
+def _count(db_path: Path, table: str) -> int:
+    with sqlite3.connect(db_path) as conn:
+        return int(conn.execute(f"SELECT COUNT(*) FROM {table}").fetchone()[0])
+
+
+class TestGenerateSQLiteIndex:
+    """Test building the SQLite catalog."""
+
+    def test_indexes_adrs_and_relationships(self, tmp_path, write_adrs):
+        adr_dir = tmp_path / "docs" / "adr"
+        db_path = tmp_path / "catalog.db"
+        write_adrs(adr_dir, 3, **ADR_FIELDS)
+
+        stats = generate_sqlite_index(adr_dir, db_path, validate=False)
+
+        assert stats["indexed"] == 3
+        assert stats["errors"] == []
+        assert _count(db_path, "adrs") == 3
+        assert _count(db_path, "adr_tags") == 6
+        assert _count(db_path, "adr_deciders") == 3
+        assert _count(db_path, "adr_links") == 2
+
+    def test_rebuild_replaces_previous_rows(self, tmp_path, write_adrs):
+        adr_dir = tmp_path / "docs" / "adr"
+        db_path = tmp_path / "catalog.db"
+        write_adrs(adr_dir, 3, **ADR_FIELDS)
+        generate_sqlite_index(adr_dir, db_path, validate=False)
+
+        (adr_dir / "ADR-0003-decision.md").unlink()
+        (adr_dir / "ADR-0004-broken.md").write_text("no front-matter")
+        stats = generate_sqlite_index(adr_dir, db_path, validate=False)
+
+        assert stats["indexed"] == 2
+        assert len(stats["errors"]) == 1
+        assert _count(db_path, "adrs") == 2
+        assert _count(db_path, "adr_tags") == 4
+
+
+class TestQueryADRs:
+    """Test filtered catalog queries."""
+
+    @pytest.fixture
+    def db_path(self, tmp_path, write_adrs) -> Path:
+        adr_dir = tmp_path / "docs" / "adr"
+        db_path = tmp_path / "catalog.db"
+        write_adrs(adr_dir, 3, **ADR_FIELDS)
+        generate_sqlite_index(adr_dir, db_path, validate=False)
+        return db_path
+
+    @staticmethod
+    def _query(db_path: Path, **filters) -> list[str]:
+        index = ADRSQLiteIndex(db_path)
+        index.connect()
+        try:
+            return [row["id"] for row in index.query_adrs(**filters)]
+        finally:
+            index.disconnect()
+
+    def test_multiple_matching_tags_return_each_adr_once(self, db_path):
+        ids = self._query(db_path, tags=["backend", "data"], deciders="alice")
+
+        assert ids == ["ADR-0001", "ADR-0002", "ADR-0003"]
+
+    def test_filters_combine_with_limit(self, db_path):
+        ids = self._query(db_path, status="accepted", deciders=["alice"], limit=2)
+
+        assert ids == ["ADR-0001", "ADR-0002"]
+
+    def test_unmatched_filter_returns_nothing(self, db_path):
+        assert self._query(db_path, tags="frontend") == []
+
+
+class TestFullTextSearch:
+    """Test the FTS5 table stays in sync with the adrs table."""
+
+    @pytest.fixture
+    def index(self, tmp_path, write_adrs):
+        adr_dir = tmp_path / "docs" / "adr"
+        db_path = tmp_path / "catalog.db"
+        write_adrs(adr_dir, 3, **ADR_FIELDS)
+        with open(adr_dir / "ADR-0002-decision.md", "a") as f:
+            f.write("\nRedis holds sessions.")
+        with open(adr_dir / "ADR-0003-decision.md", "a") as f:
+            f.write("\nRedis caching, with Redis as the queue.")
+
+        # Rebuilding used to leave adr_fts inconsistent with adrs
+        generate_sqlite_index(adr_dir, db_path, validate=False)
+        generate_sqlite_index(adr_dir, db_path, validate=False)
+
+        index = ADRSQLiteIndex(db_path)
+        index.connect()
+        yield index
+        index.disconnect()
+
+    @staticmethod
+    def _search(index: ADRSQLiteIndex, text: str) -> list[str]:
+        return [row["id"] for row in index.query_adrs(search_text=text)]
+
+    def test_rebuilt_index_ranks_matches_by_relevance(self, index):
+        assert self._search(index, "redis") == ["ADR-0003", "ADR-0002"]
+        assert index.connection is not None
+        index.connection.execute(
+            "INSERT INTO adr_fts(adr_fts, rank) VALUES ('integrity-check', 1)"
+        )
+
+    def test_reindexed_adr_replaces_searchable_text(self, index):
+        adr = parse_adr_file(
+            Path(index.query_adrs(search_text="sessions")[0]["file_path"])
+        )
+        adr.content = "Decision number 2.\nMemcached holds sessions."
+
+        index.index_adr(adr)
+
+        assert self._search(index, "redis") == ["ADR-0003"]
+        assert self._search(index, "memcached") == ["ADR-0002"]
+
+
+class TestQueryPlans:
+    """Pin the indexes SQLite picks for each filter shape."""
+
+    @pytest.mark.parametrize(
+        ("filters", "expected_indexes"),
+        [
+            ({"status": "accepted"}, ["idx_adrs_status"]),
+            ({"tags": ["backend", "data"]}, ["idx_adr_tags_tag"]),
+            ({"deciders": "alice"}, ["COVERING INDEX idx_adr_deciders_decider"]),
+            (
+                {"status": ["accepted", "proposed"], "tags": "data", "limit": 5},
+                ["idx_adrs_status", "idx_adr_tags_tag"],
+            ),
+        ],
+    )
+    def test_filters_use_indexes(self, tmp_path, filters, expected_indexes):
+        index = ADRSQLiteIndex(tmp_path / "catalog.db")
+        index.connect()
+        try:
+            query, params = index._build_query(
+                filters.get("status"),
+                filters.get("tags"),
+                filters.get("deciders"),
+                None,
+                filters.get("limit"),
+            )
+            assert index.connection is not None
+            plan = [
+                row[3]
+                for row in index.connection.execute(
+                    "EXPLAIN QUERY PLAN " + query, params
+                )
+            ]
+        finally:
+            index.disconnect()
+
+        # A full scan of any table means an index stopped being chosen
+        assert not [step for step in plan if step.startswith("SCAN")], plan
+        for expected in expected_indexes:
+            assert any(expected in step for step in plan), plan
@@ -1,9 +1,9 @@
 """Tests for frontmatter writing in the ADR supersede workflow.
 
-Covers both insertion sites (`_update_old_adr_status` writes `superseded_by`,
-`_update_new_adr_relationships` writes `supersedes`) and both branches at each
-site: field already present (the `re.sub` path) and field absent (the
-previously corrupting `else` path).
+Covers both branches of `_update_old_adr_status` writing `superseded_by`:
+field already present (the `re.sub` path) and field absent (the previously
+corrupting `else` path). Body lines that look like front-matter fields are left
+untouched. The new ADR gets its `supersedes` link when it is created.
 """
 
 import re
@@ -13,7 +13,8 @@ from typing import Any
 import yaml
 
 from adr_kit.core.parse import parse_adr_file
-from adr_kit.decision.workflows.supersede import SupersedeWorkflow
+from adr_kit.decision.workflows.creation import CreationInput
+from adr_kit.decision.workflows.supersede import SupersedeInput, SupersedeWorkflow
 
 # Last frontmatter field is followed directly by the closing fence. This is the
 # shape adr-kit itself writes, and the one that used to corrupt.
@@ -29,36 +30,18 @@ status: accepted
 Testing frontmatter integrity.
 """
 
-NEW_NORMAL_SHAPE = """---
-id: ADR-0002
-title: Use PostgreSQL for primary storage
-date: 2026-07-16
-status: proposed
----
-
-## Context
-
-Testing frontmatter integrity.
-"""
-
 # A blank line before the closing fence used to mask the bug, because the slice
 # then ended on a newline by accident. These shapes pass even against unfixed
 # code — they document the masking condition.
 OLD_BLANK_LINE_SHAPE = OLD_NORMAL_SHAPE.replace(
     "status: accepted\n---", "status: accepted\n\n---"
 )
-NEW_BLANK_LINE_SHAPE = NEW_NORMAL_SHAPE.replace(
-    "status: proposed\n---", "status: proposed\n\n---"
-)
 
 # Field already present: exercises the re.sub replacement branch instead of the
 # insertion branch.
 OLD_WITH_FIELD_SHAPE = OLD_NORMAL_SHAPE.replace(
     "status: accepted\n---", 'status: accepted\nsuperseded_by: ["ADR-0009"]\n---'
 )
-NEW_WITH_FIELD_SHAPE = NEW_NORMAL_SHAPE.replace(
-    "status: proposed\n---", "status: proposed\nsupersedes: []\n---"
-)
 
 # A trailing space after the closing fence dashes still parses (the parser's
 # fence regex is `---\s*\n`) but makes `content.find("\n---\n")` return -1 —
@@ -66,9 +49,6 @@ NEW_WITH_FIELD_SHAPE = NEW_NORMAL_SHAPE.replace(
 OLD_TRAILING_SPACE_FENCE = OLD_NORMAL_SHAPE.replace(
     "status: accepted\n---\n", "status: accepted\n--- \n"
 )
-NEW_TRAILING_SPACE_FENCE = NEW_NORMAL_SHAPE.replace(
-    "status: proposed\n---\n", "status: proposed\n--- \n"
-)
 
 
 def _write_adr(adr_dir: Path, name: str, content: str) -> Path:
@@ -86,7 +66,7 @@ def _frontmatter_of(file_path: Path) -> Any:
 
 
 def _supersede_old(adr_dir: Path, file_path: Path) -> None:
-    """Run insertion site 1: mark the old ADR superseded by ADR-0002."""
+    """Mark the old ADR superseded by ADR-0002."""
     adr = parse_adr_file(file_path)
     workflow = SupersedeWorkflow(adr_dir=adr_dir)
     workflow._update_old_adr_status(
@@ -97,13 +77,7 @@ def _supersede_old(adr_dir: Path, file_path: Path) -> None:
     )
 
 
-def _supersede_new(adr_dir: Path) -> None:
-    """Run insertion site 2: record that ADR-0002 supersedes ADR-0001."""
-    workflow = SupersedeWorkflow(adr_dir=adr_dir)
-    workflow._update_new_adr_relationships(new_adr_id="ADR-0002", old_adr_id="ADR-0001")
-
-
-# --- Site 1: _update_old_adr_status writes superseded_by -----------------
+# --- Old ADR: _update_old_adr_status writes superseded_by ----------------
 
 
 def test_old_adr_field_absent_normal_shape_produces_valid_yaml(
@@ -170,63 +144,41 @@ def test_old_adr_without_closing_fence_match_skips_insertion(
     )
 
 
-# --- Site 2: _update_new_adr_relationships writes supersedes -------------
-
-
-def test_new_adr_field_absent_normal_shape_produces_valid_yaml(
-    tmp_path: Path,
-) -> None:
-    file_path = _write_adr(tmp_path, "ADR-0002-use-postgresql.md", NEW_NORMAL_SHAPE)
-
-    _supersede_new(tmp_path)
-
-    # Against the unfixed writer this raises: the supersedes line was welded
-    # onto the status value, producing "status: proposedsupersedes: ...".
-    parsed = _frontmatter_of(file_path)
-    assert parsed["supersedes"] == ["ADR-0001"]
-    assert parsed["status"] == "proposed"
-    assert parsed["title"] == "Use PostgreSQL for primary storage"
-
-
-def test_new_adr_reparses_through_normal_parse_path(tmp_path: Path) -> None:
-    file_path = _write_adr(tmp_path, "ADR-0002-use-postgresql.md", NEW_NORMAL_SHAPE)
-
-    _supersede_new(tmp_path)
-
-    reparsed = parse_adr_file(file_path)
-    assert reparsed.front_matter.supersedes == ["ADR-0001"]
-    assert reparsed.id == "ADR-0002"
-
-
-def test_new_adr_field_present_replaces_in_place(tmp_path: Path) -> None:
-    file_path = _write_adr(tmp_path, "ADR-0002-use-postgresql.md", NEW_WITH_FIELD_SHAPE)
-
-    _supersede_new(tmp_path)
-
-    parsed = _frontmatter_of(file_path)
-    assert parsed["supersedes"] == ["ADR-0001"]
-    assert parsed["status"] == "proposed"
+def test_old_adr_body_lines_are_left_untouched(tmp_path: Path) -> None:
+    body = "\n```yaml\nstatus: draft\nsuperseded_by: []\n```\n"
+    file_path = _write_adr(tmp_path, "ADR-0001-use-mysql.md", OLD_NORMAL_SHAPE + body)
 
+    _supersede_old(tmp_path, file_path)
 
-def test_new_adr_blank_line_shape_produces_valid_yaml(tmp_path: Path) -> None:
-    file_path = _write_adr(tmp_path, "ADR-0002-use-postgresql.md", NEW_BLANK_LINE_SHAPE)
+    raw = file_path.read_text(encoding="utf-8")
+    assert raw.endswith("## Context\n\nTesting frontmatter integrity.\n" + body)
+    assert _frontmatter_of(file_path)["superseded_by"] == ["ADR-0002"]
 
-    _supersede_new(tmp_path)
 
-    parsed = _frontmatter_of(file_path)
-    assert parsed["supersedes"] == ["ADR-0001"]
-    assert parsed["status"] == "proposed"
+# --- New ADR: supersedes is written at creation --------------------------
 
 
-def test_new_adr_without_closing_fence_match_skips_insertion(
-    tmp_path: Path,
-) -> None:
-    file_path = _write_adr(
-        tmp_path, "ADR-0002-use-postgresql.md", NEW_TRAILING_SPACE_FENCE
+def test_new_adr_is_created_with_supersedes(tmp_path: Path) -> None:
+    old_file = _write_adr(tmp_path, "ADR-0001-use-mysql.md", OLD_NORMAL_SHAPE)
+    proposal = CreationInput(
+        title="Use PostgreSQL for primary storage",
+        context="MySQL licensing no longer fits our distribution model.",
+        decision="Use PostgreSQL for all new services.",
+        consequences="Existing data has to be migrated.",
+        skip_quality_gate=True,
     )
 
-    _supersede_new(tmp_path)
+    result = SupersedeWorkflow(adr_dir=tmp_path).execute(
+        input_data=SupersedeInput(
+            old_adr_id="ADR-0001",
+            new_proposal=proposal,
+            supersede_reason="MySQL licensing limitations",
+        )
+    )
 
-    # The guard must skip the insertion and leave the file byte-identical.
-    raw = file_path.read_text(encoding="utf-8")
-    assert raw == NEW_TRAILING_SPACE_FENCE
+    assert result.success, result.errors
+    (new_file,) = tmp_path.glob("ADR-0002-*.md")
+    assert _frontmatter_of(new_file)["supersedes"] == ["ADR-0001"]
+    assert _frontmatter_of(old_file)["superseded_by"] == ["ADR-0002"]
+    # The caller's proposal is left as it was
+    assert proposal.supersedes is None